@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark structured-output validation with and without the schema registry.
+
+Usage:
+    python scripts/benchmark_schema_validation.py [--iterations N]
+"""
+
+import argparse
+import json
+import time
+from typing import Callable, List, Optional
+
+import jsonschema
+from pydantic import BaseModel
+
+from llmaestro.llm.responses import ResponseFormat
+from llmaestro.llm.schema_utils import schema_registry
+
+
+class Address(BaseModel):
+    street: str
+    city: str
+    postcode: Optional[str] = None
+
+
+class Person(BaseModel):
+    name: str
+    age: int
+    email: Optional[str] = None
+    addresses: List[Address] = []
+    tags: List[str] = []
+
+
+RESPONSE = json.dumps(
+    {
+        "name": "Ada Lovelace",
+        "age": 36,
+        "email": "ada@example.com",
+        "addresses": [{"street": "12 St James's Square", "city": "London"}],
+        "tags": ["math", "computing"],
+    }
+)
+
+
+def uncached_validation() -> None:
+    """The previous hot path: regenerate, serialize and recompile the schema per response."""
+    data = json.loads(RESPONSE)
+    schema = json.loads(json.dumps(Person.model_json_schema()))
+    jsonschema.Draft7Validator(schema).validate(data)
+
+
+def registry_validation() -> None:
+    """Validate against the cached schema entry."""
+    schema_registry.get(Person).validate(json.loads(RESPONSE))
+
+
+response_format = ResponseFormat.from_pydantic_model(Person)
+
+
+def response_format_validation() -> None:
+    """Validate through ResponseFormat.validate_response, which uses the registry."""
+    if not response_format.validate_response(RESPONSE).is_valid:
+        raise AssertionError("benchmark response should be valid")
+
+
+def run(name: str, func: Callable[[], None], iterations: int) -> float:
+    func()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    rate = iterations / elapsed
+    print(f"{name:<32} {rate:>12,.0f} validations/sec")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    baseline = run("uncached (per-call compile)", uncached_validation, args.iterations)
+    cached = run("schema registry", registry_validation, args.iterations)
+    run("ResponseFormat.validate_response", response_format_validation, args.iterations)
+    print(f"speedup: {cached / baseline:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
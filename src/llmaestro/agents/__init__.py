@@ -1,7 +1,19 @@
 """Agent module for LLM orchestration."""
 
-from llmaestro.agents.agent_pool import AgentPool, RuntimeAgent
-from llmaestro.agents.models import Agent, AgentMetrics, AgentState
+from llmaestro.agents.agent_pool import AgentPool, PoolSaturatedError, RuntimeAgent
+from llmaestro.agents.budget import BudgetExceededError, BudgetMode, RunBudget, use_budget
+from llmaestro.agents.latency import LatencyTracker
+from llmaestro.agents.models import (
+    Agent,
+    AgentMetrics,
+    AgentState,
+    AgentWarmupReport,
+    HedgingMetrics,
+    HedgingPolicy,
+    RoutingPolicy,
+    ScalingMetrics,
+    ScalingPolicy,
+)
 
 __all__ = [
     "Agent",
@@ -9,4 +21,16 @@ __all__ = [
     "RuntimeAgent",
     "AgentState",
     "AgentMetrics",
+    "AgentWarmupReport",
+    "HedgingPolicy",
+    "HedgingMetrics",
+    "RoutingPolicy",
+    "ScalingPolicy",
+    "ScalingMetrics",
+    "PoolSaturatedError",
+    "LatencyTracker",
+    "RunBudget",
+    "BudgetMode",
+    "BudgetExceededError",
+    "use_budget",
 ]
@@ -1,19 +1,45 @@
 """Agent pool for managing multiple LLM agents for prompt processing."""
 import asyncio
+import logging
+import time
 import uuid
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, Optional, Protocol, Set, TypeVar
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Protocol, Sequence, Set, Tuple, TypeVar
 
-from llmaestro.agents.models import Agent, AgentMetrics, AgentState
+from llmaestro.agents.budget import BudgetExceededError, BudgetMode, BudgetReservation, RunBudget, get_active_budget
+from llmaestro.agents.latency import LatencyTracker
+from llmaestro.agents.models import (
+    Agent,
+    AgentMetrics,
+    AgentState,
+    HedgingMetrics,
+    HedgingPolicy,
+    RoutingPolicy,
+    ScalingMetrics,
+    ScalingPolicy,
+)
 from llmaestro.llm.capabilities import LLMCapabilities
+from llmaestro.llm.interfaces.base import output_token_limit
+from llmaestro.llm.interfaces.tokenizers import BaseTokenizer, SimpleWordTokenizer, tokenizer_registry
 from llmaestro.llm.llm_registry import LLMRegistry
-from llmaestro.llm.models import LLMInstance
+from llmaestro.llm.models import LLMInstance, LLMState
 from llmaestro.prompts.base import BasePrompt
+from llmaestro.prompts.tools import ExecutionMode, set_tool_executor
 from llmaestro.core.models import LLMResponse
 
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
+# Generation speed assumed for latency estimates when a model has no observed or typical speed
+_NOMINAL_TOKENS_PER_SECOND = 50.0
+
+
+class PoolSaturatedError(RuntimeError):
+    """Raised when a request is rejected because the pool's queue is full or the wait timed out."""
+
 
 class JsonOutputTransform(Protocol):
     """Protocol for JSON output transformers."""
@@ -84,6 +110,29 @@ class RuntimeAgent:
             if self.agent.state != AgentState.ERROR:
                 self.agent.update_state(AgentState.IDLE)
 
+    async def stream_prompt(self, prompt: BasePrompt) -> AsyncIterator[LLMResponse]:
+        """Stream a prompt's response from this agent's LLM in partial chunks.
+
+        Args:
+            prompt: The prompt to process
+
+        Yields:
+            Partial LLM responses as they are generated
+        """
+        self.agent.update_state(AgentState.BUSY)
+
+        try:
+            async for chunk in self.llm_instance.interface.stream(prompt):
+                yield chunk
+
+        except Exception as e:
+            self.agent.update_state(AgentState.ERROR)
+            raise e
+
+        finally:
+            if self.agent.state != AgentState.ERROR:
+                self.agent.update_state(AgentState.IDLE)
+
 
 class AgentPool:
     """Pool of agents that can be reused for prompt processing.
@@ -97,6 +146,9 @@ class AgentPool:
         llm_registry: LLMRegistry,
         max_agents: int = 10,
         default_model_name: Optional[str] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        routing_policy: Optional[RoutingPolicy] = None,
+        scaling_policy: Optional[ScalingPolicy] = None,
     ):
         """Initialize the agent pool.
 
@@ -104,17 +156,43 @@ class AgentPool:
             llm_registry: LLM registry instance for managing models and credentials
             max_agents: Maximum number of concurrent agents
             default_model_name: Optional default model name to use when no specific capabilities are required
+            hedging_policy: Optional policy for hedging slow requests with a duplicate request
+            routing_policy: Optional policy for choosing the cheapest/fastest model that fits a request
+            scaling_policy: Optional policy for bounded request queueing and agent autoscaling
         """
         self._llm_registry = llm_registry
         self._max_agents = max_agents
         self._active_agents: Dict[str, RuntimeAgent] = {}
         self.executor = ThreadPoolExecutor(max_workers=max_agents)
+        # Thread-mode tools run on the first pool's executor unless one is configured explicitly
+        set_tool_executor(ExecutionMode.THREAD, self.executor, replace=False)
         self.prompts: Dict[str, asyncio.Task[Any]] = {}
         self.loop = asyncio.get_event_loop()
         self.default_model_name = default_model_name
+        self.hedging_policy = hedging_policy
+        self.routing_policy = routing_policy
+        self.hedging_metrics = HedgingMetrics()
+        self.latency_tracker = LatencyTracker()
+        self.scaling_policy = scaling_policy
+        self.scaling_metrics = ScalingMetrics()
+        self._queues: Dict[str, Deque[asyncio.Future[RuntimeAgent]]] = {}
+        self._reservations: Dict[str, int] = {}
+        self._idle_since: Dict[str, float] = {}
+        self._pending_creations = 0
+        self._creation_waiters: List[asyncio.Future[None]] = []
+        self._autoscaler_task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def max_concurrency(self) -> int:
+        """Number of prompts the pool can run at once across all agents."""
+        per_agent = self.scaling_policy.max_concurrent_per_agent if self.scaling_policy else 1
+        return self._max_agents * per_agent
 
     async def get_agent(
-        self, required_capabilities: Optional[Set[str]] = None, description: Optional[str] = None
+        self,
+        required_capabilities: Optional[Set[str]] = None,
+        description: Optional[str] = None,
+        prompt: Optional[BasePrompt] = None,
     ) -> RuntimeAgent:
         """Get an agent suitable for prompt processing.
 
@@ -122,6 +200,8 @@ class AgentPool:
             required_capabilities: Optional set of capability flags from LLMCapabilities.VALID_CAPABILITY_FLAGS
                                 that the agent must support.
             description: Optional description of the agent's purpose.
+            prompt: Optional prompt the agent will process. Used by cost-aware routing to
+                    estimate input tokens and check context-window fit.
 
         Returns:
             A RuntimeAgent instance capable of processing prompts
@@ -129,6 +209,100 @@ class AgentPool:
         Raises:
             ValueError: If no suitable agent is available or pool is full
         """
+        model_name = self._select_model_name(required_capabilities, prompt)
+        return await self._get_agent_for_model(model_name, required_capabilities, description)
+
+    async def _get_agent_for_model(
+        self,
+        model_name: str,
+        required_capabilities: Optional[Set[str]] = None,
+        description: Optional[str] = None,
+    ) -> RuntimeAgent:
+        """Create an agent for a model, or reuse the least busy one once the pool is full."""
+        while True:
+            # Create a new agent if we haven't reached the limit, counting agents still being created
+            if len(self._active_agents) + self._pending_creations < self._max_agents:
+                return await self._create_counted_agent(model_name, description)
+
+            # Otherwise, find the least busy agent with required capabilities
+            compatible_agents = [agent for agent in self._active_agents.values() if agent.model_name == model_name]
+            if compatible_agents:
+                return min(compatible_agents, key=lambda a: len(a.active_prompts))
+            if not self._pending_creations:
+                raise ValueError(f"No agents available supporting capabilities: {required_capabilities}")
+
+            # The pool is full of agents still being created; check again once one is ready
+            waiter: asyncio.Future[None] = self.loop.create_future()
+            self._creation_waiters.append(waiter)
+            await waiter
+
+    async def _create_counted_agent(
+        self, model_name: str, description: Optional[str] = None, evicted: Optional[RuntimeAgent] = None
+    ) -> RuntimeAgent:
+        """Create an agent and add it to the pool, counting it in ``_pending_creations`` meanwhile.
+
+        Callers check capacity before calling, with no await in between. Requests waiting
+        for a creation to finish are woken whether it succeeds or fails.
+
+        Args:
+            model_name: Model the agent should use
+            description: Optional description of the agent's purpose
+            evicted: Agent removed from the pool to make room, shut down first
+        """
+        self._pending_creations += 1
+        try:
+            if evicted is not None:
+                await self._shutdown_agent(evicted)
+            agent = await self._create_agent(model_name, description)
+            self._active_agents[agent.agent.id] = agent
+            return agent
+        finally:
+            self._pending_creations -= 1
+            waiters, self._creation_waiters = self._creation_waiters, []
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def add_agent(self, model_name: str, description: Optional[str] = None) -> RuntimeAgent:
+        """Create an agent for a specific model and add it to the pool.
+
+        Args:
+            model_name: Name of the registered model the agent should use
+            description: Optional description of the agent's purpose
+
+        Returns:
+            The new RuntimeAgent
+
+        Raises:
+            ValueError: If the pool is full or the model is not registered
+        """
+        if len(self._active_agents) + self._pending_creations >= self._max_agents:
+            raise ValueError(f"Agent pool is full ({self._max_agents} agents)")
+
+        return await self._create_counted_agent(model_name, description)
+
+    async def remove_agent(self, agent_id: str) -> None:
+        """Remove an agent from the pool and shut down its LLM instance.
+
+        Args:
+            agent_id: ID of the agent to remove
+
+        Raises:
+            ValueError: If the agent is not in the pool
+        """
+        agent = self._active_agents.pop(agent_id, None)
+        if agent is None:
+            raise ValueError(f"Agent {agent_id} is not in the pool")
+        await self._shutdown_agent(agent)
+
+    def _select_model_name(
+        self, required_capabilities: Optional[Set[str]] = None, prompt: Optional[BasePrompt] = None
+    ) -> str:
+        """Choose the model that should serve a request.
+
+        Raises:
+            ValueError: If no registered model can serve the request
+        """
         # Get model state from registry
         model_states = self._llm_registry.model_states
         if not model_states:
@@ -140,7 +314,16 @@ class AgentPool:
 
         # Find a suitable model based on capabilities
         model_name = None
-        if required_capabilities:
+        if self.routing_policy is not None:
+            input_tokens = self.estimate_input_tokens(prompt) if prompt is not None else 0
+            ranked = self.rank_models(required_capabilities, input_tokens)
+            if not ranked:
+                raise ValueError(
+                    f"No models found supporting required capabilities {required_capabilities or set()} "
+                    f"with room for ~{input_tokens} input tokens"
+                )
+            model_name = ranked[0][0]
+        elif required_capabilities:
             for name, state in model_states.items():
                 caps = state.profile.capabilities
                 if all(getattr(caps, cap, False) for cap in required_capabilities):
@@ -157,19 +340,134 @@ class AgentPool:
                 # Otherwise use first available model
                 model_name = next(iter(model_states.keys()))
 
-        # Create a new agent if we haven't reached the limit
-        if len(self._active_agents) < self._max_agents:
-            agent = await self._create_agent(model_name, description)
-            self._active_agents[agent.agent.id] = agent
-            return agent
+        return model_name
+
+    def estimate_input_tokens(self, prompt: BasePrompt, model_name: Optional[str] = None) -> int:
+        """Estimate the number of input tokens a prompt will use.
 
-        # Otherwise, find the least busy agent with required capabilities
-        compatible_agents = [agent for agent in self._active_agents.values() if agent.model_name == model_name]
+        The prompt is rendered when possible; prompts that need variables are estimated
+        from their raw templates. Tokens are counted with the model's shared tokenizer
+        from ``tokenizer_registry``, falling back to a word-based approximation.
+
+        Args:
+            prompt: The prompt to estimate
+            model_name: Optional model whose tokenizer should be preferred
 
-        if not compatible_agents:
-            raise ValueError(f"No agents available supporting capabilities: {required_capabilities}")
+        Returns:
+            Estimated input token count
+        """
+        try:
+            system_prompt, user_prompt, _, _ = prompt.render()
+        except ValueError:
+            system_prompt, user_prompt = prompt.system_prompt, prompt.user_prompt
+
+        messages = [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
+        return self.get_tokenizer(model_name).count_messages(messages)
+
+    def estimate_latency(self, prompt: BasePrompt) -> float:
+        """Estimate how long a prompt will take to execute, for scheduling decisions.
+
+        Uses the observed mean latency of the model the prompt would be routed to, or
+        the model's typical speed. Without either, the estimate is token-based: input
+        plus expected output tokens at a nominal generation speed.
+
+        Args:
+            prompt: The prompt to estimate
+
+        Returns:
+            Estimated latency in seconds
+        """
+        try:
+            model_name = self._select_model_name(prompt=prompt)
+        except ValueError:
+            return self.estimate_input_tokens(prompt) / _NOMINAL_TOKENS_PER_SECOND
+
+        state = self._llm_registry.model_states[model_name]
+        output_tokens = state.runtime_config.max_tokens
+        latency = self._expected_latency(model_name, state.profile.capabilities, output_tokens)
+        if latency is not None:
+            return latency
+        return (self.estimate_input_tokens(prompt, model_name) + output_tokens) / _NOMINAL_TOKENS_PER_SECOND
+
+    def get_model_state(self, prompt: Optional[BasePrompt] = None) -> LLMState:
+        """Get the registry state of the model a prompt would be routed to.
+
+        Raises:
+            ValueError: If no registered model can serve the prompt
+        """
+        return self._llm_registry.model_states[self._select_model_name(prompt=prompt)]
 
-        return min(compatible_agents, key=lambda a: len(a.active_prompts))
+    def get_tokenizer(self, model_name: Optional[str] = None) -> BaseTokenizer:
+        """Get the shared tokenizer of a model, or of the pool's default model if none is given."""
+        if model_name is None:
+            try:
+                model_name = self._select_model_name()
+            except ValueError:
+                return SimpleWordTokenizer("default")
+        state = self._llm_registry.model_states.get(model_name)
+        return tokenizer_registry.get(model_name, state.model_family if state is not None else None)
+
+    def rank_models(
+        self, required_capabilities: Optional[Set[str]] = None, input_tokens: int = 0
+    ) -> List[Tuple[str, float]]:
+        """Rank registered models for a request according to the routing policy.
+
+        Models that lack a required capability, or whose context window cannot hold the
+        estimated input plus expected output, are excluded. The remaining models are scored
+        by ``cost_weight * normalized_cost + (1 - cost_weight) * normalized_latency``.
+
+        Args:
+            required_capabilities: Capability flags the model must support
+            input_tokens: Estimated input tokens for the request
+
+        Returns:
+            List of (model_name, score) tuples, best (lowest score) first
+        """
+        policy = self.routing_policy or RoutingPolicy()
+        candidates: List[Tuple[str, float, Optional[float]]] = []
+
+        for name, state in self._llm_registry.model_states.items():
+            caps = state.profile.capabilities
+            if required_capabilities and not all(getattr(caps, cap, False) for cap in required_capabilities):
+                continue
+
+            output_tokens = policy.expected_output_tokens or state.runtime_config.max_tokens
+            if input_tokens + output_tokens > caps.max_context_window:
+                continue
+
+            cost = (
+                input_tokens * caps.input_cost_per_1k_tokens + output_tokens * caps.output_cost_per_1k_tokens
+            ) / 1000
+            candidates.append((name, cost, self._expected_latency(name, caps, output_tokens)))
+
+        if not candidates:
+            return []
+
+        max_cost = max(cost for _, cost, _ in candidates)
+        known_latencies = [latency for _, _, latency in candidates if latency is not None]
+        max_latency = max(known_latencies) if known_latencies else 0.0
+
+        ranked = []
+        for name, cost, latency in candidates:
+            cost_score = cost / max_cost if max_cost > 0 else 0.0
+            if max_latency > 0:
+                # Models without any latency information are treated as the slowest candidate
+                latency_score = latency / max_latency if latency is not None else 1.0
+            else:
+                latency_score = 0.0
+            score = policy.cost_weight * cost_score + (1 - policy.cost_weight) * latency_score
+            ranked.append((name, score))
+
+        return sorted(ranked, key=lambda item: item[1])
+
+    def _expected_latency(self, model_name: str, caps: LLMCapabilities, output_tokens: int) -> Optional[float]:
+        """Estimate request latency from observed samples or the model's typical speed."""
+        observed = self.latency_tracker.mean(model_name)
+        if observed is not None:
+            return observed
+        if caps.typical_speed:
+            return output_tokens / caps.typical_speed
+        return None
 
     async def _create_agent(self, model_name: str, description: Optional[str] = None) -> RuntimeAgent:
         """Create a new agent for prompt processing.
@@ -183,13 +481,17 @@ class AgentPool:
         """
         # Create LLM instance using registry
         llm_instance = await self._llm_registry.create_instance(model_name)
-        return RuntimeAgent(model_name=model_name, llm_instance=llm_instance, description=description)
+        agent = RuntimeAgent(model_name=model_name, llm_instance=llm_instance, description=description)
+        self._idle_since[agent.agent.id] = time.monotonic()
+        return agent
 
     async def execute_prompt(
         self,
         prompt: BasePrompt,
         agent_type: Optional[str] = None,
         required_capabilities: Optional[Set[str]] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        budget: Optional[RunBudget] = None,
     ) -> LLMResponse:
         """Execute a prompt using an appropriate agent.
 
@@ -199,46 +501,588 @@ class AgentPool:
         3. Response retrieval
         4. Resource cleanup
 
+        If a scaling policy is active, the request waits in a bounded per-model queue
+        until an agent has a free slot, and the pool grows or shrinks with demand.
+
+        If a hedging policy is active and the primary request is still running after the
+        hedge delay, a duplicate request is sent to a second agent. The first successful
+        response wins and the other request is cancelled.
+
+        If a run budget applies (passed explicitly or made active with ``use_budget``),
+        the request reserves its estimated tokens and cost before it is sent and is
+        reconciled with its actual usage afterwards. Requests that do not fit are
+        rejected, or degraded to a cheaper model or smaller ``max_tokens`` in
+        ``BudgetMode.DEGRADE``. Budgeted requests are never hedged, so spend stays bounded.
+
         Args:
             prompt: The prompt to execute
             agent_type: Optional type of agent to use
             required_capabilities: Optional set of required capability flags from LLMCapabilities.
                                  Must be valid flags from LLMCapabilities.VALID_CAPABILITY_FLAGS.
+            hedging_policy: Optional hedging policy for this call, overriding the pool's policy
+            budget: Optional run budget for this call, overriding the active budget
 
         Returns:
             The LLM response from processing the prompt
 
         Raises:
             ValueError: If no suitable agent is available or if invalid capability flags are provided
+            PoolSaturatedError: If a scaling policy is active and the request queue is full or the wait times out
+            BudgetExceededError: If the request does not fit in the run budget
             RuntimeError: If prompt execution fails
         """
         # Validate capability requirements if provided
         if required_capabilities:
             LLMCapabilities.validate_capability_flags(required_capabilities)
 
-        # Get or create an agent
-        agent = await self.get_agent(required_capabilities)
+        budget = budget or get_active_budget()
+        reservation = self._reserve_budget(budget, prompt, required_capabilities) if budget is not None else None
+        try:
+            agent = await self._agent_for_request(prompt, agent_type, required_capabilities, reservation)
+            prompt_id = ""
+            try:
+                # Verify agent has required capabilities
+                if required_capabilities:
+                    missing_capabilities = {
+                        cap for cap in required_capabilities if not getattr(agent.agent.capabilities, cap)
+                    }
+                    if missing_capabilities:
+                        raise ValueError(f"Agent does not support required capabilities: {missing_capabilities}")
+
+                self.hedging_metrics.total_requests += 1
+                policy = hedging_policy or self.hedging_policy
+                if policy is not None and reservation is None:
+                    return await self._execute_hedged(prompt, agent, policy, required_capabilities)
+
+                with output_token_limit(reservation.max_output_tokens if reservation is not None else None):
+                    prompt_id, task = self._submit(agent, prompt)
+                response = await task
+            finally:
+                # The acquired slot is handed on however the request ends, even before a prompt was submitted
+                self._release(agent, prompt_id)
+        except BaseException:
+            if budget is not None and reservation is not None:
+                budget.release(reservation)
+            raise
+
+        if budget is not None and reservation is not None:
+            budget.reconcile(reservation, response.token_usage)
+        return response
+
+    async def stream_prompt(
+        self,
+        prompt: BasePrompt,
+        agent_type: Optional[str] = None,
+        required_capabilities: Optional[Set[str]] = None,
+        budget: Optional[RunBudget] = None,
+    ) -> AsyncIterator[LLMResponse]:
+        """Execute a prompt, yielding partial responses as the model generates them.
 
-        # Verify agent has required capabilities
+        Agents are selected as in ``execute_prompt``. Models without streaming support
+        yield their complete response as a single chunk. Hedging does not apply to
+        streamed requests. Run budgets apply as in ``execute_prompt``; the usage
+        reported by the last chunk that carries any is reconciled.
+
+        Args:
+            prompt: The prompt to execute
+            agent_type: Optional type of agent to use
+            required_capabilities: Optional set of required capability flags from LLMCapabilities
+            budget: Optional run budget for this call, overriding the active budget
+
+        Yields:
+            Partial LLM responses, in generation order
+
+        Raises:
+            ValueError: If no suitable agent is available or if invalid capability flags are provided
+            PoolSaturatedError: If a scaling policy is active and the request queue is full or the wait times out
+            BudgetExceededError: If the request does not fit in the run budget
+        """
         if required_capabilities:
-            missing_capabilities = {cap for cap in required_capabilities if not getattr(agent.agent.capabilities, cap)}
-            if missing_capabilities:
-                raise ValueError(f"Agent does not support required capabilities: {missing_capabilities}")
+            LLMCapabilities.validate_capability_flags(required_capabilities)
+
+        budget = budget or get_active_budget()
+        reservation = self._reserve_budget(budget, prompt, required_capabilities) if budget is not None else None
+        try:
+            agent = await self._agent_for_request(prompt, agent_type, required_capabilities, reservation)
+        except BaseException:
+            if budget is not None and reservation is not None:
+                budget.release(reservation)
+            raise
 
-        # Create and store the async task
+        # The consuming task occupies the agent's slot while the stream is open
         prompt_id = str(uuid.uuid4())
-        task = self.loop.create_task(agent.process_prompt(prompt))
+        task = asyncio.current_task()
+        if task is not None:
+            self.prompts[prompt_id] = task
+            agent.active_prompts[prompt_id] = task
+        usage = None
+        try:
+            with output_token_limit(reservation.max_output_tokens if reservation is not None else None):
+                if agent.agent.capabilities.supports_streaming:
+                    async for chunk in agent.stream_prompt(prompt):
+                        usage = chunk.token_usage or usage
+                        yield chunk
+                else:
+                    response = await self._timed_process(agent, prompt)
+                    usage = response.token_usage
+                    yield response
+        finally:
+            self._release(agent, prompt_id)
+            if budget is not None and reservation is not None:
+                if usage is None:
+                    budget.release(reservation)
+                else:
+                    budget.reconcile(reservation, usage)
+
+    async def _agent_for_request(
+        self,
+        prompt: BasePrompt,
+        agent_type: Optional[str] = None,
+        required_capabilities: Optional[Set[str]] = None,
+        reservation: Optional[BudgetReservation] = None,
+    ) -> RuntimeAgent:
+        """Get the agent that serves a request, on the budgeted model if there is a reservation."""
+        if self.scaling_policy is not None:
+            if reservation is not None:
+                return await self._acquire_agent(reservation.model_name, agent_type)
+            return await self._acquire_agent(self._select_model_name(required_capabilities, prompt), agent_type)
+        if reservation is not None:
+            return await self._get_agent_for_model(reservation.model_name, required_capabilities)
+        return await self.get_agent(required_capabilities, prompt=prompt)
+
+    def _reserve_budget(
+        self, budget: RunBudget, prompt: BasePrompt, required_capabilities: Optional[Set[str]] = None
+    ) -> BudgetReservation:
+        """Reserve a request's estimated tokens and cost, degrading it if the budget allows.
+
+        The request is estimated at its input tokens plus the model's full ``max_tokens``.
+        In ``BudgetMode.DEGRADE`` a request that does not fit moves to the most expensive
+        cheaper model that fits, and failing that to the first candidate model that can
+        still afford ``budget.min_output_tokens`` with a smaller ``max_tokens``.
+
+        Raises:
+            BudgetExceededError: If the request cannot be made to fit
+        """
+        model_name = self._select_model_name(required_capabilities, prompt)
+        model_states = self._llm_registry.model_states
+        input_tokens = self.estimate_input_tokens(prompt, model_name)
+
+        state = model_states[model_name]
+        reservation = budget.try_reserve(
+            model_name, input_tokens, state.runtime_config.max_tokens, state.profile.capabilities
+        )
+        if reservation is not None:
+            return reservation
+
+        if budget.mode is BudgetMode.DEGRADE:
+            # Candidates after the requested model, most expensive (least degraded) first
+            cheaper = self._cheaper_models(model_name, required_capabilities, input_tokens)
+            candidates = [model_name] + [name for name, _ in cheaper]
+            for name in candidates[1:]:
+                state = model_states[name]
+                reservation = budget.try_reserve(
+                    name, input_tokens, state.runtime_config.max_tokens, state.profile.capabilities, degraded=True
+                )
+                if reservation is not None:
+                    logger.info(f"Run budget degraded request from {model_name} to {name}")
+                    return reservation
+            for name in candidates:
+                state = model_states[name]
+                caps = state.profile.capabilities
+                max_output = min(budget.affordable_output_tokens(input_tokens, caps), state.runtime_config.max_tokens)
+                if max_output < budget.min_output_tokens:
+                    continue
+                reservation = budget.try_reserve(name, input_tokens, max_output, caps, degraded=True)
+                if reservation is not None:
+                    logger.info(f"Run budget degraded request to {name} with max_tokens={max_output}")
+                    return reservation
+
+        budget.reject()
+        raise BudgetExceededError(
+            f"Request for {model_name} (~{input_tokens} input tokens) exceeds the run budget "
+            f"(remaining tokens: {budget.remaining_tokens}, remaining cost: {budget.remaining_cost})"
+        )
+
+    def _cheaper_models(
+        self, model_name: str, required_capabilities: Optional[Set[str]], input_tokens: int
+    ) -> List[Tuple[str, float]]:
+        """List models cheaper than the given one that can serve a request, most expensive first."""
+        costs: Dict[str, float] = {}
+        for name, state in self._llm_registry.model_states.items():
+            caps = state.profile.capabilities
+            if required_capabilities and not all(getattr(caps, cap, False) for cap in required_capabilities):
+                continue
+            output_tokens = state.runtime_config.max_tokens
+            if name != model_name and input_tokens + output_tokens > caps.max_context_window:
+                continue
+            costs[name] = (
+                input_tokens * caps.input_cost_per_1k_tokens + output_tokens * caps.output_cost_per_1k_tokens
+            ) / 1000
+        reference = costs.get(model_name, float("inf"))
+        cheaper = [(name, cost) for name, cost in costs.items() if name != model_name and cost < reference]
+        return sorted(cheaper, key=lambda item: item[1], reverse=True)
+
+    def _submit(self, agent: RuntimeAgent, prompt: BasePrompt) -> Tuple[str, asyncio.Task[LLMResponse]]:
+        """Create and track the task that processes a prompt on an agent."""
+        prompt_id = str(uuid.uuid4())
+        task = self.loop.create_task(self._timed_process(agent, prompt))
         self.prompts[prompt_id] = task
         agent.active_prompts[prompt_id] = task
+        return prompt_id, task
+
+    def _release(self, agent: RuntimeAgent, prompt_id: str) -> None:
+        """Stop tracking a prompt task and hand the freed slot to a queued request."""
+        self.prompts.pop(prompt_id, None)
+        agent.active_prompts.pop(prompt_id, None)
+        if not agent.active_prompts:
+            self._idle_since[agent.agent.id] = time.monotonic()
+        if self.scaling_policy is not None:
+            self._dispatch_waiters(agent.model_name)
+
+    async def _timed_process(self, agent: RuntimeAgent, prompt: BasePrompt) -> LLMResponse:
+        """Process a prompt and record its latency for successful responses.
+
+        A cancelled request, typically a slow primary that lost to its hedge, records the
+        time it ran as a lower bound. Leaving those out would pull the hedge percentile
+        down the more requests are hedged, which in turn hedges more.
+        """
+        start_time = time.monotonic()
+        try:
+            result = await agent.process_prompt(prompt)
+        except asyncio.CancelledError:
+            self.latency_tracker.record(agent.model_name, time.monotonic() - start_time)
+            raise
+        if result.success:
+            self.latency_tracker.record(agent.model_name, time.monotonic() - start_time)
+        return result
+
+    async def _execute_hedged(
+        self,
+        prompt: BasePrompt,
+        primary: RuntimeAgent,
+        policy: HedgingPolicy,
+        required_capabilities: Optional[Set[str]] = None,
+    ) -> LLMResponse:
+        """Execute a prompt, sending a hedge request if the primary one is slow."""
+        primary_id, primary_task = self._submit(primary, prompt)
+        owners: Dict[asyncio.Task[LLMResponse], Tuple[RuntimeAgent, str]] = {primary_task: (primary, primary_id)}
 
         try:
-            return await task
+            delay = self._hedge_delay(primary.model_name, policy)
+            if delay is None:
+                return await primary_task
+
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if done:
+                return primary_task.result()
+
+            if not self._hedge_budget_available(policy):
+                self.hedging_metrics.hedges_skipped_budget += 1
+                return await primary_task
+
+            hedge_agent = await self._select_hedge_agent(primary, policy, required_capabilities)
+            if hedge_agent is None:
+                self.hedging_metrics.hedges_skipped_no_agent += 1
+                return await primary_task
+
+            hedge_id, hedge_task = self._submit(hedge_agent, prompt)
+            owners[hedge_task] = (hedge_agent, hedge_id)
+            self.hedging_metrics.hedges_fired += 1
+            logger.debug(f"Hedging prompt on agent {hedge_agent.agent.id} after {delay:.3f}s")
+
+            winner = await self._first_successful([primary_task, hedge_task])
+            if winner is hedge_task:
+                self.hedging_metrics.hedges_won += 1
+            return winner.result()
         finally:
-            # Cleanup
-            if prompt_id in self.prompts:
-                del self.prompts[prompt_id]
-            if prompt_id in agent.active_prompts:
-                del agent.active_prompts[prompt_id]
+            for task, (agent, prompt_id) in owners.items():
+                if not task.done():
+                    task.cancel()
+                self._release(agent, prompt_id)
+
+    def _hedge_delay(self, model_name: str, policy: HedgingPolicy) -> Optional[float]:
+        """Get the delay before hedging, or None if hedging is not possible yet."""
+        if policy.use_rolling_percentile and self.latency_tracker.count(model_name) >= policy.min_samples:
+            return self.latency_tracker.percentile(model_name, policy.percentile)
+        return policy.threshold
+
+    def _hedge_budget_available(self, policy: HedgingPolicy) -> bool:
+        """Check whether another hedge fits in the pool-wide hedge budget."""
+        allowed = policy.max_hedge_ratio * self.hedging_metrics.total_requests
+        return self.hedging_metrics.hedges_fired + 1 <= allowed
+
+    async def _select_hedge_agent(
+        self,
+        primary: RuntimeAgent,
+        policy: HedgingPolicy,
+        required_capabilities: Optional[Set[str]] = None,
+    ) -> Optional[RuntimeAgent]:
+        """Pick an agent other than the primary one to run the hedge request."""
+        model_name = policy.hedge_model_name or primary.model_name
+        state = self._llm_registry.model_states.get(model_name)
+        if state is None:
+            logger.warning(f"Hedge model {model_name} is not registered; skipping hedge")
+            return None
+        if required_capabilities and not all(
+            getattr(state.profile.capabilities, cap, False) for cap in required_capabilities
+        ):
+            return None
+
+        if self.scaling_policy is not None:
+            # Hedges take a free slot like any request, but never queue or overtake queued requests
+            queue = self._queues.get(model_name)
+            agent = None if queue else self._find_free_agent(model_name, exclude=primary)
+            if agent is None and not queue and await self._scale_up(model_name, description="hedge"):
+                self._dispatch_waiters(model_name)
+                agent = None if queue else self._find_free_agent(model_name, exclude=primary)
+            return agent
+
+        candidates = [
+            agent for agent in self._active_agents.values() if agent is not primary and agent.model_name == model_name
+        ]
+        if candidates:
+            return min(candidates, key=lambda a: len(a.active_prompts))
+
+        # Agents being created by other requests count against the limit too
+        if len(self._active_agents) + self._pending_creations >= self._max_agents:
+            return None
+
+        return await self._create_counted_agent(model_name, description="hedge")
+
+    @staticmethod
+    async def _first_successful(tasks: Sequence[asyncio.Task[LLMResponse]]) -> asyncio.Task[LLMResponse]:
+        """Wait for the first task that produces a successful response.
+
+        If every task fails, the last task to finish is returned so the caller sees its error.
+        """
+        pending = set(tasks)
+        last_done = tasks[0]
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task not in done:
+                    continue
+                last_done = task
+                if task.exception() is None and task.result().success:
+                    return task
+        return last_done
+
+    async def _acquire_agent(self, model_name: str, description: Optional[str] = None) -> RuntimeAgent:
+        """Get an agent of a model with a free slot, scaling up or queueing as needed.
+
+        Requests are served in arrival order: a new request only takes a free slot
+        directly when nobody is already queued for the model.
+
+        Args:
+            model_name: Model the request must run on
+            description: Optional description for agents created to serve the request
+
+        Returns:
+            An agent with capacity for one more prompt
+
+        Raises:
+            PoolSaturatedError: If the model's queue is full or the wait times out
+        """
+        policy = self.scaling_policy or ScalingPolicy()
+        queue = self._queues.setdefault(model_name, deque())
+
+        agent = None if queue else self._find_free_agent(model_name)
+        if agent is None and await self._scale_up(model_name, description):
+            self._dispatch_waiters(model_name)
+            agent = None if queue else self._find_free_agent(model_name)
+        if agent is not None:
+            return agent
+
+        if len(queue) >= policy.max_queue_depth:
+            self.scaling_metrics.rejected_queue_full += 1
+            raise PoolSaturatedError(f"Request queue for model {model_name} is full ({len(queue)} waiting)")
+
+        waiter: asyncio.Future[RuntimeAgent] = self.loop.create_future()
+        queue.append(waiter)
+        self.scaling_metrics.queued_requests += 1
+        self.scaling_metrics.max_queue_depth_seen = max(self.scaling_metrics.max_queue_depth_seen, len(queue))
+
+        try:
+            done, _ = await asyncio.wait({waiter}, timeout=policy.queue_timeout)
+        except asyncio.CancelledError:
+            self._abandon_waiter(model_name, waiter)
+            raise
+
+        if not done:
+            self._abandon_waiter(model_name, waiter)
+            self.scaling_metrics.rejected_timeout += 1
+            raise PoolSaturatedError(
+                f"Timed out after {policy.queue_timeout}s waiting for an agent for model {model_name}"
+            )
+
+        agent = waiter.result()
+        self._unreserve(agent)
+        return agent
+
+    def _load(self, agent: RuntimeAgent) -> int:
+        """Count running prompts plus slots handed to queued requests that have not started yet."""
+        return len(agent.active_prompts) + self._reservations.get(agent.agent.id, 0)
+
+    def _find_free_agent(self, model_name: str, exclude: Optional[RuntimeAgent] = None) -> Optional[RuntimeAgent]:
+        """Find the least loaded agent of a model that has a free slot, other than ``exclude``."""
+        capacity = (self.scaling_policy or ScalingPolicy()).max_concurrent_per_agent
+        candidates = [
+            agent
+            for agent in self._active_agents.values()
+            if agent.model_name == model_name and agent is not exclude and self._load(agent) < capacity
+        ]
+        return min(candidates, key=self._load, default=None)
+
+    def _dispatch_waiters(self, model_name: str) -> None:
+        """Hand free slots of a model's agents to its queued requests."""
+        queue = self._queues.get(model_name)
+        while queue:
+            agent = self._find_free_agent(model_name)
+            if agent is None:
+                return
+            waiter = queue.popleft()
+            if waiter.done():
+                continue
+            self._reservations[agent.agent.id] = self._reservations.get(agent.agent.id, 0) + 1
+            waiter.set_result(agent)
+
+    def _unreserve(self, agent: RuntimeAgent) -> None:
+        """Release a slot reservation made by _dispatch_waiters."""
+        remaining = self._reservations.get(agent.agent.id, 0) - 1
+        if remaining > 0:
+            self._reservations[agent.agent.id] = remaining
+        else:
+            self._reservations.pop(agent.agent.id, None)
+
+    def _abandon_waiter(self, model_name: str, waiter: asyncio.Future[RuntimeAgent]) -> None:
+        """Remove a queued request that gave up, passing on any slot it was already handed."""
+        queue = self._queues.get(model_name)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+        if waiter.done() and not waiter.cancelled():
+            self._unreserve(waiter.result())
+            self._dispatch_waiters(model_name)
+        else:
+            waiter.cancel()
+
+    async def _scale_up(self, model_name: str, description: Optional[str] = None) -> bool:
+        """Add an agent for a model, evicting an idle agent of another model if the pool is full.
+
+        Returns:
+            True if an agent was added
+        """
+        evicted = None
+        if len(self._active_agents) + self._pending_creations >= self._max_agents:
+            idle = [agent for agent in self._idle_agents() if agent.model_name != model_name]
+            if not idle:
+                return False
+            evicted = idle[0]
+            self._active_agents.pop(evicted.agent.id, None)
+            self.scaling_metrics.scale_downs += 1
+
+        await self._create_counted_agent(model_name, description, evicted=evicted)
+        self.scaling_metrics.scale_ups += 1
+        logger.debug(f"Scaled up model {model_name} to {self._agent_count(model_name)} agents")
+        return True
+
+    def _agent_count(self, model_name: str) -> int:
+        """Count the pool's agents for a model."""
+        return sum(1 for agent in self._active_agents.values() if agent.model_name == model_name)
+
+    def _idle_agents(self, min_idle: float = 0.0) -> List[RuntimeAgent]:
+        """Get removable idle agents, longest idle first.
+
+        Agents of models with queued requests, and agents needed to keep each model at
+        the policy's minimum, are never returned.
+        """
+        policy = self.scaling_policy or ScalingPolicy()
+        now = time.monotonic()
+        counts: Dict[str, int] = {}
+        for agent in self._active_agents.values():
+            counts[agent.model_name] = counts.get(agent.model_name, 0) + 1
+
+        idle = sorted(
+            (
+                agent
+                for agent in self._active_agents.values()
+                if self._load(agent) == 0
+                and not self._queues.get(agent.model_name)
+                and now - self._idle_since.get(agent.agent.id, now) >= min_idle
+            ),
+            key=lambda agent: self._idle_since.get(agent.agent.id, now),
+        )
+
+        removable = []
+        for agent in idle:
+            if counts[agent.model_name] > policy.min_agents_per_model:
+                counts[agent.model_name] -= 1
+                removable.append(agent)
+        return removable
+
+    async def _shutdown_agent(self, agent: RuntimeAgent) -> None:
+        """Forget a removed agent and shut down its LLM instance."""
+        self._idle_since.pop(agent.agent.id, None)
+        self._reservations.pop(agent.agent.id, None)
+        try:
+            await agent.llm_instance.shutdown()
+        except Exception as e:
+            logger.warning(f"Error shutting down agent {agent.agent.id}: {e}")
+
+    async def autoscale(self) -> None:
+        """Run one autoscaling pass.
+
+        Models with queued requests, or whose p95 latency exceeds the policy's
+        ``scale_up_latency`` while every agent is busy, gain an agent if the pool has room.
+        Agents idle for at least ``idle_timeout`` seconds are removed, keeping
+        ``min_agents_per_model`` agents per model.
+        """
+        policy = self.scaling_policy or ScalingPolicy()
+
+        for model_name in self._scale_up_candidates(policy):
+            if await self._scale_up(model_name, description="autoscaled"):
+                self._dispatch_waiters(model_name)
+
+        for agent in self._idle_agents(policy.idle_timeout):
+            self._active_agents.pop(agent.agent.id, None)
+            self.scaling_metrics.scale_downs += 1
+            logger.debug(f"Removed idle agent {agent.agent.id} for model {agent.model_name}")
+            await self._shutdown_agent(agent)
+
+    def _scale_up_candidates(self, policy: ScalingPolicy) -> List[str]:
+        """Get models that would benefit from another agent."""
+        models = {model_name for model_name, queue in self._queues.items() if queue}
+        if policy.scale_up_latency is not None:
+            for model_name in {agent.model_name for agent in self._active_agents.values()}:
+                p95 = self.latency_tracker.percentile(model_name, 95)
+                if p95 is not None and p95 > policy.scale_up_latency and self._find_free_agent(model_name) is None:
+                    models.add(model_name)
+        return sorted(models)
+
+    def start_autoscaler(self) -> None:
+        """Start running autoscaling passes in the background every ``check_interval`` seconds."""
+        if self._autoscaler_task is not None and not self._autoscaler_task.done():
+            return
+        self._autoscaler_task = self.loop.create_task(self._autoscale_loop())
+
+    async def stop_autoscaler(self) -> None:
+        """Stop the background autoscaler if it is running."""
+        task, self._autoscaler_task = self._autoscaler_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _autoscale_loop(self) -> None:
+        """Background loop driving autoscale()."""
+        while True:
+            await asyncio.sleep((self.scaling_policy or ScalingPolicy()).check_interval)
+            try:
+                await self.autoscale()
+            except Exception as e:
+                logger.error(f"Autoscaling pass failed: {e}")
 
     def get_pool_stats(self) -> Dict[str, Any]:
         """Get statistics about the agent pool.
@@ -247,12 +1091,18 @@ class AgentPool:
         - Total number of agents
         - Maximum allowed agents
         - Number of active prompts
+        - Hedging counters and per-model latency statistics
+        - Per-model queue depths and queueing/autoscaling counters
         - Per-agent statistics
         """
         return {
             "total_agents": len(self._active_agents),
             "max_agents": self._max_agents,
             "active_prompts": sum(len(agent.active_prompts) for agent in self._active_agents.values()),
+            "hedging": self.hedging_metrics.model_dump(),
+            "latency": self.latency_tracker.snapshot(),
+            "queue_depths": {model_name: len(queue) for model_name, queue in self._queues.items()},
+            "scaling": {**self.scaling_metrics.model_dump(), "rejections": self.scaling_metrics.rejections},
             "agents": [
                 {
                     "id": agent.agent.id,
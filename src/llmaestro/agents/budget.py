@@ -0,0 +1,250 @@
+"""Token and cost budgets shared by all requests of a run."""
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Any, Dict, Iterator, Optional
+
+from llmaestro.core.models import TokenUsage
+from llmaestro.llm.capabilities import LLMCapabilities
+
+# Budget applied to agent pool requests that do not pass one explicitly
+_active_budget: ContextVar[Optional["RunBudget"]] = ContextVar("_active_budget", default=None)
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when a request does not fit in the remaining run budget."""
+
+
+class BudgetMode(str, Enum):
+    """What to do with a request that does not fit in the remaining budget."""
+
+    ABORT = "abort"
+    DEGRADE = "degrade"
+
+
+@dataclass
+class BudgetReservation:
+    """Tokens and cost held for one request until its actual usage is known."""
+
+    model_name: str
+    input_tokens: int
+    max_output_tokens: int
+    input_cost_per_1k: float
+    output_cost_per_1k: float
+    degraded: bool = False
+
+    @property
+    def tokens(self) -> int:
+        return self.input_tokens + self.max_output_tokens
+
+    @property
+    def cost(self) -> float:
+        return request_cost(self.input_tokens, self.max_output_tokens, self.input_cost_per_1k, self.output_cost_per_1k)
+
+
+def request_cost(input_tokens: int, output_tokens: int, input_cost_per_1k: float, output_cost_per_1k: float) -> float:
+    """Compute the cost of a request from per-1k-token prices."""
+    return (input_tokens * input_cost_per_1k + output_tokens * output_cost_per_1k) / 1000
+
+
+class RunBudget:
+    """Token and cost limits for every LLM request made on behalf of one run.
+
+    Each request reserves its estimated input tokens plus its maximum output tokens
+    before it is sent, so concurrent requests cannot jointly overshoot the budget, and
+    is reconciled with its actual usage afterwards. A request that does not fit is
+    rejected with ``BudgetExceededError`` in ``ABORT`` mode; in ``DEGRADE`` mode the
+    agent pool first tries cheaper models and then a smaller ``max_tokens``.
+    """
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        max_cost: Optional[float] = None,
+        mode: BudgetMode = BudgetMode.ABORT,
+        min_output_tokens: int = 256,
+    ):
+        """Initialize the budget.
+
+        Args:
+            max_tokens: Maximum total (input plus output) tokens across all requests
+            max_cost: Maximum estimated cost across all requests
+            mode: Whether requests that do not fit are rejected or degraded
+            min_output_tokens: Smallest ``max_tokens`` a degraded request may be shrunk to
+        """
+        if max_tokens is None and max_cost is None:
+            raise ValueError("A budget needs max_tokens, max_cost or both")
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if max_cost is not None and max_cost <= 0:
+            raise ValueError("max_cost must be positive")
+        if min_output_tokens < 1:
+            raise ValueError("min_output_tokens must be at least 1")
+
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.mode = BudgetMode(mode)
+        self.min_output_tokens = min_output_tokens
+        self.spent_tokens = 0
+        self.spent_cost = 0.0
+        self.reserved_tokens = 0
+        self.reserved_cost = 0.0
+        self.requests = 0
+        self.degraded_requests = 0
+        self.rejected_requests = 0
+        self._lock = Lock()
+
+    @property
+    def remaining_tokens(self) -> Optional[int]:
+        """Tokens neither spent nor reserved, or None without a token limit."""
+        if self.max_tokens is None:
+            return None
+        return max(0, self.max_tokens - self.spent_tokens - self.reserved_tokens)
+
+    @property
+    def remaining_cost(self) -> Optional[float]:
+        """Cost neither spent nor reserved, or None without a cost limit."""
+        if self.max_cost is None:
+            return None
+        return max(0.0, self.max_cost - self.spent_cost - self.reserved_cost)
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether either limit has been used up."""
+        return self.remaining_tokens == 0 or self.remaining_cost == 0
+
+    def affordable_output_tokens(self, input_tokens: int, caps: LLMCapabilities) -> int:
+        """Get the most output tokens a request with the given input could still reserve."""
+        with self._lock:
+            return self._affordable_output_tokens(input_tokens, caps)
+
+    def try_reserve(
+        self,
+        model_name: str,
+        input_tokens: int,
+        max_output_tokens: int,
+        caps: LLMCapabilities,
+        degraded: bool = False,
+    ) -> Optional[BudgetReservation]:
+        """Reserve room for a request if it fits in the remaining budget.
+
+        Args:
+            model_name: Model that will serve the request
+            input_tokens: Estimated input tokens
+            max_output_tokens: Output tokens the request may generate
+            caps: Capabilities of the model, for its prices
+            degraded: Whether the request was degraded to fit
+
+        Returns:
+            The reservation, or None if the request does not fit
+        """
+        with self._lock:
+            if self._affordable_output_tokens(input_tokens, caps) < max_output_tokens:
+                return None
+            reservation = BudgetReservation(
+                model_name=model_name,
+                input_tokens=input_tokens,
+                max_output_tokens=max_output_tokens,
+                input_cost_per_1k=caps.input_cost_per_1k_tokens,
+                output_cost_per_1k=caps.output_cost_per_1k_tokens,
+                degraded=degraded,
+            )
+            self.reserved_tokens += reservation.tokens
+            self.reserved_cost += reservation.cost
+            self.requests += 1
+            if degraded:
+                self.degraded_requests += 1
+            return reservation
+
+    def reconcile(self, reservation: BudgetReservation, usage: Optional[TokenUsage]) -> None:
+        """Replace a reservation with the request's actual usage.
+
+        Requests that report no usage are charged their full reservation.
+        """
+        if usage is None:
+            tokens, cost = reservation.tokens, reservation.cost
+        else:
+            tokens = usage.total_tokens
+            cost = (
+                usage.estimated_cost
+                if usage.estimated_cost is not None
+                else request_cost(
+                    usage.prompt_tokens,
+                    usage.completion_tokens,
+                    reservation.input_cost_per_1k,
+                    reservation.output_cost_per_1k,
+                )
+            )
+        with self._lock:
+            self._unreserve(reservation)
+            self.spent_tokens += tokens
+            self.spent_cost += cost
+
+    def release(self, reservation: BudgetReservation) -> None:
+        """Return a reservation for a request that failed before producing a response."""
+        with self._lock:
+            self._unreserve(reservation)
+
+    def reject(self) -> None:
+        """Count a request that was refused for lack of budget."""
+        with self._lock:
+            self.rejected_requests += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the budget's limits and usage."""
+        with self._lock:
+            return {
+                "max_tokens": self.max_tokens,
+                "max_cost": self.max_cost,
+                "spent_tokens": self.spent_tokens,
+                "spent_cost": self.spent_cost,
+                "reserved_tokens": self.reserved_tokens,
+                "reserved_cost": self.reserved_cost,
+                "requests": self.requests,
+                "degraded_requests": self.degraded_requests,
+                "rejected_requests": self.rejected_requests,
+            }
+
+    def _affordable_output_tokens(self, input_tokens: int, caps: LLMCapabilities) -> int:
+        affordable: Optional[float] = None
+        if self.max_tokens is not None:
+            affordable = self.max_tokens - self.spent_tokens - self.reserved_tokens - input_tokens
+        if self.max_cost is not None:
+            remaining = self.max_cost - self.spent_cost - self.reserved_cost
+            remaining -= input_tokens * caps.input_cost_per_1k_tokens / 1000
+            if caps.output_cost_per_1k_tokens > 0:
+                by_cost = remaining * 1000 / caps.output_cost_per_1k_tokens
+            else:
+                by_cost = float("inf") if remaining >= 0 else -1.0
+            affordable = by_cost if affordable is None else min(affordable, by_cost)
+        if affordable is None or affordable == float("inf"):
+            return sys.maxsize
+        return max(-1, int(affordable))
+
+    def _unreserve(self, reservation: BudgetReservation) -> None:
+        self.reserved_tokens -= reservation.tokens
+        self.reserved_cost = max(0.0, self.reserved_cost - reservation.cost)
+
+
+def get_active_budget() -> Optional[RunBudget]:
+    """Get the budget applied to requests in the current context."""
+    return _active_budget.get()
+
+
+@contextmanager
+def use_budget(budget: Optional[RunBudget]) -> Iterator[Optional[RunBudget]]:
+    """Apply a budget to agent pool requests made in this context, including tasks started in it.
+
+    Passing None leaves the current budget in place.
+    """
+    if budget is None:
+        yield _active_budget.get()
+        return
+    token = _active_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _active_budget.reset(token)
@@ -0,0 +1,88 @@
+"""Rolling latency statistics for models served by the agent pool."""
+import math
+from collections import deque
+from threading import Lock
+from typing import Deque, Dict, Optional
+
+
+class LatencyTracker:
+    """Tracks a rolling window of observed request latencies per model.
+
+    The tracker is shared by pool features that need to reason about how long a
+    model usually takes to answer (hedging thresholds, routing, scheduling).
+    """
+
+    def __init__(self, window_size: int = 200):
+        """Initialize the tracker.
+
+        Args:
+            window_size: Number of most recent samples kept per model
+        """
+        if window_size < 1:
+            raise ValueError("window_size must be at least 1")
+        self._window_size = window_size
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = Lock()
+
+    def record(self, model_name: str, latency: float) -> None:
+        """Record a latency sample (in seconds) for a model."""
+        with self._lock:
+            samples = self._samples.get(model_name)
+            if samples is None:
+                samples = deque(maxlen=self._window_size)
+                self._samples[model_name] = samples
+            samples.append(latency)
+
+    def count(self, model_name: str) -> int:
+        """Get the number of samples currently held for a model."""
+        with self._lock:
+            return len(self._samples.get(model_name, ()))
+
+    def mean(self, model_name: str) -> Optional[float]:
+        """Get the mean latency for a model, or None if no samples exist."""
+        with self._lock:
+            samples = self._samples.get(model_name)
+            if not samples:
+                return None
+            return sum(samples) / len(samples)
+
+    def percentile(self, model_name: str, pct: float) -> Optional[float]:
+        """Get a latency percentile (nearest-rank) for a model.
+
+        Args:
+            model_name: Model to look up
+            pct: Percentile in the range (0, 100]
+
+        Returns:
+            The latency at the requested percentile, or None if no samples exist
+        """
+        if not 0 < pct <= 100:
+            raise ValueError("pct must be in the range (0, 100]")
+        with self._lock:
+            samples = self._samples.get(model_name)
+            if not samples:
+                return None
+            ordered = sorted(samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Get summary statistics for every tracked model."""
+        with self._lock:
+            models = list(self._samples)
+        summary = {}
+        for model_name in models:
+            mean = self.mean(model_name)
+            p95 = self.percentile(model_name, 95)
+            if mean is None or p95 is None:
+                continue
+            summary[model_name] = {"count": self.count(model_name), "mean": mean, "p95": p95}
+        return summary
+
+    def clear(self, model_name: Optional[str] = None) -> None:
+        """Drop samples for one model, or for all models when no name is given."""
+        with self._lock:
+            if model_name is None:
+                self._samples.clear()
+            else:
+                self._samples.pop(model_name, None)
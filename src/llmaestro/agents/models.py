@@ -61,3 +61,136 @@ class Agent(BaseModel):
         """Update the agent's state."""
         self.state = state
         self.last_active = datetime.now()
+
+
+class HedgingPolicy(BaseModel):
+    """Policy for sending a duplicate (hedged) request when the primary one is slow.
+
+    When the primary request has not completed after the hedge delay, the same prompt
+    is sent to a second agent and whichever response arrives first is returned. The
+    delay is either a static ``threshold`` or a rolling percentile of the model's
+    observed latency. ``max_hedge_ratio`` caps the extra requests sent across the pool.
+    """
+
+    threshold: Optional[float] = Field(
+        default=None, gt=0, description="Static delay in seconds before a hedge request is sent"
+    )
+    use_rolling_percentile: bool = Field(
+        default=False, description="Use the model's rolling latency percentile as the hedge delay"
+    )
+    percentile: float = Field(default=95.0, gt=0, le=100, description="Latency percentile used as the hedge delay")
+    min_samples: int = Field(
+        default=20, ge=1, description="Samples required before the rolling percentile replaces the static threshold"
+    )
+    max_hedge_ratio: float = Field(
+        default=0.05, ge=0.0, le=1.0, description="Maximum hedge requests as a fraction of all requests"
+    )
+    hedge_model_name: Optional[str] = Field(
+        default=None, description="Model used for hedge requests (defaults to the primary agent's model)"
+    )
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+class HedgingMetrics(BaseModel):
+    """Counters describing hedged request behaviour."""
+
+    total_requests: int = 0
+    hedges_fired: int = 0
+    hedges_won: int = 0
+    hedges_skipped_budget: int = 0
+    hedges_skipped_no_agent: int = 0
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    @property
+    def hedge_rate(self) -> float:
+        """Fraction of requests that fired a hedge."""
+        return self.hedges_fired / self.total_requests if self.total_requests else 0.0
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of fired hedges that returned before the primary request."""
+        return self.hedges_won / self.hedges_fired if self.hedges_fired else 0.0
+
+
+class RoutingPolicy(BaseModel):
+    """Policy for cost-aware model selection in the agent pool.
+
+    Candidate models must support the required capabilities and fit the estimated
+    request in their context window. Among those, each model is scored by a weighted
+    sum of its normalized estimated cost and normalized expected latency, and the
+    lowest score wins.
+    """
+
+    cost_weight: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Weight of cost against expected latency (1.0 = cheapest, 0.0 = fastest)",
+    )
+    expected_output_tokens: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Expected completion size; defaults to each model's configured max_tokens",
+    )
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+class ScalingPolicy(BaseModel):
+    """Policy for queue-based admission and autoscaling in the agent pool.
+
+    Each agent runs at most ``max_concurrent_per_agent`` prompts at once. Requests that
+    find no free agent trigger a scale-up while the pool has room; otherwise they wait
+    in a bounded per-model queue and are rejected when the queue is full or the wait
+    times out. Agents that stay idle for ``idle_timeout`` seconds are removed.
+    """
+
+    max_concurrent_per_agent: int = Field(default=1, ge=1, description="Prompts an agent may run concurrently")
+    max_queue_depth: int = Field(default=100, ge=0, description="Maximum waiting requests per model")
+    queue_timeout: Optional[float] = Field(
+        default=30.0, gt=0, description="Seconds a request may wait for an agent (None waits indefinitely)"
+    )
+    scale_up_latency: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Add an agent when a saturated model's p95 latency exceeds this many seconds",
+    )
+    idle_timeout: float = Field(default=60.0, ge=0, description="Seconds before an idle agent is removed")
+    min_agents_per_model: int = Field(default=0, ge=0, description="Agents kept per model when scaling down")
+    check_interval: float = Field(default=5.0, gt=0, description="Seconds between background autoscaler passes")
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+class ScalingMetrics(BaseModel):
+    """Counters describing queueing and autoscaling behaviour."""
+
+    queued_requests: int = 0
+    rejected_queue_full: int = 0
+    rejected_timeout: int = 0
+    scale_ups: int = 0
+    scale_downs: int = 0
+    max_queue_depth_seen: int = 0
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    @property
+    def rejections(self) -> int:
+        """Total requests rejected by admission control."""
+        return self.rejected_queue_full + self.rejected_timeout
+
+
+class AgentWarmupReport(BaseModel):
+    """Outcome of creating and warming up one agent while filling a pool."""
+
+    agent_type: str
+    model_name: str
+    agent_id: Optional[str] = None
+    success: bool = False
+    creation_time: float = Field(default=0.0, description="Seconds spent creating the agent")
+    warmup_time: Optional[float] = Field(default=None, description="Seconds spent warming up, if warmup ran")
+    error: Optional[str] = None
+
+    model_config = ConfigDict(validate_assignment=True)
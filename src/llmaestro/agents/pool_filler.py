@@ -1,10 +1,18 @@
 """Utility for filling an agent pool with specialized agents."""
-from typing import Dict, List, Optional, Set, Any
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
-from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.agents.agent_pool import AgentPool, RuntimeAgent
+from llmaestro.agents.models import AgentWarmupReport
 from llmaestro.llm.llm_registry import LLMRegistry
 from llmaestro.llm.capabilities import LLMCapabilities
 
+logger = logging.getLogger(__name__)
+
+HealthCheck = Callable[[RuntimeAgent], Awaitable[Any]]
+
 
 class PoolFiller:
     """Utility class for filling an agent pool with specialized agents."""
@@ -60,24 +68,46 @@ class PoolFiller:
 
         return matching_models
 
-    async def fill_pool(self, pool: AgentPool, agent_counts: Optional[Dict[str, int]] = None) -> None:
+    async def fill_pool(
+        self,
+        pool: AgentPool,
+        agent_counts: Optional[Dict[str, int]] = None,
+        max_concurrency: int = 8,
+        warmup: bool = False,
+        health_check: Optional[HealthCheck] = None,
+    ) -> List[AgentWarmupReport]:
         """Fill the agent pool with specialized agents.
 
+        Agents are created concurrently, at most ``max_concurrency`` at a time. When
+        ``warmup`` is enabled each agent's interface is initialized and its tokenizer
+        exercised before it is reported ready; a ``health_check`` coroutine, if given,
+        runs afterwards (for example a one-token request to open the provider connection).
+        Agents whose warmup or health check fails are removed from the pool.
+
         Args:
             pool: The agent pool to fill
             agent_counts: Optional dictionary specifying how many of each agent type to create.
                         If not provided, will create one of each available type.
+            max_concurrency: Maximum number of agents created at the same time
+            warmup: Whether to warm up each agent after creating it
+            health_check: Optional coroutine function called with each new agent; raising marks it unhealthy
+
+        Returns:
+            One report per requested agent with its creation and warmup latency
 
         Example:
             ```python
             filler = PoolFiller(llm_registry)
-            await filler.fill_pool(pool, {
+            reports = await filler.fill_pool(pool, {
                 "code": 2,      # Create 2 code agents
                 "vision": 1,    # Create 1 vision agent
                 "planning": 1,  # Create 1 planning agent
-            })
+            }, warmup=True)
             ```
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         # Default to one of each available type if not specified
         if agent_counts is None:
             agent_counts = {}
@@ -85,23 +115,77 @@ class PoolFiller:
                 if self.get_models_by_capabilities(required_caps):
                     agent_counts[agent_type] = 1
 
-        # Create agents of each type
+        # Plan agents of each type using round-robin model selection
+        planned: List[Tuple[str, str]] = []
         for agent_type, count in agent_counts.items():
             if agent_type not in self.AGENT_CAPABILITY_SETS:
                 continue
 
-            required_caps = self.AGENT_CAPABILITY_SETS[agent_type]
-            matching_models = self.get_models_by_capabilities(required_caps)
-
+            matching_models = self.get_models_by_capabilities(self.AGENT_CAPABILITY_SETS[agent_type])
             if not matching_models:
                 continue
 
-            # Create agents using round-robin model selection
             for i in range(count):
-                model = matching_models[i % len(matching_models)]
-                await pool.get_agent(
-                    required_capabilities=required_caps, description=f"{agent_type}_specialist_{model}"
-                )
+                planned.append((agent_type, matching_models[i % len(matching_models)]))
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def bounded(agent_type: str, model: str) -> AgentWarmupReport:
+            async with semaphore:
+                return await self._create_and_warm(pool, agent_type, model, warmup, health_check)
+
+        reports = await asyncio.gather(*(bounded(agent_type, model) for agent_type, model in planned))
+        failed = sum(1 for report in reports if not report.success)
+        if failed:
+            logger.warning(f"{failed} of {len(reports)} agents failed to start")
+        return list(reports)
+
+    async def _create_and_warm(
+        self,
+        pool: AgentPool,
+        agent_type: str,
+        model: str,
+        warmup: bool,
+        health_check: Optional[HealthCheck],
+    ) -> AgentWarmupReport:
+        """Create one agent and optionally warm it up, timing each stage."""
+        report = AgentWarmupReport(agent_type=agent_type, model_name=model)
+
+        start_time = time.monotonic()
+        try:
+            agent = await pool.add_agent(model, description=f"{agent_type}_specialist_{model}")
+        except Exception as e:
+            report.creation_time = time.monotonic() - start_time
+            report.error = str(e)
+            return report
+        report.creation_time = time.monotonic() - start_time
+        report.agent_id = agent.agent.id
+
+        if warmup or health_check is not None:
+            start_time = time.monotonic()
+            try:
+                if warmup:
+                    await self._warm_up(agent)
+                if health_check is not None:
+                    await health_check(agent)
+            except Exception as e:
+                report.warmup_time = time.monotonic() - start_time
+                report.error = str(e)
+                agent.llm_instance.is_healthy = False
+                await pool.remove_agent(agent.agent.id)
+                return report
+            report.warmup_time = time.monotonic() - start_time
+
+        report.success = True
+        return report
+
+    @staticmethod
+    async def _warm_up(agent: RuntimeAgent) -> None:
+        """Initialize an agent's interface and load its tokenizer without calling the provider."""
+        interface = agent.llm_instance.interface
+        await interface.initialize()
+        interface.count_tokens([{"role": "user", "content": "warmup"}])
+        agent.llm_instance.is_initialized = True
 
     def get_capability_summary(self) -> Dict[str, Dict[str, Any]]:
         """Get a summary of available capabilities and models.
@@ -1,23 +1,84 @@
 """Graph-based chain system for LLM orchestration."""
 
 import asyncio
+import json
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterable, Sized
+from contextlib import nullcontext, suppress
 from dataclasses import dataclass, field
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, Optional, Protocol, Set, Tuple, TypeVar, cast, List
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import uuid4
 
 from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.agents.budget import BudgetExceededError, RunBudget, use_budget
+from llmaestro.chains.checkpoint import ChainCheckpointer, register_result_model, restore_run
+from llmaestro.chains.memo import NodeResultCache, node_cache_key
+from llmaestro.chains.scheduling import (
+    CriticalPath,
+    ReadyQueue,
+    critical_path_lengths,
+    estimate_cost,
+    realized_critical_path,
+)
+from llmaestro.core.attachments import AttachmentConverter
 from llmaestro.core.graph import BaseEdge, BaseGraph, BaseNode
-from llmaestro.core.models import LLMResponse
-from llmaestro.prompts.base import BasePrompt
+from llmaestro.core.models import LLMResponse, TokenUsage
+from llmaestro.llm.json_repair import repair_json
+from llmaestro.prompts.base import BasePrompt, PromptVariable
+from llmaestro.prompts.memory import MemoryPrompt
 from llmaestro.prompts.types import PromptMetadata
 from llmaestro.llm.responses import ResponseFormat
-from pydantic import BaseModel, ConfigDict, Field
-from llmaestro.llm.responses import ValidationResult
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from llmaestro.llm.responses import ResponseFormatType, ValidationResult
+
+logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 ChainResult = TypeVar("ChainResult")
 
+_JSON_FORMATS = {ResponseFormatType.JSON, ResponseFormatType.JSON_SCHEMA, ResponseFormatType.PYDANTIC}
+
+
+class _VerbatimPrompt(MemoryPrompt):
+    """A prompt whose text is sent as written rather than formatted as a template.
+
+    Retry prompts quote validation errors and the previous response, whose braces
+    (e.g. the JSON being fixed) must reach the model unchanged.
+    """
+
+    def render(self, **variable_values: Any) -> Tuple[str, str, List[Dict[str, Any]], List[Any]]:
+        attachments = [AttachmentConverter.to_interface_format(att) for att in self.attachments]
+        return self._add_response_format(self.system_prompt), self.user_prompt, attachments, self.tools
+
+    def _extract_template_vars(self) -> Set[str]:
+        return set()
+
 
 class NodeType(str, Enum):
     """Types of nodes in the chain graph."""
@@ -44,9 +105,136 @@ class RetryStrategy(BaseModel):
     delay: float = Field(default=1.0, ge=0)
     exponential_backoff: bool = Field(default=False)
     max_delay: Optional[float] = Field(default=None, ge=0)
+    jitter: float = Field(default=0.1, ge=0, le=1, description="Random fraction added to or removed from each delay")
+    time_budget: Optional[float] = Field(
+        default=None, gt=0, description="Maximum seconds spent on all attempts and waits combined"
+    )
+    respect_retry_after: bool = Field(default=True, description="Wait at least as long as a Retry-After hint")
 
     model_config = ConfigDict(validate_assignment=True)
 
+    def get_delay(self, retry_number: int, retry_after: Optional[float] = None) -> float:
+        """Compute how long to wait before a retry.
+
+        Args:
+            retry_number: 1-based number of the retry about to be made
+            retry_after: Server-provided Retry-After hint in seconds, if any
+
+        Returns:
+            Delay in seconds
+        """
+        delay = self.delay * 2 ** (retry_number - 1) if self.exponential_backoff else self.delay
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        if self.jitter:
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+        if retry_after is not None and self.respect_retry_after:
+            delay = max(delay, retry_after)
+        return max(delay, 0.0)
+
+
+class RetryMetrics(BaseModel):
+    """Counters describing retry behavior."""
+
+    attempts: int = 0
+    retries: int = 0
+    successes: int = 0
+    failures: int = 0
+    budget_exhausted: int = 0
+    total_delay: float = 0.0
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+def get_retry_after(error: BaseException) -> Optional[float]:
+    """Extract a Retry-After hint (in seconds) from an exception, if it carries one.
+
+    Checks a ``retry_after`` attribute first, then the ``retry-after-ms`` and
+    ``retry-after`` headers of an attached HTTP response (as on provider SDK errors).
+    """
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, (int, float)):
+        return float(retry_after)
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            retry_at = parsedate_to_datetime(value)
+            return max((retry_at - datetime.now(retry_at.tzinfo)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+async def retry_with_backoff(
+    operation: Callable[[int], Awaitable[T]],
+    strategy: RetryStrategy,
+    metrics: Optional[RetryMetrics] = None,
+    retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+) -> T:
+    """Run an operation, retrying failures according to a retry strategy.
+
+    The loop is iterative and keeps no state outside this call, so one strategy and
+    operation factory can serve any number of concurrent runs. When the strategy has a
+    time budget, each attempt is cancelled once the budget is spent and no retry is
+    scheduled whose wait would exceed it.
+
+    Args:
+        operation: Coroutine factory called with the 0-based attempt number
+        strategy: Retry limits, backoff and time budget
+        metrics: Optional counters to update
+        retry_on: Exception types that trigger a retry; anything else propagates. A
+            ``BudgetExceededError`` is never retried.
+
+    Returns:
+        The result of the first successful attempt
+
+    Raises:
+        Exception: The error of the last attempt when retries or the time budget are exhausted
+    """
+    metrics = metrics if metrics is not None else RetryMetrics()
+    deadline = time.monotonic() + strategy.time_budget if strategy.time_budget is not None else None
+    attempt = 0
+
+    while True:
+        metrics.attempts += 1
+        try:
+            if deadline is None:
+                result = await operation(attempt)
+            else:
+                result = await asyncio.wait_for(operation(attempt), timeout=max(deadline - time.monotonic(), 0.0))
+        except BudgetExceededError:
+            metrics.failures += 1
+            raise
+        except retry_on as err:
+            if attempt >= strategy.max_retries:
+                metrics.failures += 1
+                raise
+
+            delay = strategy.get_delay(attempt + 1, get_retry_after(err))
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                metrics.budget_exhausted += 1
+                metrics.failures += 1
+                raise
+
+            logger.debug(f"Attempt {attempt + 1} failed ({err}), retrying in {delay:.2f}s")
+            metrics.retries += 1
+            metrics.total_delay += delay
+            await asyncio.sleep(delay)
+            attempt += 1
+            continue
+
+        metrics.successes += 1
+        return result
+
 
 class ChainMetadata(BaseModel):
     """Structured metadata for chain components."""
@@ -119,33 +307,75 @@ class ChainStep(BaseModel, Generic[T]):
             retry_strategy=retry_strategy or RetryStrategy(),
         )
 
+    def format_prompt(self, values: Dict[str, Any]) -> BasePrompt:
+        """Get a copy of the step's prompt with its templates formatted, leaving the step untouched."""
+        return self.prompt.model_copy(
+            update={
+                "system_prompt": self.prompt.system_prompt.format(**values),
+                "user_prompt": self.prompt.user_prompt.format(**values),
+            }
+        )
+
+    def prepare_prompt(self, context: ChainContext, **kwargs: Any) -> BasePrompt:
+        """Get the prompt to send for one execution, applying the input transform if set."""
+        if not self.input_transform:
+            return self.prompt
+        return self.format_prompt(self.input_transform(context, kwargs))
+
+    def transform_output(self, response: LLMResponse) -> T:
+        """Apply the output transform to a response, if set."""
+        if self.output_transform:
+            return self.output_transform(response)
+        return cast(T, response)
+
     async def execute(
         self,
         agent_pool: AgentPool,
         context: ChainContext,
         **kwargs: Any,
     ) -> T:
-        """Execute this chain step using the agent pool."""
-        # Transform input using context if needed
-        if self.input_transform:
-            transformed_data = self.input_transform(context, kwargs)
-            # Update prompt with transformed data
-            self.prompt = BasePrompt(
-                name=self.prompt.name,
-                description=self.prompt.description,
-                system_prompt=self.prompt.system_prompt.format(**transformed_data),
-                user_prompt=self.prompt.user_prompt.format(**transformed_data),
-                metadata=self.prompt.metadata,
-                variables=self.prompt.variables,
-            )
+        """Execute this chain step using the agent pool.
 
-        # Execute prompt
-        result = await agent_pool.execute_prompt(self.prompt)
+        The step is never modified, so one step can be executed concurrently by many runs.
+        """
+        result = await agent_pool.execute_prompt(self.prepare_prompt(context, **kwargs))
+        return self.transform_output(result)
 
-        # Transform output if needed
-        if self.output_transform:
-            return self.output_transform(result)
-        return cast(T, result)
+    async def execute_streaming(
+        self,
+        agent_pool: AgentPool,
+        context: ChainContext,
+        on_chunk: Callable[[LLMResponse], None],
+        **kwargs: Any,
+    ) -> T:
+        """Execute this chain step, passing each partial response to ``on_chunk`` as it arrives.
+
+        The output transform is applied to the response assembled from all chunks.
+        """
+        chunks: List[LLMResponse] = []
+        async for chunk in agent_pool.stream_prompt(self.prepare_prompt(context, **kwargs)):
+            chunks.append(chunk)
+            on_chunk(chunk)
+        return self.transform_output(merge_chunks(chunks))
+
+
+def merge_chunks(chunks: Sequence[LLMResponse]) -> LLMResponse:
+    """Assemble partial streamed responses into one response."""
+    if not chunks:
+        raise ValueError("Stream produced no response")
+    last = chunks[-1]
+    return last.model_copy(
+        update={
+            "content": "".join(chunk.content for chunk in chunks),
+            "success": all(chunk.success for chunk in chunks),
+            "error": next((chunk.error for chunk in chunks if chunk.error), None),
+            "token_usage": TokenUsage(
+                prompt_tokens=sum(chunk.token_usage.prompt_tokens for chunk in chunks),
+                completion_tokens=sum(chunk.token_usage.completion_tokens for chunk in chunks),
+                total_tokens=sum(chunk.token_usage.total_tokens for chunk in chunks),
+            ),
+        }
+    )
 
 
 class ChainNode(BaseNode):
@@ -154,6 +384,12 @@ class ChainNode(BaseNode):
     step: ChainStep = Field(...)
     node_type: NodeType = Field(...)
     metadata: ChainMetadata = Field(default_factory=ChainMetadata)
+    memoize: bool = Field(
+        default=True, description="Whether results may be reused from the graph cache (off for non-deterministic steps)"
+    )
+    stream_tokens: bool = Field(
+        default=False, description="Whether execute_stream forwards the step's partial responses as they arrive"
+    )
 
     model_config = ConfigDict(validate_assignment=True)
 
@@ -172,40 +408,75 @@ class ChainExecutor:
 
     @staticmethod
     async def execute_with_retry(
-        node: ChainNode, agent_pool: AgentPool, context: ChainContext, retry_strategy: RetryStrategy, **kwargs: Any
+        node: ChainNode,
+        agent_pool: AgentPool,
+        context: ChainContext,
+        retry_strategy: RetryStrategy,
+        metrics: Optional[RetryMetrics] = None,
+        **kwargs: Any,
     ) -> Any:
         """Execute a node with retry logic."""
-        max_retries = retry_strategy.max_retries
-        delay = retry_strategy.delay
+        return await retry_with_backoff(
+            lambda attempt: node.step.execute(agent_pool, context, **kwargs),
+            retry_strategy,
+            metrics=metrics,
+        )
 
-        for attempt in range(max_retries):
-            try:
-                return await node.step.execute(agent_pool, context, **kwargs)
-            except Exception:
-                if attempt == max_retries - 1:
-                    raise
-                await asyncio.sleep(delay)
-        raise RuntimeError("Node execution failed after all retries")
+
+class ResponseValidationError(ValueError):
+    """Raised when a response still fails validation after local repair."""
+
+    def __init__(self, validation_result: ValidationResult):
+        super().__init__("; ".join(validation_result.errors) or "Response failed validation")
+        self.validation_result = validation_result
+
+
+class ValidationMetrics(BaseModel):
+    """Counters describing how a validation node resolved responses."""
+
+    valid: int = 0
+    repaired: int = 0
+    retried: int = 0
+    failed: int = 0
+
+    model_config = ConfigDict(validate_assignment=True)
 
 
 class ValidationNode(ChainNode):
-    """A specialized node for response validation and retry logic."""
+    """A specialized node for response validation and retry logic.
+
+    Invalid JSON responses are first repaired locally (code fences, trailing commas,
+    single quotes, truncated closing brackets) and re-validated against the cached
+    schema. A retry prompt is only sent to the model when local repair fails. Retries
+    run iteratively under the step's retry strategy, and each attempt builds its own
+    prompt, so one node can validate responses for concurrent chains.
+    """
+
+    response_format: ResponseFormat
+    error_handler: Optional[Callable[[ValidationResult], Dict[str, Any]]] = None
+    repair_json: bool = Field(default=True, description="Whether to repair malformed JSON before retrying")
+    metrics: ValidationMetrics = Field(default_factory=ValidationMetrics)
+    retry_metrics: RetryMetrics = Field(default_factory=RetryMetrics)
+
+    model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
 
     def __init__(
         self,
         response_format: ResponseFormat,
         retry_strategy: Optional[RetryStrategy] = None,
         error_handler: Optional[Callable[[ValidationResult], Dict[str, Any]]] = None,
+        repair_json: bool = True,
     ):
         super().__init__(
             node_type=NodeType.VALIDATION,
             step=ChainStep(
-                prompt=self._create_retry_prompt(),
+                prompt=self._create_retry_prompt(response_format),
                 retry_strategy=retry_strategy or RetryStrategy(),
             ),
+            response_format=response_format,
+            error_handler=error_handler,
+            repair_json=repair_json,
         )
-        self.response_format = response_format
-        self.error_handler = error_handler
 
     async def validate_and_retry(
         self,
@@ -226,28 +497,86 @@ class ValidationNode(ChainNode):
         validation_result = self.response_format.validate_response(response.content)
 
         if validation_result.is_valid:
+            self.metrics.valid += 1
             return True, validation_result.formatted_response
 
-        # Handle retry if needed
-        retry_prompt = self.response_format.generate_retry_prompt(validation_result)
-        if not retry_prompt:
-            if self.error_handler:
-                return False, self.error_handler(validation_result)
-            return False, validation_result
+        repaired = self._repair(response.content)
+        if repaired is not None:
+            self.metrics.repaired += 1
+            return True, repaired.formatted_response
+
+        retry_config = self.response_format.retry_config
+        max_retries = min(self.step.retry_strategy.max_retries, retry_config.max_retries) if retry_config else 0
+        if max_retries == 0:
+            return self._fail(validation_result)
+
+        latest = validation_result
+
+        async def attempt(attempt_number: int) -> Any:
+            nonlocal latest
+            retry_message = self.response_format.generate_retry_prompt(latest) or ""
+            self.metrics.retried += 1
+            retry_response = await agent_pool.execute_prompt(self._build_retry_prompt(retry_message))
+
+            result = self.response_format.validate_response(retry_response.content)
+            if result.is_valid:
+                self.metrics.valid += 1
+                return result.formatted_response
+            repaired = self._repair(retry_response.content)
+            if repaired is not None:
+                self.metrics.repaired += 1
+                return repaired.formatted_response
+
+            result.retry_count = attempt_number + 1
+            latest = result
+            raise ResponseValidationError(result)
+
+        # The first retry prompt is the operation's first attempt
+        strategy = self.step.retry_strategy.model_copy(update={"max_retries": max_retries - 1})
+        try:
+            return True, await retry_with_backoff(attempt, strategy, metrics=self.retry_metrics)
+        except ResponseValidationError as err:
+            return self._fail(err.validation_result)
+
+    def _fail(self, validation_result: ValidationResult) -> Tuple[bool, Any]:
+        """Record a response that could not be made valid and hand it to the error handler."""
+        self.metrics.failed += 1
+        if self.error_handler:
+            return False, self.error_handler(validation_result)
+        return False, validation_result
+
+    def _build_retry_prompt(self, retry_message: str) -> BasePrompt:
+        """Create a standalone prompt for one retry attempt, leaving the step's template untouched."""
+        template = self.step.prompt
+        return _VerbatimPrompt(
+            name=template.name,
+            description=template.description,
+            system_prompt=template.system_prompt,
+            user_prompt=retry_message,
+            metadata=template.metadata,
+            expected_response=template.expected_response,
+        )
 
-        # Update prompt with retry context
-        self.step.prompt.user_prompt = retry_prompt
+    def _repair(self, content: str) -> Optional[ValidationResult]:
+        """Try to fix a malformed JSON response locally.
 
-        # Execute retry
-        retry_response = await self.step.execute(agent_pool, context)
-        validation_result.retry_count += 1
+        Returns:
+            A valid validation result for the repaired response, or None if repair failed
+        """
+        if not self.repair_json or self.response_format.format not in _JSON_FORMATS:
+            return None
+        try:
+            repaired = repair_json(content)
+        except ValueError:
+            return None
 
-        # Validate retry response
-        return await self.validate_and_retry(retry_response, agent_pool, context)
+        result = self.response_format.validate_response(json.dumps(repaired))
+        return result if result.is_valid else None
 
-    def _create_retry_prompt(self) -> BasePrompt:
+    @staticmethod
+    def _create_retry_prompt(response_format: ResponseFormat) -> BasePrompt:
         """Create a prompt for retry attempts."""
-        return BasePrompt(
+        return MemoryPrompt(
             name="validation_retry",
             description="Retry prompt for invalid responses",
             system_prompt=(
@@ -256,13 +585,21 @@ class ValidationNode(ChainNode):
             ),
             user_prompt="{retry_message}",
             metadata=PromptMetadata(type="validation"),
-            variables=[],  # No version control for retry prompts
-            expected_response=self.response_format,
+            variables=[PromptVariable(name="retry_message")],
+            expected_response=response_format,
         )
 
 
 class ConditionalNode(ChainNode):
-    """A node that evaluates conditions and determines the next execution path."""
+    """A node that evaluates conditions and determines the next execution path.
+
+    Only the chosen outgoing edge stays live; nodes reachable solely through the other
+    edges are skipped without running.
+    """
+
+    conditions: Dict[str, Callable[[Any], bool]] = Field(default_factory=dict)
+
+    model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
 
     def __init__(
         self,
@@ -280,7 +617,7 @@ class ConditionalNode(ChainNode):
         super().__init__(
             id=id or str(uuid4()),
             step=ChainStep(
-                prompt=BasePrompt(
+                prompt=MemoryPrompt(
                     name="conditional_node",
                     description="Evaluates conditions to determine execution path",
                     system_prompt="",
@@ -289,8 +626,8 @@ class ConditionalNode(ChainNode):
             ),
             node_type=NodeType.CONDITIONAL,
             metadata=metadata or ChainMetadata(),
+            conditions=conditions or {},
         )
-        self.conditions = conditions or {}  # Use empty dict instead of None
 
     async def evaluate(self, input_value: Any) -> str:
         """Evaluate conditions and return the ID of the edge to follow.
@@ -307,6 +644,189 @@ class ConditionalNode(ChainNode):
         return ""  # Return empty string instead of None
 
 
+class MapFailurePolicy(str, Enum):
+    """How a map node handles elements that still fail after their retries."""
+
+    FAIL_FAST = "fail_fast"  # Cancel remaining elements and raise
+    CONTINUE = "continue"  # Keep going and report failures in the result
+
+
+@dataclass
+class MapElementResult:
+    """Outcome of running a map node's step on one element."""
+
+    index: int
+    item: Any
+    output: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the element was processed without error."""
+        return self.error is None
+
+
+@dataclass
+class MapResult:
+    """Gathered results of a map node, consumed by downstream (reduce) nodes."""
+
+    elements: List[MapElementResult]
+
+    @property
+    def outputs(self) -> List[Any]:
+        """Outputs of the successful elements."""
+        return [element.output for element in self.elements if element.success]
+
+    @property
+    def failures(self) -> List[MapElementResult]:
+        """Elements that failed after all retries."""
+        return [element for element in self.elements if not element.success]
+
+
+class MapNode(ChainNode):
+    """A node that fans its step out over every element of an upstream list.
+
+    The list comes from the result of the ``items_from`` dependency (or the only
+    dependency), optionally passed through ``select_items``. Each element is run through
+    the agent pool with at most ``max_concurrency`` in flight, retried individually under
+    the step's retry strategy, and gathered into a ``MapResult`` for a downstream reduce
+    node. When the step has no input transform, the element is substituted for
+    ``{item}`` (see ``item_variable``) in the prompt; otherwise the transform receives
+    ``item`` and ``index`` alongside the usual step arguments.
+    """
+
+    node_type: NodeType = Field(default=NodeType.PARALLEL)
+    items_from: Optional[str] = Field(default=None, description="ID of the dependency whose result is mapped over")
+    select_items: Optional[Callable[[Any], Sequence[Any]]] = Field(
+        default=None, description="Extracts the element list from the dependency result"
+    )
+    item_variable: str = Field(default="item", description="Prompt variable the element is bound to")
+    max_concurrency: int = Field(default=5, ge=1, description="Maximum elements processed at once")
+    ordered: bool = Field(default=True, description="Whether gathered results keep input order")
+    failure_policy: MapFailurePolicy = Field(default=MapFailurePolicy.FAIL_FAST)
+    max_failures: Optional[int] = Field(
+        default=None, ge=0, description="With CONTINUE, raise once more elements than this have failed"
+    )
+    retry_metrics: RetryMetrics = Field(default_factory=RetryMetrics)
+
+    model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
+
+    def get_items(self, dependency_results: Dict[str, Any]) -> Sequence[Any]:
+        """Select the list of elements to map over from the dependency results."""
+        if self.items_from is not None:
+            if self.items_from not in dependency_results:
+                raise ValueError(f"Map node {self.id} has no result from dependency {self.items_from}")
+            source = dependency_results[self.items_from]
+        elif len(dependency_results) == 1:
+            source = next(iter(dependency_results.values()))
+        else:
+            raise ValueError(f"Map node {self.id} needs items_from when it has {len(dependency_results)} dependencies")
+
+        items = self.select_items(source) if self.select_items else source
+        if isinstance(items, MapResult):
+            items = items.outputs
+        if not isinstance(items, (list, tuple)):
+            raise ValueError(f"Map node {self.id} expected a list of items, got {type(items).__name__}")
+        return items
+
+    async def stream(
+        self,
+        agent_pool: AgentPool,
+        context: ChainContext,
+        items: Iterable[Any],
+        **kwargs: Any,
+    ) -> AsyncIterator[MapElementResult]:
+        """Process elements with bounded concurrency, yielding results as they complete.
+
+        Elements are pulled lazily by ``max_concurrency`` workers, so large lists do not
+        create a task per element and ``items`` may be a generator over input that does
+        not fit in memory. Closing the iterator cancels outstanding work.
+        """
+        queue: asyncio.Queue[Union[MapElementResult, BaseException, None]] = asyncio.Queue()
+        elements = iter(enumerate(items))
+
+        async def worker() -> None:
+            try:
+                for index, item in elements:
+                    await queue.put(await self._run_element(agent_pool, context, index, item, **kwargs))
+            except Exception as err:
+                # Raised by the items iterator itself; element failures are captured in their results
+                await queue.put(err)
+            else:
+                await queue.put(None)
+
+        concurrency = min(self.max_concurrency, len(items)) if isinstance(items, Sized) else self.max_concurrency
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                result = await queue.get()
+                if result is None:
+                    running -= 1
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    yield result
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def execute(
+        self,
+        agent_pool: AgentPool,
+        context: ChainContext,
+        dependency_results: Dict[str, Any],
+        **kwargs: Any,
+    ) -> MapResult:
+        """Map the step over the upstream list and gather the results.
+
+        Raises:
+            RuntimeError: If an element fails under FAIL_FAST, or more than max_failures fail under CONTINUE
+        """
+        items = self.get_items(dependency_results)
+        gathered: List[MapElementResult] = []
+        failures = 0
+
+        elements = self.stream(agent_pool, context, items, dependency_results=dependency_results, **kwargs)
+        try:
+            async for element in elements:
+                gathered.append(element)
+                if element.success:
+                    continue
+                failures += 1
+                if self.failure_policy == MapFailurePolicy.FAIL_FAST or (
+                    self.max_failures is not None and failures > self.max_failures
+                ):
+                    raise RuntimeError(
+                        f"Map node {self.id} failed on element {element.index}: {element.error}"
+                    ) from element.error
+                logger.warning(f"Map node {self.id} skipped element {element.index}: {element.error}")
+        finally:
+            await elements.aclose()
+
+        if self.ordered:
+            gathered.sort(key=lambda element: element.index)
+        return MapResult(elements=gathered)
+
+    async def _run_element(
+        self, agent_pool: AgentPool, context: ChainContext, index: int, item: Any, **kwargs: Any
+    ) -> MapElementResult:
+        """Run the step on one element with per-element retries, capturing any final error."""
+
+        async def attempt(attempt_number: int) -> Any:
+            if self.step.input_transform:
+                prompt = self.step.prepare_prompt(context, item=item, index=index, **kwargs)
+            else:
+                prompt = self.step.format_prompt({self.item_variable: item})
+            return self.step.transform_output(await agent_pool.execute_prompt(prompt))
+
+        try:
+            output = await retry_with_backoff(attempt, self.step.retry_strategy, metrics=self.retry_metrics)
+        except Exception as err:
+            return MapElementResult(index=index, item=item, error=err)
+        return MapElementResult(index=index, item=item, output=output)
+
+
 class DynamicPromptNode(ChainNode):
     """A node that dynamically generates prompts based on tool results."""
 
@@ -332,28 +852,215 @@ class DynamicPromptNode(ChainNode):
         # Transform the dependency results into prompt variables
         variables = self.transform_func(dependency_results)
 
-        # Update the prompt with the variables
-        updated_prompt = BasePrompt(
-            name=self.step.prompt.name,
-            description=self.step.prompt.description,
-            system_prompt=self.step.prompt.system_prompt,
-            user_prompt=self.step.prompt.user_prompt.format(**variables),
-            metadata=self.step.prompt.metadata,
-            variables=self.step.prompt.variables,
+        # Update a copy of the prompt with the variables
+        updated_prompt = self.step.prompt.model_copy(
+            update={"user_prompt": self.step.prompt.user_prompt.format(**variables)}
         )
 
         # Execute the updated prompt
         return await agent_pool.execute_prompt(updated_prompt)
 
 
+@dataclass(frozen=True)
+class ChainDefinition:
+    """Immutable, validated execution plan for a chain graph.
+
+    Runs read nodes and adjacency from the definition instead of scanning the graph's
+    edge list, and never modify it, so a single definition can back any number of
+    concurrent runs.
+    """
+
+    nodes: Mapping[str, ChainNode]
+    dependencies: Mapping[str, Tuple[str, ...]]
+    dependents: Mapping[str, Tuple[str, ...]]
+    outgoing_edges: Mapping[str, Tuple[ChainEdge, ...]]
+    roots: Tuple[str, ...]
+    order: Tuple[str, ...]
+    levels: Tuple[Tuple[str, ...], ...]
+
+    @classmethod
+    def from_graph(cls, graph: "ChainGraph") -> "ChainDefinition":
+        """Build a plan from the current nodes and edges of a graph in O(V + E).
+
+        Raises:
+            ValueError: If the graph contains a cycle
+        """
+        dependencies: Dict[str, List[str]] = {node_id: [] for node_id in graph.nodes}
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in graph.nodes}
+        outgoing: Dict[str, List[ChainEdge]] = {node_id: [] for node_id in graph.nodes}
+        for edge in graph.edges:
+            dependencies[edge.target_id].append(edge.source_id)
+            dependents[edge.source_id].append(edge.target_id)
+            outgoing[edge.source_id].append(edge)
+        roots = tuple(node_id for node_id, deps in dependencies.items() if not deps)
+
+        # Kahn's algorithm: topological order plus the earliest level each node can run at
+        remaining = {node_id: len(deps) for node_id, deps in dependencies.items()}
+        level = dict.fromkeys(roots, 0)
+        queue = deque(roots)
+        order: List[str] = []
+        while queue:
+            node_id = queue.popleft()
+            order.append(node_id)
+            for target in dependents[node_id]:
+                level[target] = max(level.get(target, 0), level[node_id] + 1)
+                remaining[target] -= 1
+                if remaining[target] == 0:
+                    queue.append(target)
+        if len(order) != len(dependencies):
+            raise ValueError("Cycle detected in graph")
+
+        levels: List[List[str]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+        for node_id in order:
+            levels[level[node_id]].append(node_id)
+
+        return cls(
+            nodes=MappingProxyType(dict(graph.nodes)),
+            dependencies=MappingProxyType({node_id: tuple(ids) for node_id, ids in dependencies.items()}),
+            dependents=MappingProxyType({node_id: tuple(ids) for node_id, ids in dependents.items()}),
+            outgoing_edges=MappingProxyType({node_id: tuple(edges) for node_id, edges in outgoing.items()}),
+            roots=roots,
+            order=tuple(order),
+            levels=tuple(tuple(ids) for ids in levels),
+        )
+
+
+@dataclass
+class NodeTimings:
+    """Monotonic timestamps (``time.monotonic()``) and retry count of one node's execution in a run.
+
+    Retries of map node elements are counted in ``MapNode.retry_metrics`` instead.
+    """
+
+    queued: float
+    started: Optional[float] = None
+    first_token: Optional[float] = None
+    finished: Optional[float] = None
+    retries: int = 0
+
+    @property
+    def wait(self) -> Optional[float]:
+        """Seconds between the node becoming ready and starting."""
+        return self.started - self.queued if self.started is not None else None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Seconds the node spent executing."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds between starting and the first streamed chunk."""
+        if self.started is None or self.first_token is None:
+            return None
+        return self.first_token - self.started
+
+
+@dataclass
+class ChainEvent:
+    """A node result or partial response yielded by ``ChainGraph.execute_stream``.
+
+    Completion events carry the node's result. Partial events (``partial=True``) carry
+    one streamed ``LLMResponse`` chunk of a node that is still running.
+    """
+
+    node_id: str
+    result: Any
+    timings: NodeTimings
+    partial: bool = False
+
+
+@dataclass
+class ChainRun:
+    """Mutable state of a single execution of a chain definition."""
+
+    context: ChainContext
+    run_id: str = field(default_factory=lambda: str(uuid4()))
+    results: Dict[str, Any] = field(default_factory=dict)
+    executed: List[str] = field(default_factory=list)
+    skipped: List[str] = field(default_factory=list)
+    timings: Dict[str, NodeTimings] = field(default_factory=dict)
+    critical_path: Optional[CriticalPath] = None
+    budget: Optional[RunBudget] = None
+
+
+ChainInput = Union[Dict[str, Any], ChainContext]
+
+
+@dataclass
+class ChainRecordResult:
+    """Outcome of running one input through a chain with ``ChainGraph.execute_many``."""
+
+    index: int
+    input: ChainInput
+    run: ChainRun
+    error: Optional[BaseException] = None
+
+    @property
+    def success(self) -> bool:
+        """Whether the run completed without raising."""
+        return self.error is None
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        """Results keyed by node ID (partial if the run failed)."""
+        return self.run.results
+
+
+async def _iterate(items: Union[Iterable[T], AsyncIterable[T]]) -> AsyncIterator[T]:
+    """Iterate a sync or async iterable asynchronously."""
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
 class ChainGraph(BaseGraph[ChainNode, ChainEdge]):
-    """A graph-based representation of an LLM chain."""
+    """A graph-based representation of an LLM chain.
+
+    ``context`` is a template: every call to ``execute`` runs against its own copy, so
+    one graph can be executed for many inputs concurrently.
+
+    With a ``checkpointer``, each run's results and state are saved as nodes complete,
+    and ``resume`` continues a failed run without re-executing completed nodes. Give the
+    graph a stable ``id`` to resume runs from another process.
+
+    With a ``result_cache``, node results are memoized by content: a node whose rendered
+    prompt, model, parameters and dependency results match an earlier execution (in any
+    run or chain sharing the cache) reuses that result. Set ``memoize=False`` on nodes
+    whose output should not be reused.
+
+    Nodes of a run execute sequentially unless ``max_concurrency`` is raised. Under a
+    concurrency limit, ready nodes with the longest estimated downstream critical path
+    start first, and each run reports the critical path it actually took.
+
+    A ``RunBudget`` passed to ``execute`` caps the tokens and cost of every LLM request
+    the run makes, including retries and dynamically generated prompts.
+    """
 
     context: ChainContext = Field(default_factory=ChainContext)
     agent_pool: Optional[AgentPool] = None
     verify_acyclic: bool = Field(
         default=True, description="Whether to verify the graph is acyclic during initialization"
     )
+    checkpointer: Optional[ChainCheckpointer] = Field(
+        default=None, description="Persists run progress so failed runs can be resumed"
+    )
+    result_cache: Optional[NodeResultCache] = Field(
+        default=None, description="Content-addressed cache of node results shared across runs"
+    )
+    max_concurrency: int = Field(
+        default=1, ge=1, description="Maximum nodes of one run executing at once (1 runs nodes sequentially)"
+    )
+
+    _definition: Optional[ChainDefinition] = PrivateAttr(default=None)
+    _definition_key: Optional[Tuple[Tuple[str, ...], Tuple[int, ...], Tuple[int, ...]]] = PrivateAttr(default=None)
+    _successors: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+    _successors_key: Optional[Tuple[int, int]] = PrivateAttr(default=None)
 
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
 
@@ -364,7 +1071,70 @@ class ChainGraph(BaseGraph[ChainNode, ChainEdge]):
         should_verify = getattr(self, "verify_acyclic", True)
         # Verify the graph is acyclic by default if specified
         if should_verify and self.nodes and self.edges:
-            self.verify_acyclic_graph()
+            self.compile()
+
+    def add_node(self, node: ChainNode) -> str:
+        """Add a node to the graph, keeping the adjacency index current.
+
+        The node's declared response model is registered so its results can be checkpointed.
+        """
+        expected_response = node.step.prompt.expected_response
+        if expected_response and expected_response.pydantic_model:
+            register_result_model(expected_response.pydantic_model)
+        index_current = self._successors_key == self._index_key()
+        node_id = super().add_node(node)
+        if index_current:
+            self._successors_key = self._index_key()
+        return node_id
+
+    def add_edge(self, edge: ChainEdge) -> None:
+        """Add an edge to the graph.
+
+        When ``verify_acyclic`` is set, the edge is rejected if its target can already
+        reach its source. The check only walks the nodes downstream of the target, so
+        building a chain edge by edge stays linear.
+
+        Raises:
+            ValueError: If a node is missing or the edge would create a cycle
+        """
+        if edge.source_id not in self.nodes or edge.target_id not in self.nodes:
+            raise ValueError("Both source and target nodes must exist in the graph")
+        successors = self._successor_index()
+        if self.verify_acyclic and self._reaches(edge.target_id, edge.source_id):
+            raise ValueError(f"Adding edge {edge.source_id} -> {edge.target_id} would create a cycle")
+
+        super().add_edge(edge)
+        successors.setdefault(edge.source_id, []).append(edge.target_id)
+        self._successors_key = self._index_key()
+
+    def _index_key(self) -> Tuple[int, int]:
+        return (len(self.nodes), len(self.edges))
+
+    def _successor_index(self) -> Dict[str, List[str]]:
+        """Get the successor lists of every node, rebuilding them if the graph was changed directly."""
+        if self._successors_key != self._index_key():
+            successors: Dict[str, List[str]] = {}
+            for edge in self.edges:
+                successors.setdefault(edge.source_id, []).append(edge.target_id)
+            self._successors = successors
+            self._successors_key = self._index_key()
+        return self._successors
+
+    def _reaches(self, start: str, goal: str) -> bool:
+        """Check whether goal is reachable from start by following edges."""
+        if start == goal:
+            return True
+        successors = self._successor_index()
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for target in successors.get(queue.popleft(), ()):
+                if target == goal:
+                    return True
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        return False
 
     def verify_acyclic_graph(self) -> None:
         """Verify that the graph is acyclic (contains no cycles).
@@ -399,51 +1169,35 @@ class ChainGraph(BaseGraph[ChainNode, ChainEdge]):
     def find_cycle(self) -> Optional[List[str]]:
         """Find a cycle in the graph if one exists.
 
+        Uses an iterative depth-first search over the adjacency index, so it runs in
+        O(V + E) and is not limited by the recursion depth on long chains.
+
         Returns:
             Optional[List[str]]: A list of node IDs forming a cycle, or None if no cycle exists.
         """
-        # Use depth-first search to detect cycles
-        visited = set()  # Nodes that have been fully processed
-        path = []  # Current path being explored
-        path_set = set()  # Set version of path for O(1) lookups
-        cycle_found: List[Optional[List[str]]] = [None]  # Use a list to store the cycle
-
-        def dfs(node_id: str) -> bool:
-            """Depth-first search to detect cycles.
-
-            Returns:
-                bool: True if a cycle was found, False otherwise.
-            """
-            if node_id in path_set:
-                # We've found a cycle
-                cycle_start_idx = path.index(node_id)
-                cycle_found[0] = path[cycle_start_idx:] + [node_id]
-                return True
-
-            if node_id in visited:
-                return False
-
-            visited.add(node_id)
-            path.append(node_id)
-            path_set.add(node_id)
-
-            # Visit all neighbors
-            for edge in self.edges:
-                if edge.source_id == node_id:
-                    if dfs(edge.target_id):
-                        return True
-
-            # Remove from current path
-            path.pop()
-            path_set.remove(node_id)
-            return False
-
-        # Start DFS from each node that hasn't been visited
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if dfs(node_id):
-                    return cycle_found[0]
-
+        successors = self._successor_index()
+        finished: Set[str] = set()  # Nodes that have been fully processed
+        for start in self.nodes:
+            if start in finished:
+                continue
+            path = [start]  # Current path being explored
+            on_path = {start}
+            stack = [iter(successors.get(start, ()))]
+            while stack:
+                for target in stack[-1]:
+                    if target in on_path:
+                        # We've found a cycle
+                        return path[path.index(target) :] + [target]
+                    if target not in finished:
+                        path.append(target)
+                        on_path.add(target)
+                        stack.append(iter(successors.get(target, ())))
+                        break
+                else:
+                    node_id = path.pop()
+                    on_path.remove(node_id)
+                    finished.add(node_id)
+                    stack.pop()
         return None
 
     def get_root_nodes(self) -> List[str]:
@@ -454,86 +1208,556 @@ class ChainGraph(BaseGraph[ChainNode, ChainEdge]):
         root_nodes = [node_id for node_id in self.nodes.keys() if node_id not in target_nodes]
         return root_nodes
 
-    async def execute(self, **kwargs: Any) -> Dict[str, Any]:
-        """Execute the chain graph with conditional branching."""
+    def compile(self) -> ChainDefinition:
+        """Validate the graph and get its reusable execution plan.
+
+        The plan (topological order and levels, adjacency, roots and per-node
+        dependencies) is cached and only rebuilt after nodes or edges change, whether
+        through ``add_node``/``add_edge`` or by editing ``nodes`` and ``edges`` directly.
+        Change an edge by replacing it rather than by assigning to its fields.
+
+        Raises:
+            ValueError: If the graph contains a cycle
+        """
+        # The cached plan holds every node and edge, so their ids cannot be reused while it is cached
+        key = (tuple(self.nodes), tuple(map(id, self.nodes.values())), tuple(map(id, self.edges)))
+        if self._definition is None or self._definition_key != key:
+            try:
+                definition = ChainDefinition.from_graph(self)
+            except ValueError:
+                self.verify_acyclic_graph()  # Raises with the offending cycle
+                raise
+            self._definition = definition
+            self._definition_key = key
+        return self._definition
+
+    def get_execution_order(self) -> List[List[str]]:
+        """Get nodes grouped by execution level (for parallel execution)."""
+        return [list(level) for level in self.compile().levels]
+
+    def create_run(
+        self,
+        context: Optional[ChainContext] = None,
+        run_id: Optional[str] = None,
+        budget: Optional[RunBudget] = None,
+    ) -> ChainRun:
+        """Create the per-run state for one execution.
+
+        Args:
+            context: Context for the run; defaults to a fresh copy of the graph's template context
+            run_id: Optional ID for the run (generated if not provided), used to resume it
+            budget: Optional token and cost budget for every LLM request the run makes
+        """
+        if context is None:
+            context = ChainContext(
+                metadata=self.context.metadata.model_copy(deep=True),
+                state=self.context.state.model_copy(deep=True),
+                variables=dict(self.context.variables),
+            )
+        if run_id:
+            return ChainRun(context=context, run_id=run_id, budget=budget)
+        return ChainRun(context=context, budget=budget)
+
+    async def execute(
+        self,
+        context: Optional[ChainContext] = None,
+        run_id: Optional[str] = None,
+        budget: Optional[RunBudget] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Execute the chain graph with conditional branching.
+
+        Args:
+            context: Optional context for this run; defaults to a copy of the graph's context
+            run_id: Optional ID for the run, needed to resume it from a checkpoint
+            budget: Optional token and cost budget for every LLM request the run makes
+            **kwargs: Extra arguments passed to every step
+
+        Returns:
+            Results keyed by node ID
+
+        Raises:
+            BudgetExceededError: If a request does not fit in the budget
+        """
+        run = await self.execute_run(context, run_id, budget=budget, **kwargs)
+        return run.results
+
+    async def execute_run(
+        self,
+        context: Optional[ChainContext] = None,
+        run_id: Optional[str] = None,
+        budget: Optional[RunBudget] = None,
+        **kwargs: Any,
+    ) -> ChainRun:
+        """Execute the chain graph and return the full run.
+
+        Besides the results, the run holds the execution order, skipped nodes, per-node
+        timings and the realized critical path.
+
+        Args:
+            context: Optional context for this run; defaults to a copy of the graph's context
+            run_id: Optional ID for the run, needed to resume it from a checkpoint
+            budget: Optional token and cost budget for every LLM request the run makes
+            **kwargs: Extra arguments passed to every step
+
+        Returns:
+            The completed run
+        """
         if not self.agent_pool:
             raise ValueError("AgentPool must be set before execution")
 
-        results: Dict[str, Any] = {}
-        execution_queue = list(self.get_root_nodes())  # Start with root nodes
-        executed_nodes = set()
+        run = self.create_run(context, run_id, budget)
+        await self._run(self.compile(), run, self.agent_pool, **kwargs)
+        return run
 
-        while execution_queue:
-            # Get next node to execute
-            node_id = execution_queue.pop(0)
-            node = self.nodes[node_id]
+    async def execute_stream(
+        self,
+        context: Optional[ChainContext] = None,
+        run_id: Optional[str] = None,
+        budget: Optional[RunBudget] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChainEvent]:
+        """Execute the chain graph, yielding each node's result as soon as it completes.
 
-            # Skip if already executed
-            if node_id in executed_nodes:
-                continue
+        Nodes with ``stream_tokens`` set also yield their partial responses while they
+        run. Closing the iterator early cancels the rest of the run.
 
-            # Check if dependencies are satisfied
-            dependencies = self.get_node_dependencies(node_id)
-            if not all(dep_id in executed_nodes for dep_id in dependencies):
-                # Put back in queue if dependencies not met
-                execution_queue.append(node_id)
-                continue
+        Args:
+            context: Optional context for this run; defaults to a copy of the graph's context
+            run_id: Optional ID for the run, needed to resume it from a checkpoint
+            budget: Optional token and cost budget for every LLM request the run makes
+            **kwargs: Extra arguments passed to every step
 
-            # Get results from dependencies
-            dep_results = {dep_id: results[dep_id] for dep_id in dependencies}
+        Yields:
+            Events in the order they occur
 
-            # Handle different node types
-            if node.node_type == NodeType.CONDITIONAL:
-                if isinstance(node, ConditionalNode):
-                    # For conditional nodes, evaluate the condition
-                    # Use the most recent dependency result as input
-                    latest_dep_id = (
-                        max(dependencies, key=lambda d: list(executed_nodes).index(d)) if dependencies else None
-                    )
-                    input_value = results[latest_dep_id] if latest_dep_id else None
+        Raises:
+            Exception: Whatever a failing node raised, after the events preceding the failure
+        """
+        if not self.agent_pool:
+            raise ValueError("AgentPool must be set before execution")
+
+        run = self.create_run(context, run_id, budget)
+        events: asyncio.Queue[Optional[ChainEvent]] = asyncio.Queue()
+        task = asyncio.create_task(
+            self._run(self.compile(), run, self.agent_pool, on_event=events.put_nowait, **kwargs)
+        )
+        task.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield event
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
+
+    async def resume(self, run_id: str, budget: Optional[RunBudget] = None, **kwargs: Any) -> Dict[str, Any]:
+        """Resume a checkpointed run.
+
+        Completed nodes are not executed again; their results are loaded from the
+        checkpoint and passed to the nodes that still have to run.
+
+        Args:
+            run_id: ID of the run to resume
+            budget: Optional token and cost budget for the requests of the remaining nodes
+            **kwargs: Extra arguments passed to every step
 
-                    # Evaluate conditions
-                    chosen_edge_id = await node.evaluate(input_value)
+        Returns:
+            Results keyed by node ID
 
-                    # Find the target node of the chosen edge
-                    next_node_id = None
-                    for edge in self.edges:
-                        if edge.source_id == node_id and edge.id == chosen_edge_id:
-                            next_node_id = edge.target_id
-                            break
+        Raises:
+            ValueError: If no checkpointer or agent pool is set, or no checkpoint of this graph exists
+        """
+        if not self.checkpointer:
+            raise ValueError("A checkpointer must be set to resume runs")
+        if not self.agent_pool:
+            raise ValueError("AgentPool must be set before execution")
 
-                    # Add the next node to the execution queue
-                    if next_node_id:
-                        execution_queue.insert(0, next_node_id)
+        snapshot = await self.checkpointer.load(run_id)
+        if snapshot is None:
+            raise ValueError(f"No checkpoint found for run {run_id}")
+        if snapshot["graph_id"] != self.id:
+            raise ValueError(f"Run {run_id} belongs to chain {snapshot['graph_id']}, not {self.id}")
 
-                    # Mark this node as executed
-                    executed_nodes.add(node_id)
-                    results[node_id] = chosen_edge_id  # Store the chosen path
+        run = restore_run(snapshot)
+        run.budget = budget
+        if snapshot["status"] != "completed":
+            await self._run(self.compile(), run, self.agent_pool, **kwargs)
+        return run.results
 
-                else:
-                    raise ValueError(f"Node {node_id} is marked as CONDITIONAL but is not a ConditionalNode")
+    async def execute_many(
+        self,
+        inputs: Union[Iterable[ChainInput], AsyncIterable[ChainInput]],
+        concurrency: Optional[int] = None,
+        stage_concurrency: Optional[Mapping[str, int]] = None,
+        budget: Optional[RunBudget] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChainRecordResult]:
+        """Pipeline many inputs through the chain, yielding results in completion order.
 
-            else:
-                # For regular nodes, execute normally
-                result = await ChainExecutor.execute_with_retry(
-                    node=node,
-                    agent_pool=self.agent_pool,
-                    context=self.context,
-                    retry_strategy=node.step.retry_strategy,
-                    dependency_results=dep_results,
-                    **kwargs,
+        Each input is a dict of context variables or a ``ChainContext``. Up to
+        ``concurrency`` records are in flight at once, each advancing through the chain
+        independently, so one record can be in a later node while the next starts the
+        first. Inputs are pulled lazily and a new record only starts when a slot frees
+        up, which applies backpressure to large or unbounded input streams.
+
+        Args:
+            inputs: Records to process, as a sync or async iterable
+            concurrency: Maximum records in flight (defaults to the agent pool's concurrency)
+            stage_concurrency: Optional per-node limits on simultaneous executions, keyed by node ID
+            budget: Optional token and cost budget shared by the requests of all records
+            **kwargs: Extra arguments passed to every step
+
+        Yields:
+            One result per input; failures are reported on the result instead of raised
+        """
+        if not self.agent_pool:
+            raise ValueError("AgentPool must be set before execution")
+        agent_pool = self.agent_pool
+        if concurrency is None:
+            concurrency = agent_pool.max_concurrency
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        definition = self.compile()
+        unknown = set(stage_concurrency or {}) - set(definition.nodes)
+        if unknown:
+            raise ValueError(f"Unknown nodes in stage_concurrency: {sorted(unknown)}")
+        stage_limits = {node_id: asyncio.Semaphore(limit) for node_id, limit in (stage_concurrency or {}).items()}
+
+        async def run_record(index: int, item: ChainInput) -> ChainRecordResult:
+            context = item if isinstance(item, ChainContext) else None
+            run = self.create_run(context, budget=budget)
+            if context is None:
+                run.context.variables.update(item)
+            record = ChainRecordResult(index=index, input=item, run=run)
+            try:
+                await self._run(definition, run, agent_pool, stage_limits=stage_limits, **kwargs)
+            except Exception as err:
+                logger.warning(f"Chain run {run.run_id} for input {index} failed: {err}")
+                record.error = err
+            return record
+
+        pending: Set[asyncio.Task] = set()
+        try:
+            index = 0
+            async for item in _iterate(inputs):
+                while len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.create_task(run_record(index, item)))
+                index += 1
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            # Closing the generator early cancels records still in flight and waits for them to unwind
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _run(
+        self,
+        definition: ChainDefinition,
+        run: ChainRun,
+        agent_pool: AgentPool,
+        stage_limits: Optional[Mapping[str, asyncio.Semaphore]] = None,
+        on_event: Optional[Callable[[ChainEvent], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Execute a run, then record its critical path and persist its final state when checkpointing is enabled.
+
+        The run's budget applies to every agent pool request made while it executes.
+        """
+        try:
+            with use_budget(run.budget):
+                await self._execute_run(
+                    definition, run, agent_pool, stage_limits=stage_limits, on_event=on_event, **kwargs
                 )
+        finally:
+            run.critical_path = realized_critical_path(definition.dependencies, run.timings)
+            if self.checkpointer:
+                self.checkpointer.record(self.id, run)
+                await self.checkpointer.flush()
+
+    def _cache_key(
+        self,
+        node: ChainNode,
+        run: ChainRun,
+        agent_pool: AgentPool,
+        dependency_results: Dict[str, Any],
+        parameters: Dict[str, Any],
+    ) -> Optional[str]:
+        """Get the result cache key of a node execution, or None if it must not be memoized."""
+        if self.result_cache is None or not node.memoize:
+            return None
+        if isinstance(node, MapNode):
+            # Elements are rendered per item; the template and dependencies determine them
+            prompt = node.step.prompt
+        else:
+            prompt = node.step.prepare_prompt(run.context, dependency_results=dependency_results, **parameters)
+        try:
+            # Key on the model the pool routes this prompt to and the settings it runs with
+            state = agent_pool.get_model_state(prompt)
+        except ValueError:
+            return None
+        transform = node.step.output_transform
+        return node_cache_key(
+            prompt,
+            dependency_results,
+            model=state.profile.name,
+            parameters={
+                "node_type": type(node).__name__,
+                "output_transform": f"{transform.__module__}.{transform.__qualname__}" if transform else None,
+                "runtime_config": state.runtime_config.model_dump(mode="json", exclude={"rate_limit", "stream"}),
+                "kwargs": parameters,
+            },
+        )
+
+    async def _execute_streaming(
+        self,
+        node: ChainNode,
+        run: ChainRun,
+        agent_pool: AgentPool,
+        dependency_results: Dict[str, Any],
+        on_event: Callable[[ChainEvent], None],
+        metrics: Optional[RetryMetrics] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Execute a node with streaming, emitting each partial response as an event.
+
+        A retried attempt streams its response again from the start.
+        """
+        node_timings = run.timings[node.id]
+
+        def on_chunk(chunk: LLMResponse) -> None:
+            if node_timings.first_token is None:
+                node_timings.first_token = time.monotonic()
+            on_event(ChainEvent(node_id=node.id, result=chunk, timings=node_timings, partial=True))
+
+        return await retry_with_backoff(
+            lambda attempt: node.step.execute_streaming(
+                agent_pool, run.context, on_chunk, dependency_results=dependency_results, **kwargs
+            ),
+            node.step.retry_strategy,
+            metrics=metrics,
+        )
 
-                # Store result and mark as executed
-                results[node_id] = result
-                executed_nodes.add(node_id)
+    async def _node_completed(self, run: ChainRun, node_id: str) -> None:
+        """Hook called after a node's result has been recorded on the run."""
+        if self.checkpointer:
+            self.checkpointer.record(self.id, run)
+            if self.checkpointer.write_through:
+                await self.checkpointer.flush()
 
-                # Add successor nodes to the queue
-                for edge in self.edges:
-                    if edge.source_id == node_id:
-                        execution_queue.append(edge.target_id)
+    async def _execute_run(
+        self,
+        definition: ChainDefinition,
+        run: ChainRun,
+        agent_pool: AgentPool,
+        stage_limits: Optional[Mapping[str, asyncio.Semaphore]] = None,
+        on_event: Optional[Callable[[ChainEvent], None]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Execute one run against a chain definition, recording results on the run.
 
-        return results
+        A node becomes ready once every incoming edge is resolved. An edge is live when
+        its source ran (and, for a conditional source, when it is the chosen edge) and
+        dead otherwise. Nodes with at least one live input run with the results of their
+        live inputs; nodes whose inputs are all dead are skipped, which kills their
+        outgoing edges in turn.
+
+        Up to ``max_concurrency`` ready nodes run at once. When more are ready, the ones
+        with the longest estimated remaining critical path start first.
+
+        Node timings are recorded on the run, and ``on_event`` (if given) receives each
+        completed node's result and, for streaming nodes, their partial responses.
+        """
+        results = run.results
+        state = run.context.state
+        state.status = "running"
+        unresolved = {node_id: len(deps) for node_id, deps in definition.dependencies.items()}
+        live_inputs = dict.fromkeys(definition.nodes, 0)
+        # Nodes already executed (restored from a checkpoint) only resolve their edges
+        restored = set(run.executed)
+        position = {node_id: index for index, node_id in enumerate(run.executed)}
+        run.skipped.clear()
+        timings = run.timings
+        ready = ReadyQueue(self._priorities(definition, agent_pool))
+        running: Dict[asyncio.Task[Any], str] = {}
+
+        def make_ready(node_id: str) -> None:
+            timings[node_id] = NodeTimings(queued=time.monotonic())
+            ready.push(node_id)
+
+        def resolve(edges: Iterable[ChainEdge], chosen_edge_id: Optional[str] = None) -> None:
+            """Resolve edges out of a finished node; only the chosen edge is live when one is given."""
+            stack = [(edge, chosen_edge_id is None or edge.id == chosen_edge_id) for edge in edges]
+            while stack:
+                edge, is_live = stack.pop()
+                target = edge.target_id
+                unresolved[target] -= 1
+                live_inputs[target] += is_live
+                if unresolved[target]:
+                    continue
+                if live_inputs[target]:
+                    make_ready(target)
+                else:
+                    run.skipped.append(target)
+                    stack.extend((dead, False) for dead in definition.outgoing_edges[target])
+
+        for root in definition.roots:
+            make_ready(root)
+
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_concurrency:
+                    node_id = ready.pop()
+                    node = definition.nodes[node_id]
+                    if node_id in restored:
+                        chosen = results[node_id] if node.node_type == NodeType.CONDITIONAL else None
+                        timings.pop(node_id, None)
+                        resolve(definition.outgoing_edges[node_id], chosen)
+                        continue
+
+                    dependencies = [dep_id for dep_id in definition.dependencies[node_id] if dep_id in results]
+                    state.current_step = node_id
+                    task = asyncio.create_task(
+                        self._execute_node(
+                            node,
+                            run,
+                            agent_pool,
+                            dependencies,
+                            position,
+                            stage_limits.get(node_id) if stage_limits else None,
+                            on_event,
+                            **kwargs,
+                        )
+                    )
+                    running[task] = node_id
+                if not running:
+                    continue
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                # Record completions in start order so simultaneous finishes are deterministic
+                for task in [task for task in running if task in done]:
+                    node_id = running.pop(task)
+                    node = definition.nodes[node_id]
+                    try:
+                        result = task.result()
+                    except Exception:
+                        state.failed_steps.add(node_id)
+                        state.status = "failed"
+                        raise
+
+                    results[node_id] = result
+                    position[node_id] = len(run.executed)
+                    run.executed.append(node_id)
+                    if node.node_type == NodeType.CONDITIONAL:
+                        # The result is the chosen path
+                        chosen_edge_id = result
+                    else:
+                        chosen_edge_id = None
+                        state.completed_steps.add(node_id)
+                        state.step_results[node_id] = result
+                    await self._node_completed(run, node_id)
+                    if on_event:
+                        on_event(ChainEvent(node_id=node_id, result=result, timings=timings[node_id]))
+                    resolve(definition.outgoing_edges[node_id], chosen_edge_id)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        state.current_step = None
+        state.status = "completed"
+
+    async def _execute_node(
+        self,
+        node: ChainNode,
+        run: ChainRun,
+        agent_pool: AgentPool,
+        dependencies: List[str],
+        position: Mapping[str, int],
+        stage_limit: Optional[asyncio.Semaphore],
+        on_event: Optional[Callable[[ChainEvent], None]],
+        **kwargs: Any,
+    ) -> Any:
+        """Execute one ready node, recording its start and finish times."""
+        results = run.results
+        node_timings = run.timings[node.id]
+        dep_results = {dep_id: results[dep_id] for dep_id in dependencies}
+
+        if node.node_type == NodeType.CONDITIONAL:
+            if not isinstance(node, ConditionalNode):
+                raise ValueError(f"Node {node.id} is marked as CONDITIONAL but is not a ConditionalNode")
+
+            # Use the most recently executed dependency result as input
+            latest_dep_id = max(dependencies, key=position.__getitem__) if dependencies else None
+            node_timings.started = time.monotonic()
+            chosen_edge_id = await node.evaluate(results[latest_dep_id] if latest_dep_id else None)
+            node_timings.finished = time.monotonic()
+            return chosen_edge_id
+
+        cache_key = self._cache_key(node, run, agent_pool, dep_results, kwargs)
+        result = await self.result_cache.aget(cache_key) if self.result_cache is not None and cache_key else None
+        if cache_key and not NodeResultCache.is_miss(result):
+            # Served from the result cache
+            node_timings.started = node_timings.finished = time.monotonic()
+            return result
+
+        retry_metrics = RetryMetrics()
+        try:
+            async with stage_limit or nullcontext():
+                node_timings.started = time.monotonic()
+                if isinstance(node, MapNode):
+                    # Map nodes retry each element individually
+                    result = await node.execute(agent_pool, run.context, dep_results, **kwargs)
+                elif on_event and node.stream_tokens:
+                    result = await self._execute_streaming(
+                        node, run, agent_pool, dep_results, on_event, retry_metrics, **kwargs
+                    )
+                else:
+                    result = await ChainExecutor.execute_with_retry(
+                        node=node,
+                        agent_pool=agent_pool,
+                        context=run.context,
+                        retry_strategy=node.step.retry_strategy,
+                        metrics=retry_metrics,
+                        dependency_results=dep_results,
+                        **kwargs,
+                    )
+        finally:
+            node_timings.finished = time.monotonic()
+            node_timings.retries = retry_metrics.retries
+        if self.result_cache is not None and cache_key:
+            await self.result_cache.aset(cache_key, node.id, result)
+        return result
+
+    def _priorities(self, definition: ChainDefinition, agent_pool: AgentPool) -> Dict[str, float]:
+        """Get each node's remaining critical-path length, used to order ready nodes.
+
+        Sequential runs (``max_concurrency`` of 1) have no choice to make, so no
+        estimates are computed for them.
+        """
+        if self.max_concurrency <= 1:
+            return {}
+        estimator = getattr(agent_pool, "estimate_latency", None)
+        costs = {
+            node_id: 0.0 if node.node_type == NodeType.CONDITIONAL else estimate_cost(estimator, node.step.prompt)
+            for node_id, node in definition.nodes.items()
+        }
+        return critical_path_lengths(definition.order, definition.dependents, costs)
 
 
 def create_tool_result_evaluator(
@@ -0,0 +1,271 @@
+"""Checkpointing of chain runs to artifact storage, for resuming long executions."""
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Type, TypeVar
+
+from pydantic import BaseModel, ConfigDict
+
+from llmaestro.core.models import LLMResponse
+from llmaestro.core.storage import Artifact, ArtifactStorage
+
+if TYPE_CHECKING:
+    from llmaestro.chains.chains import ChainRun
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_CONTENT_TYPE = "chain_checkpoint"
+
+ModelT = TypeVar("ModelT", bound=Type[BaseModel])
+
+# Pydantic models that checkpoints may contain, by tag. Stored data names its model by
+# tag, and only these types are ever rebuilt from it.
+_result_models: Dict[str, Type[BaseModel]] = {}
+_result_models_lock = threading.Lock()
+
+
+def _model_tag(model_type: Type[BaseModel]) -> str:
+    return f"{model_type.__module__}:{model_type.__qualname__}"
+
+
+def register_result_model(model_type: ModelT) -> ModelT:
+    """Allow a pydantic model to be checkpointed as a node result.
+
+    Can be used as a class decorator. ``LLMResponse`` and the response models declared
+    by the steps of a ``ChainGraph`` are registered automatically. Register other models
+    before resuming runs whose results contain them.
+    """
+    if not (isinstance(model_type, type) and issubclass(model_type, BaseModel)):
+        raise TypeError(f"{model_type!r} is not a pydantic model")
+    with _result_models_lock:
+        _result_models[_model_tag(model_type)] = model_type
+    return model_type
+
+
+register_result_model(LLMResponse)
+
+
+class CheckpointMetrics(BaseModel):
+    """Counters describing checkpoint writes."""
+
+    recorded: int = 0
+    written: int = 0
+    coalesced: int = 0
+    failed_writes: int = 0
+    unserializable_results: int = 0
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+def encode_result(value: Any) -> Any:
+    """Encode a node result as JSON-compatible data.
+
+    Pydantic models registered with ``register_result_model`` are tagged with their
+    import path so they can be rebuilt, and map node results are stored element by element.
+
+    Raises:
+        TypeError: If the value cannot be encoded
+    """
+    from llmaestro.chains.chains import MapResult
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [encode_result(item) for item in value]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("Only dicts with string keys can be checkpointed")
+        if "__model__" in value or "__map_result__" in value:
+            raise TypeError("Dict uses a reserved checkpoint key")
+        return {key: encode_result(item) for key, item in value.items()}
+    if isinstance(value, BaseModel):
+        tag = _model_tag(type(value))
+        if _result_models.get(tag) is not type(value):
+            raise TypeError(f"Model {tag} is not registered with register_result_model")
+        return {"__model__": tag, "data": value.model_dump(mode="json")}
+    if isinstance(value, MapResult):
+        return {
+            "__map_result__": [
+                {
+                    "index": element.index,
+                    "item": encode_result(element.item),
+                    "output": encode_result(element.output),
+                    "error": str(element.error) if element.error is not None else None,
+                }
+                for element in value.elements
+            ]
+        }
+    raise TypeError(f"Cannot checkpoint result of type {type(value).__name__}")
+
+
+def decode_result(data: Any) -> Any:
+    """Rebuild a node result encoded by ``encode_result``.
+
+    Models are looked up among the registered result models; no module named by the
+    stored data is imported.
+
+    Raises:
+        TypeError: If the data names a model that is not registered
+    """
+    from llmaestro.chains.chains import MapElementResult, MapResult
+
+    if isinstance(data, list):
+        return [decode_result(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if "__model__" in data:
+        model_type = _result_models.get(data["__model__"])
+        if model_type is None:
+            raise TypeError(f"Checkpointed model {data['__model__']} is not registered with register_result_model")
+        return model_type.model_validate(data["data"])
+    if "__map_result__" in data:
+        return MapResult(
+            elements=[
+                MapElementResult(
+                    index=element["index"],
+                    item=decode_result(element["item"]),
+                    output=decode_result(element["output"]),
+                    error=RuntimeError(element["error"]) if element["error"] is not None else None,
+                )
+                for element in data["__map_result__"]
+            ]
+        )
+    return {key: decode_result(item) for key, item in data.items()}
+
+
+class ChainCheckpointer:
+    """Persists the progress of chain runs to an ``ArtifactStorage`` backend.
+
+    ``record`` snapshots a run and returns immediately; a background writer saves the
+    latest snapshot of each run off the event loop (write-behind). Snapshots of the same
+    run recorded while a write is pending are coalesced into one write. Each node result
+    is encoded once, when it is first recorded.
+
+    In write-behind mode a node's result is only durable once the writer has saved it,
+    so a process that crashes in between runs that node again on resume. With
+    ``write_through``, the chain waits for the checkpoint to be saved after each node
+    completes; nodes already running keep running meanwhile, but no new node starts.
+    """
+
+    def __init__(self, storage: ArtifactStorage, write_through: bool = False):
+        """Initialize the checkpointer.
+
+        Args:
+            storage: Backend the checkpoints are saved to, one artifact per run
+            write_through: Whether chains wait for each completed node to be saved
+        """
+        self.storage = storage
+        self.write_through = write_through
+        self.metrics = CheckpointMetrics()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._encoded: Dict[str, Dict[str, Any]] = {}
+        self._unserializable: Dict[str, Set[str]] = {}
+        self._writer: Optional[asyncio.Task[None]] = None
+
+    @staticmethod
+    def artifact_id(run_id: str) -> str:
+        """Get the ID of the artifact holding a run's checkpoint."""
+        return f"chain-checkpoint-{run_id}"
+
+    def record(self, graph_id: str, run: "ChainRun") -> None:
+        """Snapshot a run and schedule it to be written."""
+        encoded = self._encoded.setdefault(run.run_id, {})
+        skipped = self._unserializable.setdefault(run.run_id, set())
+        for node_id in run.executed:
+            if node_id in encoded or node_id in skipped or node_id not in run.results:
+                continue
+            try:
+                encoded[node_id] = encode_result(run.results[node_id])
+            except TypeError as err:
+                # The node simply runs again on resume
+                logger.warning(f"Not checkpointing result of node {node_id}: {err}")
+                skipped.add(node_id)
+                self.metrics.unserializable_results += 1
+
+        variables = {}
+        for key, value in run.context.variables.items():
+            try:
+                variables[key] = encode_result(value)
+            except TypeError as err:
+                logger.warning(f"Not checkpointing context variable {key}: {err}")
+
+        state = run.context.state
+        snapshot = {
+            "graph_id": graph_id,
+            "run_id": run.run_id,
+            "status": state.status,
+            "executed": [node_id for node_id in run.executed if node_id in encoded],
+            "results": dict(encoded),
+            "failed_steps": sorted(state.failed_steps),
+            "metadata": run.context.metadata.model_dump(mode="json"),
+            "variables": variables,
+        }
+
+        self.metrics.recorded += 1
+        if run.run_id in self._pending:
+            self.metrics.coalesced += 1
+        self._pending[run.run_id] = snapshot
+        if state.status in ("completed", "failed"):
+            self._encoded.pop(run.run_id, None)
+            self._unserializable.pop(run.run_id, None)
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_pending())
+
+    async def flush(self) -> None:
+        """Wait until every recorded snapshot has been written."""
+        while self._writer is not None:
+            await asyncio.shield(self._writer)
+
+    async def load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Load the latest checkpoint of a run, or None if there is none."""
+        await self.flush()
+        artifact = await asyncio.to_thread(self.storage.load_artifact, self.artifact_id(run_id))
+        return artifact.data if artifact is not None else None
+
+    async def delete(self, run_id: str) -> bool:
+        """Delete the checkpoint of a run."""
+        await self.flush()
+        return await asyncio.to_thread(self.storage.delete_artifact, self.artifact_id(run_id))
+
+    async def _write_pending(self) -> None:
+        """Write snapshots until none are pending."""
+        try:
+            while self._pending:
+                run_id = next(iter(self._pending))
+                snapshot = self._pending.pop(run_id)
+                artifact = Artifact(
+                    id=self.artifact_id(run_id),
+                    name=f"checkpoint {run_id}",
+                    content_type=CHECKPOINT_CONTENT_TYPE,
+                    data=snapshot,
+                    metadata={"graph_id": snapshot["graph_id"], "run_id": run_id, "status": snapshot["status"]},
+                )
+                try:
+                    saved = await asyncio.to_thread(self.storage.save_artifact, artifact)
+                except Exception as err:
+                    logger.error(f"Failed to write checkpoint for run {run_id}: {err}")
+                    saved = False
+                if saved:
+                    self.metrics.written += 1
+                else:
+                    self.metrics.failed_writes += 1
+        finally:
+            self._writer = None
+
+
+def restore_run(snapshot: Dict[str, Any]) -> "ChainRun":
+    """Rebuild a chain run from a checkpoint snapshot.
+
+    Nodes recorded in the snapshot keep their results and are not executed again when
+    the run is resumed.
+    """
+    from llmaestro.chains.chains import ChainContext, ChainMetadata, ChainRun, ChainState
+
+    results = {node_id: decode_result(value) for node_id, value in snapshot["results"].items()}
+    state = ChainState(completed_steps=set(results), step_results=dict(results))
+    context = ChainContext(
+        metadata=ChainMetadata.model_validate(snapshot["metadata"]),
+        state=state,
+        variables={key: decode_result(value) for key, value in snapshot["variables"].items()},
+    )
+    return ChainRun(context=context, run_id=snapshot["run_id"], results=results, executed=list(snapshot["executed"]))
@@ -1,11 +1,30 @@
 """Conversation-aware chain system for LLM orchestration."""
 
 import asyncio
-from typing import Any, Dict, List, Optional, cast
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, cast
 from uuid import uuid4
 from pydantic import Field
 
-from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, NodeType, RetryStrategy, ChainStep, ChainMetadata
+from llmaestro.agents.budget import RunBudget
+from llmaestro.chains.chains import (
+    ChainEdge,
+    ChainEvent,
+    ChainGraph,
+    ChainMetadata,
+    ChainNode,
+    ChainStep,
+    NodeTimings,
+    NodeType,
+    RetryStrategy,
+)
+from llmaestro.chains.scheduling import (
+    CriticalPath,
+    ReadyQueue,
+    critical_path_lengths,
+    estimate_cost,
+    realized_critical_path,
+)
 from llmaestro.core.conversations import ConversationGraph
 from llmaestro.core.orchestrator import ExecutionMetadata, Orchestrator
 from llmaestro.prompts.base import BasePrompt
@@ -45,12 +64,23 @@ class ConversationChainNode(ChainNode):
 
 
 class ConversationChain(ChainGraph):
-    """A chain that integrates with the conversation system."""
+    """A chain that integrates with the conversation system.
 
-    def __init__(self, orchestrator: Orchestrator):
-        super().__init__()
-        self.orchestrator = orchestrator
-        self.conversation: Optional[ConversationGraph] = None
+    Nodes are scheduled by dataflow: each node starts as soon as the nodes it depends
+    on have responses, up to ``max_concurrency`` at a time, so one slow node only delays
+    its own dependents. Ready nodes with the longest estimated downstream critical path
+    start first.
+    """
+
+    orchestrator: Orchestrator
+    conversation: Optional[ConversationGraph] = None
+    max_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Maximum nodes running at once (defaults to the agent pool's concurrency)"
+    )
+    critical_path: Optional[CriticalPath] = Field(default=None, description="Critical path of the latest execution")
+
+    def __init__(self, orchestrator: Orchestrator, **data: Any):
+        super().__init__(orchestrator=orchestrator, **data)
 
     async def initialize(
         self, name: str, initial_prompt: BasePrompt, metadata: Optional[Dict[str, Any]] = None
@@ -84,8 +114,8 @@ class ConversationChain(ChainGraph):
 
         return node_id
 
-    async def execute_node(self, node_id: str) -> str:
-        """Execute a single node in the chain."""
+    async def execute_node(self, node_id: str, budget: Optional[RunBudget] = None) -> str:
+        """Execute a single node in the chain, charging its request to ``budget`` if given."""
         if not self.conversation:
             raise ValueError("Chain not initialized with conversation")
 
@@ -107,7 +137,10 @@ class ConversationChain(ChainGraph):
 
         # Execute in conversation
         response_id = await self.orchestrator.execute_prompt(
-            conversation=self.conversation, prompt=node.prompt, dependencies=dependencies if dependencies else None
+            conversation=self.conversation,
+            prompt=node.prompt,
+            dependencies=dependencies if dependencies else None,
+            budget=budget,
         )
 
         # Update node with conversation references
@@ -116,29 +149,77 @@ class ConversationChain(ChainGraph):
 
         return response_id
 
-    async def execute(self) -> Dict[str, str]:
+    async def execute(self, budget: Optional[RunBudget] = None) -> Dict[str, str]:
         """Execute the entire chain.
 
+        Args:
+            budget: Optional token and cost budget for the chain's requests
+                (defaults to the orchestrator's budget)
+
         Returns:
             Dict mapping chain node IDs to conversation response node IDs
         """
-        if not self.conversation:
-            raise ValueError("Chain not initialized with conversation")
+        return {event.node_id: event.result async for event in self.execute_stream(budget)}
 
-        results: Dict[str, str] = {}
-        execution_order = self.get_execution_order()
+    async def execute_stream(  # type: ignore[override]
+        self, budget: Optional[RunBudget] = None
+    ) -> AsyncIterator[ChainEvent]:
+        """Execute the entire chain, yielding each node's response node ID as soon as it completes.
 
-        # Execute nodes level by level
-        for level in execution_order:
-            # Execute nodes in current level in parallel
-            level_tasks = [self.execute_node(node_id) for node_id in level]
-            level_results = await asyncio.gather(*level_tasks)
+        A node starts once all of its dependencies have completed. When more nodes are
+        ready than ``max_concurrency`` allows, the ones with the longest estimated
+        remaining critical path start first. Closing the iterator early, or a node
+        failing, cancels the nodes still running. The realized critical path is stored in
+        ``critical_path`` when execution ends.
 
-            # Store results
-            for node_id, response_id in zip(level, level_results, strict=False):
-                results[node_id] = response_id
+        Args:
+            budget: Optional token and cost budget for the chain's requests
+                (defaults to the orchestrator's budget)
+
+        Yields:
+            Completion events carrying conversation response node IDs
+        """
+        if not self.conversation:
+            raise ValueError("Chain not initialized with conversation")
 
-        return results
+        definition = self.compile()
+        agent_pool = self.orchestrator.agent_pool
+        limit = self.max_concurrency or getattr(agent_pool, "max_concurrency", None)
+        estimator = getattr(agent_pool, "estimate_latency", None)
+        costs = {
+            node_id: estimate_cost(estimator, node.prompt)
+            for node_id, node in definition.nodes.items()
+            if isinstance(node, ConversationChainNode)
+        }
+        ready = ReadyQueue(critical_path_lengths(definition.order, definition.dependents, costs))
+        unresolved = {node_id: len(deps) for node_id, deps in definition.dependencies.items()}
+        timings = {node_id: NodeTimings(queued=time.monotonic()) for node_id in definition.roots}
+        for root in definition.roots:
+            ready.push(root)
+        running: Dict[asyncio.Task[str], str] = {}
+
+        try:
+            while ready or running:
+                while ready and (not limit or len(running) < limit):
+                    node_id = ready.pop()
+                    timings[node_id].started = time.monotonic()
+                    running[asyncio.create_task(self.execute_node(node_id, budget))] = node_id
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node_id = running.pop(task)
+                    timings[node_id].finished = time.monotonic()
+                    response_id = task.result()
+                    for dependent in definition.dependents[node_id]:
+                        unresolved[dependent] -= 1
+                        if not unresolved[dependent]:
+                            timings[dependent] = NodeTimings(queued=time.monotonic())
+                            ready.push(dependent)
+                    yield ChainEvent(node_id=node_id, result=response_id, timings=timings[node_id])
+        finally:
+            for task in running:
+                task.cancel()
+            self.critical_path = realized_critical_path(definition.dependencies, timings)
 
     def get_node_status(self, node_id: str) -> ExecutionMetadata:
         """Get the execution status of a node."""
@@ -0,0 +1,266 @@
+"""Map-reduce over documents larger than a model's context window."""
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.agents.budget import RunBudget, use_budget
+from llmaestro.chains.chains import (
+    ChainContext,
+    ChainStep,
+    MapElementResult,
+    MapFailurePolicy,
+    MapNode,
+    RetryStrategy,
+)
+from llmaestro.core.models import LLMResponse
+from llmaestro.llm.chunking import TextChunk, TextChunker
+from llmaestro.llm.interfaces.tokenizers import BaseTokenizer
+from llmaestro.prompts.base import BasePrompt
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MapReduceResult:
+    """Outcome of a map-reduce run."""
+
+    output: Any
+    chunk_count: int
+    levels: int
+    failures: List[MapElementResult] = field(default_factory=list)
+
+
+def response_text(response: LLMResponse) -> str:
+    """Get the content of a successful response, raising so failed responses are retried."""
+    if not response.success:
+        raise RuntimeError(response.error or "LLM request failed")
+    return response.content
+
+
+class MapReduce:
+    """Summarize or extract from a document in token-bounded chunks, then combine the results.
+
+    The document is split into chunks that fit the map prompt's model (see ``TextChunker``)
+    and each chunk is substituted for ``{item}`` in ``map_prompt``; chunks are pulled lazily
+    and run through the agent pool concurrently. The map outputs are then packed, in document
+    order and joined by ``separator``, into groups that fit the reduce prompt's context window,
+    and each group is substituted for ``{item}`` in ``reduce_prompt``. Groups are reduced
+    concurrently, level by level, until a single group produces the final output.
+
+    Only chunk outputs are held in memory, so inputs far larger than memory can be processed
+    from a file or any stream of text blocks.
+    """
+
+    def __init__(
+        self,
+        agent_pool: AgentPool,
+        map_prompt: BasePrompt,
+        reduce_prompt: BasePrompt,
+        chunk_tokens: Optional[int] = None,
+        overlap_tokens: int = 0,
+        max_concurrency: Optional[int] = None,
+        max_context_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None,
+        tokenizer: Optional[BaseTokenizer] = None,
+        separator: str = "\n\n",
+        retry_strategy: Optional[RetryStrategy] = None,
+        failure_policy: MapFailurePolicy = MapFailurePolicy.FAIL_FAST,
+    ):
+        """Initialize the map-reduce engine.
+
+        Args:
+            agent_pool: Pool that executes the map and reduce prompts
+            map_prompt: Prompt applied to each chunk, with an ``{item}`` placeholder
+            reduce_prompt: Prompt combining a group of outputs, with an ``{item}`` placeholder
+            chunk_tokens: Tokens per chunk; defaults to all the room the map prompt's model leaves
+            overlap_tokens: Tokens shared by consecutive chunks
+            max_concurrency: Maximum requests in flight per phase; defaults to MapNode's default
+            max_context_tokens: Context window to plan for; defaults to the routed model's window
+            output_tokens: Tokens reserved for each response; defaults to the model's ``max_tokens``
+            tokenizer: Tokenizer to count with; defaults to the pool's tokenizer for the model
+            separator: Text placed between outputs in a reduce group
+            retry_strategy: Per-request retry strategy for both phases
+            failure_policy: Whether a chunk that keeps failing aborts the run or is skipped.
+                A failed reduce group always aborts the run.
+        """
+        self.agent_pool = agent_pool
+        self.map_prompt = map_prompt
+        self.reduce_prompt = reduce_prompt
+        self.chunk_tokens = chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.max_context_tokens = max_context_tokens
+        self.output_tokens = output_tokens
+        self.tokenizer = tokenizer
+        self.separator = separator
+
+        retry_strategy = retry_strategy or RetryStrategy()
+        options = {} if max_concurrency is None else {"max_concurrency": max_concurrency}
+        self.map_node = MapNode(
+            id="map",
+            step=ChainStep(prompt=map_prompt, output_transform=response_text, retry_strategy=retry_strategy),
+            failure_policy=failure_policy,
+            **options,
+        )
+        self.reduce_node = MapNode(
+            id="reduce",
+            step=ChainStep(prompt=reduce_prompt, output_transform=response_text, retry_strategy=retry_strategy),
+            **options,
+        )
+
+    async def run(
+        self, source: Union[str, Path, Iterable[str]], budget: Optional[RunBudget] = None
+    ) -> MapReduceResult:
+        """Map over every chunk of a document and reduce the outputs to one result.
+
+        Args:
+            source: The document text, a path to a text or PDF file, or an iterable of text blocks
+            budget: Optional budget charged for every request of the run
+
+        Returns:
+            The final reduce output with run statistics
+
+        Raises:
+            ValueError: If the input is empty or the prompts leave no room for content
+            RuntimeError: If a request keeps failing, or reducing stops shrinking the outputs
+        """
+        with use_budget(budget):
+            chunker = self.create_chunker()
+            if isinstance(source, Path):
+                chunks = chunker.split_file(source)
+            elif isinstance(source, str):
+                chunks = chunker.split(source)
+            else:
+                chunks = chunker.split_stream(source)
+
+            outputs, chunk_count, failures = await self._map(chunks)
+            if not outputs:
+                if chunk_count == 0:
+                    raise ValueError("Cannot map-reduce an empty document")
+                raise RuntimeError(f"All {chunk_count} chunks failed")
+
+            output, levels = await self._reduce(outputs)
+            return MapReduceResult(output=output, chunk_count=chunk_count, levels=levels, failures=failures)
+
+    def create_chunker(self) -> TextChunker:
+        """Create the chunker that splits documents for the map prompt."""
+        tokenizer, capacity = self._plan(self.map_prompt)
+        if self.chunk_tokens is not None:
+            capacity = min(capacity, self.chunk_tokens)
+        return TextChunker(tokenizer, capacity, overlap_tokens=self.overlap_tokens)
+
+    async def _map(self, chunks: Iterator[TextChunk]) -> Tuple[List[str], int, List[MapElementResult]]:
+        """Run the map prompt over every chunk, keeping only the outputs, in document order."""
+        outputs: List[Tuple[int, str]] = []
+        failures: List[MapElementResult] = []
+        chunk_count = 0
+
+        def texts() -> Iterator[str]:
+            nonlocal chunk_count
+            for chunk in chunks:
+                chunk_count += 1
+                yield chunk.text
+
+        elements = self.map_node.stream(self.agent_pool, ChainContext(), texts())
+        try:
+            async for element in elements:
+                if element.success:
+                    outputs.append((element.index, element.output))
+                elif self.map_node.failure_policy == MapFailurePolicy.FAIL_FAST:
+                    raise RuntimeError(f"Chunk {element.index} failed: {element.error}") from element.error
+                else:
+                    logger.warning(f"Skipped chunk {element.index}: {element.error}")
+                    failures.append(element)
+        finally:
+            await elements.aclose()
+
+        outputs.sort()
+        return [output for _, output in outputs], chunk_count, failures
+
+    async def _reduce(self, outputs: List[str]) -> Tuple[Any, int]:
+        """Reduce outputs level by level until a single group remains.
+
+        Returns:
+            The final output and the number of reduce levels
+        """
+        tokenizer, capacity = self._plan(self.reduce_prompt)
+        chunker = TextChunker(tokenizer, capacity)
+        levels = 0
+        previous_groups: Optional[int] = None
+        while True:
+            groups = self._group(outputs, tokenizer, chunker)
+            if previous_groups is not None and len(groups) >= previous_groups:
+                raise RuntimeError(
+                    f"Reduce level {levels} did not shrink {previous_groups} groups; the reduce prompt's "
+                    "responses are too long for its context window"
+                )
+            previous_groups = len(groups)
+            levels += 1
+            logger.debug(f"Reduce level {levels}: {len(outputs)} outputs in {len(groups)} groups")
+
+            reduced: List[Tuple[int, Any]] = []
+            elements = self.reduce_node.stream(self.agent_pool, ChainContext(), groups)
+            try:
+                async for element in elements:
+                    if not element.success:
+                        raise RuntimeError(f"Reduce level {levels} failed: {element.error}") from element.error
+                    reduced.append((element.index, element.output))
+            finally:
+                await elements.aclose()
+            reduced.sort(key=lambda pair: pair[0])
+
+            if len(groups) == 1:
+                return reduced[0][1], levels
+            outputs = [str(output) for _, output in reduced]
+
+    def _group(self, outputs: List[str], tokenizer: BaseTokenizer, chunker: TextChunker) -> List[str]:
+        """Pack outputs in order into groups that fit the reduce prompt, splitting any that alone do not."""
+        groups: List[str] = []
+        current: List[str] = []
+        current_tokens = 0
+        separator_tokens = tokenizer.count_tokens(self.separator)
+
+        for output in outputs:
+            tokens = tokenizer.count_tokens(output)
+            if tokens > chunker.max_tokens:
+                if current:
+                    groups.append(self.separator.join(current))
+                    current, current_tokens = [], 0
+                groups.extend(chunk.text for chunk in chunker.split(output))
+                continue
+            added = tokens + (separator_tokens if current else 0)
+            if current and current_tokens + added > chunker.max_tokens:
+                groups.append(self.separator.join(current))
+                current, current_tokens, added = [], 0, tokens
+            current.append(output)
+            current_tokens += added
+
+        if current:
+            groups.append(self.separator.join(current))
+        return groups
+
+    def _plan(self, prompt: BasePrompt) -> Tuple[BaseTokenizer, int]:
+        """Get the tokenizer for a prompt and the tokens left for its ``{item}`` content.
+
+        Raises:
+            ValueError: If the prompt and its response leave no room for content
+        """
+        state = self.agent_pool.get_model_state(prompt)
+        model_name = state.profile.name
+        tokenizer = self.tokenizer or self.agent_pool.get_tokenizer(model_name)
+        context_tokens = self.max_context_tokens or state.profile.capabilities.max_context_window
+        output_tokens = self.output_tokens if self.output_tokens is not None else state.runtime_config.max_tokens
+
+        system_prompt, user_prompt = prompt.system_prompt.format(item=""), prompt.user_prompt.format(item="")
+        template_tokens = tokenizer.count_messages(
+            [{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}]
+        )
+
+        capacity = context_tokens - output_tokens - template_tokens
+        if capacity < 1:
+            raise ValueError(
+                f"Prompt {prompt.name} leaves no room for content: {context_tokens} context tokens, "
+                f"{output_tokens} reserved for output, {template_tokens} used by the template"
+            )
+        return tokenizer, capacity
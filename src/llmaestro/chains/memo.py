@@ -0,0 +1,235 @@
+"""Content-addressed memoization of chain node results across runs and chains."""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict
+
+from llmaestro.chains.checkpoint import decode_result, encode_result
+from llmaestro.prompts.base import BasePrompt
+
+_MISSING = object()
+
+
+class NodeCacheStats(BaseModel):
+    """Counters describing node result cache behaviour."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    uncacheable: int = 0
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def node_cache_key(
+    prompt: BasePrompt,
+    dependency_results: Dict[str, Any],
+    model: Optional[str] = None,
+    parameters: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """Compute the content address of a node execution.
+
+    The key covers the rendered prompt (including its expected response format and
+    tools), the model, extra step parameters and the content of every dependency
+    result, so identical work in different runs or chains maps to the same key.
+
+    Returns:
+        A SHA-256 hex digest, or None if some input cannot be encoded deterministically
+    """
+    try:
+        payload = {
+            "system_prompt": prompt.system_prompt,
+            "user_prompt": prompt.user_prompt,
+            "expected_response": prompt.expected_response.model_dump(mode="json", exclude={"pydantic_model"})
+            if prompt.expected_response
+            else None,
+            "examples": prompt.examples,
+            "tools": sorted(tool.name for tool in prompt.tools),
+            "attachments": [attachment.model_dump(mode="json") for attachment in prompt.attachments],
+            "model": model,
+            "parameters": encode_result(parameters or {}),
+            "dependencies": {dep_id: encode_result(result) for dep_id, result in sorted(dependency_results.items())},
+        }
+        if prompt.expected_response and prompt.expected_response.pydantic_model:
+            model_type = prompt.expected_response.pydantic_model
+            payload["pydantic_model"] = f"{model_type.__module__}:{model_type.__qualname__}"
+        canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class NodeResultCache:
+    """Base class defining the interface for node result caches."""
+
+    def __init__(self) -> None:
+        self.stats = NodeCacheStats()
+
+    def get(self, key: str) -> Any:
+        """Look up a cached result.
+
+        Returns:
+            The cached result, or the module's missing sentinel (see ``is_miss``)
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, node_id: str, value: Any) -> None:
+        """Store a node result."""
+        raise NotImplementedError
+
+    def invalidate(self, key: Optional[str] = None, node_id: Optional[str] = None) -> int:
+        """Drop one entry by key, every entry produced by a node ID, or everything when neither is given.
+
+        Returns:
+            Number of entries removed
+        """
+        raise NotImplementedError
+
+    async def aget(self, key: str) -> Any:
+        """Look up a cached result from async code; caches doing blocking I/O run it off the event loop."""
+        return self.get(key)
+
+    async def aset(self, key: str, node_id: str, value: Any) -> None:
+        """Store a node result from async code; caches doing blocking I/O run it off the event loop."""
+        self.set(key, node_id, value)
+
+    @staticmethod
+    def is_miss(value: Any) -> bool:
+        """Check whether a value returned by ``get`` is a cache miss."""
+        return value is _MISSING
+
+
+class MemoryNodeCache(NodeResultCache):
+    """In-process LRU cache of node results."""
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept
+        """
+        super().__init__()
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def set(self, key: str, node_id: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (node_id, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self.stats.stores += 1
+
+    def invalidate(self, key: Optional[str] = None, node_id: Optional[str] = None) -> int:
+        with self._lock:
+            if key is None and node_id is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            doomed = [
+                entry_key
+                for entry_key, (entry_node, _) in self._entries.items()
+                if entry_key == key or (node_id is not None and entry_node == node_id)
+            ]
+            for entry_key in doomed:
+                del self._entries[entry_key]
+            return len(doomed)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteNodeCache(NodeResultCache):
+    """Node result cache persisted in a SQLite database, shared across processes.
+
+    Results are stored in the checkpoint encoding, so JSON data, pydantic models and
+    map results are supported; other results are not cached.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initialize the cache.
+
+        Args:
+            path: Database file (created if missing), or ":memory:"
+        """
+        super().__init__()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS node_results "
+                "(key TEXT PRIMARY KEY, node_id TEXT NOT NULL, value TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS node_results_node_id ON node_results (node_id)")
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            row = self._connection.execute("SELECT value FROM node_results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.stats.misses += 1
+            return _MISSING
+        self.stats.hits += 1
+        return decode_result(json.loads(row[0]))
+
+    def set(self, key: str, node_id: str, value: Any) -> None:
+        try:
+            encoded = json.dumps(encode_result(value))
+        except TypeError:
+            self.stats.uncacheable += 1
+            return
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO node_results (key, node_id, value, created_at) VALUES (?, ?, ?, ?)",
+                (key, node_id, encoded, time.time()),
+            )
+        self.stats.stores += 1
+
+    async def aget(self, key: str) -> Any:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, node_id: str, value: Any) -> None:
+        await asyncio.to_thread(self.set, key, node_id, value)
+
+    def invalidate(self, key: Optional[str] = None, node_id: Optional[str] = None) -> int:
+        with self._lock, self._connection:
+            if key is None and node_id is None:
+                cursor = self._connection.execute("DELETE FROM node_results")
+            else:
+                cursor = self._connection.execute(
+                    "DELETE FROM node_results WHERE key = ? OR node_id = ?", (key, node_id)
+                )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM node_results").fetchone()[0]
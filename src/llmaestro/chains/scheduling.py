@@ -0,0 +1,124 @@
+"""Critical-path scheduling helpers for chain execution."""
+import heapq
+import itertools
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from llmaestro.chains.chains import NodeTimings
+
+
+@dataclass
+class CriticalPath:
+    """The chain of dependent nodes that determined a run's wall time.
+
+    The path is traced back from the last node to finish, at each step following the
+    dependency that finished last (the one the node was waiting for).
+    """
+
+    nodes: List[str]
+    duration: float
+    node_durations: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def waiting(self) -> float:
+        """Seconds on the path spent waiting for a free slot rather than executing."""
+        return max(0.0, self.duration - sum(self.node_durations.values()))
+
+
+class ReadyQueue:
+    """Ready nodes ordered by descending priority, first-come first-served among equals."""
+
+    def __init__(self, priorities: Optional[Mapping[str, float]] = None):
+        """Initialize the queue.
+
+        Args:
+            priorities: Priority per node ID; missing nodes have priority 0
+        """
+        self._priorities = priorities or {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._counter = itertools.count()
+
+    def push(self, node_id: str) -> None:
+        heapq.heappush(self._heap, (-self._priorities.get(node_id, 0.0), next(self._counter), node_id))
+
+    def pop(self) -> str:
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+def critical_path_lengths(
+    order: Sequence[str], dependents: Mapping[str, Sequence[str]], costs: Mapping[str, float]
+) -> Dict[str, float]:
+    """Compute each node's remaining critical-path length.
+
+    The length of a node is its own estimated cost plus the longest length among its
+    dependents, i.e. the least time the work from that node to the end of the chain can take.
+
+    Args:
+        order: Node IDs in topological order
+        dependents: Direct dependents of each node
+        costs: Estimated cost of each node
+
+    Returns:
+        Remaining critical-path length per node ID
+    """
+    lengths: Dict[str, float] = {}
+    for node_id in reversed(order):
+        downstream = max((lengths[dependent] for dependent in dependents[node_id]), default=0.0)
+        lengths[node_id] = costs.get(node_id, 0.0) + downstream
+    return lengths
+
+
+def estimate_cost(estimator: Optional[Callable[[Any], Any]], prompt: Any) -> float:
+    """Estimate the cost of running a prompt, falling back to a unit cost.
+
+    Args:
+        estimator: Typically ``AgentPool.estimate_latency``
+        prompt: The prompt to estimate
+
+    Returns:
+        Estimated seconds, or 1.0 when no estimate is available
+    """
+    if estimator is None:
+        return 1.0
+    try:
+        return float(estimator(prompt))
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def realized_critical_path(
+    dependencies: Mapping[str, Sequence[str]], timings: Mapping[str, "NodeTimings"]
+) -> Optional[CriticalPath]:
+    """Trace the critical path of a finished (or failed) run from its node timings.
+
+    Args:
+        dependencies: Direct dependencies of each node
+        timings: Timings recorded for the nodes that ran
+
+    Returns:
+        The critical path, or None if no node finished
+    """
+    finished = {node_id: timing for node_id, timing in timings.items() if timing.finished is not None}
+    if not finished:
+        return None
+
+    node_id = max(finished, key=lambda candidate: finished[candidate].finished or 0.0)
+    end = finished[node_id].finished or 0.0
+    path = [node_id]
+    while True:
+        upstream = [dep_id for dep_id in dependencies.get(node_id, ()) if dep_id in finished]
+        if not upstream:
+            break
+        node_id = max(upstream, key=lambda candidate: finished[candidate].finished or 0.0)
+        path.append(node_id)
+    path.reverse()
+
+    return CriticalPath(
+        nodes=path,
+        duration=end - finished[path[0]].queued,
+        node_durations={node_id: finished[node_id].duration or 0.0 for node_id in path},
+    )
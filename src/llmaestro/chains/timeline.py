@@ -0,0 +1,206 @@
+"""Execution timelines of chain and conversation runs, for finding latency bottlenecks."""
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from llmaestro.chains.chains import ChainGraph, ChainRun, NodeTimings
+from llmaestro.chains.scheduling import CriticalPath, realized_critical_path
+from llmaestro.core.conversations import ConversationGraph
+from llmaestro.prompts.base import BasePrompt
+
+
+@dataclass
+class TimelineEntry:
+    """One node's execution on a timeline."""
+
+    node_id: str
+    label: str
+    timings: NodeTimings
+    dependencies: Tuple[str, ...] = ()
+    status: str = "completed"
+
+
+@dataclass
+class ExecutionTimeline:
+    """Per-node timings of one run, with analyses of where its wall time went.
+
+    All offsets reported by the analyses are seconds since the first node was queued.
+    """
+
+    entries: List[TimelineEntry]
+    # Whether node timings record first-token times and retries; conversation runs track neither
+    attempt_details: bool = True
+
+    @classmethod
+    def from_run(cls, graph: ChainGraph, run: ChainRun) -> "ExecutionTimeline":
+        """Build the timeline of a chain run."""
+        definition = graph.compile()
+        failed = run.context.state.failed_steps
+        entries = []
+        for node_id, timings in run.timings.items():
+            node = definition.nodes[node_id]
+            if node_id in failed:
+                status = "failed"
+            else:
+                status = "completed" if timings.finished is not None else "running"
+            entries.append(
+                TimelineEntry(
+                    node_id=node_id,
+                    label=node.step.prompt.name,
+                    timings=timings,
+                    dependencies=tuple(dep for dep in definition.dependencies[node_id] if dep in run.timings),
+                    status=status,
+                )
+            )
+        return cls(entries=entries)
+
+    @classmethod
+    def from_conversation(cls, conversation: ConversationGraph) -> "ExecutionTimeline":
+        """Build the timeline of the prompts an orchestrator executed in a conversation.
+
+        Dependencies on earlier responses are mapped back to the prompts that produced them.
+        Orchestrator executions record no first-token times or retry counts, so the
+        timeline omits them.
+        """
+        prompt_of_response = {
+            edge.target_id: edge.source_id for edge in conversation.edges if edge.edge_type == "response_to"
+        }
+        entries = []
+        for node_id, node in conversation.nodes.items():
+            execution = node.metadata.get("execution") or {}
+            if execution.get("queued_monotonic") is None:
+                continue
+            timings = NodeTimings(
+                queued=execution["queued_monotonic"],
+                started=execution.get("started_monotonic"),
+                finished=execution.get("finished_monotonic"),
+            )
+            dependencies = tuple(
+                prompt_of_response.get(dep_id, dep_id) for dep_id in execution.get("dependencies", [])
+            )
+            entries.append(
+                TimelineEntry(
+                    node_id=node_id,
+                    label=node.content.name if isinstance(node.content, BasePrompt) else node_id,
+                    timings=timings,
+                    dependencies=dependencies,
+                    status=execution.get("status", "pending"),
+                )
+            )
+        return cls(entries=entries, attempt_details=False)
+
+    @property
+    def origin(self) -> Optional[float]:
+        """Monotonic time the first node was queued."""
+        return min((entry.timings.queued for entry in self.entries), default=None)
+
+    @property
+    def makespan(self) -> float:
+        """Seconds from the first node being queued to the last node finishing."""
+        finished = [entry.timings.finished for entry in self.entries if entry.timings.finished is not None]
+        origin = self.origin
+        if origin is None or not finished:
+            return 0.0
+        return max(finished) - origin
+
+    def critical_path(self) -> Optional[CriticalPath]:
+        """Get the chain of dependent nodes that determined the wall time."""
+        return realized_critical_path(
+            {entry.node_id: entry.dependencies for entry in self.entries},
+            {entry.node_id: entry.timings for entry in self.entries},
+        )
+
+    def concurrency(self) -> List[Tuple[float, int]]:
+        """Get the number of nodes executing over time.
+
+        Returns:
+            (offset, running) steps: from each offset until the next, ``running`` nodes were executing
+        """
+        origin = self.origin
+        if origin is None:
+            return []
+        changes: Dict[float, int] = {}
+        for entry in self.entries:
+            timings = entry.timings
+            if timings.started is None or timings.finished is None:
+                continue
+            changes[timings.started - origin] = changes.get(timings.started - origin, 0) + 1
+            changes[timings.finished - origin] = changes.get(timings.finished - origin, 0) - 1
+
+        steps = []
+        running = 0
+        for offset in sorted(changes):
+            running += changes[offset]
+            steps.append((offset, running))
+        return steps
+
+    @property
+    def peak_concurrency(self) -> int:
+        """Most nodes executing at the same time."""
+        return max((running for _, running in self.concurrency()), default=0)
+
+    @property
+    def average_concurrency(self) -> float:
+        """Mean number of nodes executing over the makespan."""
+        makespan = self.makespan
+        busy = sum(entry.timings.duration or 0.0 for entry in self.entries)
+        return busy / makespan if makespan else 0.0
+
+    def idle_gaps(self, min_duration: float = 0.0) -> List[Tuple[float, float]]:
+        """Get the intervals during which no node was executing.
+
+        Args:
+            min_duration: Ignore gaps shorter than this many seconds
+
+        Returns:
+            (start offset, end offset) of each gap, in order
+        """
+        gaps = []
+        idle_since: Optional[float] = 0.0
+        for offset, running in self.concurrency():
+            if running and idle_since is not None:
+                if offset - idle_since > min_duration:
+                    gaps.append((idle_since, offset))
+                idle_since = None
+            elif not running and idle_since is None:
+                idle_since = offset
+        return gaps
+
+    def to_gantt(self) -> Dict[str, Any]:
+        """Export the timeline and its analyses as Gantt chart data."""
+        origin = self.origin or 0.0
+        critical_path = self.critical_path()
+        critical = set(critical_path.nodes) if critical_path else set()
+
+        def offset(value: Optional[float]) -> Optional[float]:
+            return value - origin if value is not None else None
+
+        tasks = []
+        for entry in sorted(self.entries, key=lambda entry: (entry.timings.started or entry.timings.queued)):
+            task = {
+                "id": entry.node_id,
+                "label": entry.label,
+                "status": entry.status,
+                "dependencies": list(entry.dependencies),
+                "queued": offset(entry.timings.queued),
+                "started": offset(entry.timings.started),
+                "finished": offset(entry.timings.finished),
+                "critical": entry.node_id in critical,
+            }
+            if self.attempt_details:
+                task["first_token"] = offset(entry.timings.first_token)
+                task["retries"] = entry.timings.retries
+            tasks.append(task)
+        return {
+            "makespan": self.makespan,
+            "critical_path": critical_path.nodes if critical_path else [],
+            "critical_path_waiting": critical_path.waiting if critical_path else 0.0,
+            "peak_concurrency": self.peak_concurrency,
+            "average_concurrency": self.average_concurrency,
+            "idle_gaps": [list(gap) for gap in self.idle_gaps()],
+            "tasks": tasks,
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Export the Gantt chart data as JSON."""
+        return json.dumps(self.to_gantt(), indent=indent)
@@ -1,12 +1,14 @@
 """Orchestration layer for managing LLM conversations and execution."""
 
 import asyncio
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, Callable, Awaitable
 from uuid import uuid4
 
 from pydantic import BaseModel
 
+from llmaestro.agents.budget import RunBudget, use_budget
 from llmaestro.core.conversations import ConversationGraph, ConversationNode
 from llmaestro.core.models import LLMResponse
 from llmaestro.prompts.base import BasePrompt
@@ -24,13 +26,24 @@ class ExecutionMetadata(BaseModel):
     error: Optional[str] = None
     parallel_group: Optional[str] = None
     dependencies: List[str] = []
+    # Monotonic timestamps (time.monotonic()) for latency analysis
+    queued_monotonic: Optional[float] = None
+    started_monotonic: Optional[float] = None
+    finished_monotonic: Optional[float] = None
 
 
 class Orchestrator:
     """Manages LLM conversation execution and resource coordination."""
 
-    def __init__(self, agent_pool: "AgentPool"):
+    def __init__(self, agent_pool: "AgentPool", budget: Optional[RunBudget] = None):
+        """Initialize the orchestrator.
+
+        Args:
+            agent_pool: Pool that executes prompts
+            budget: Optional token and cost budget for every prompt the orchestrator executes
+        """
         self.agent_pool = agent_pool
+        self.budget = budget
         self.active_conversations: Dict[str, ConversationGraph] = {}
         self.active_conversation_id: Optional[str] = None
 
@@ -40,6 +53,9 @@ class Orchestrator:
         self.node_added_callback: Optional[Callable[[str, str], Awaitable[None]]] = None
         self.node_updated_callback: Optional[Callable[[str, str], Awaitable[None]]] = None
 
+        # Completion signals for nodes that someone is waiting on, keyed by node ID
+        self._completion_events: Dict[str, asyncio.Event] = {}
+
     def on_conversation_created(self, handler: Callable[[ConversationGraph], Awaitable[None]]) -> None:
         """Register a handler for conversation creation events."""
         self.conversation_created_callback = handler
@@ -72,7 +88,13 @@ class Orchestrator:
             await self.node_added_callback(conversation_id, node_id)
 
     async def _notify_node_updated(self, conversation_id: str, node_id: str) -> None:
-        """Notify callback of node update."""
+        """Notify callback of node update and wake tasks waiting for the node to finish."""
+        conversation = self.active_conversations.get(conversation_id)
+        node = conversation.nodes.get(node_id) if conversation else None
+        if node is not None and node.metadata.get("execution", {}).get("status") in ("completed", "failed"):
+            event = self._completion_events.pop(node_id, None)
+            if event is not None:
+                event.set()
         if self.node_updated_callback:
             await self.node_updated_callback(conversation_id, node_id)
 
@@ -175,13 +197,23 @@ class Orchestrator:
         prompt: BasePrompt,
         dependencies: Optional[List[str]] = None,
         parallel_group: Optional[str] = None,
+        budget: Optional[RunBudget] = None,
     ) -> str:
-        """Execute a prompt and add it to the conversation."""
+        """Execute a prompt and add it to the conversation.
+
+        The prompt's request is charged to ``budget``, or to the orchestrator's budget
+        when none is given. A request that does not fit fails the prompt node with
+        ``BudgetExceededError``.
+        """
         conversation = self._get_conversation(conversation)
 
         # Create execution metadata
         exec_metadata = ExecutionMetadata(
-            status="pending", started_at=datetime.now(), parallel_group=parallel_group, dependencies=dependencies or []
+            status="pending",
+            started_at=datetime.now(),
+            parallel_group=parallel_group,
+            dependencies=dependencies or [],
+            queued_monotonic=time.monotonic(),
         )
 
         # Add prompt node
@@ -202,10 +234,12 @@ class Orchestrator:
             # Update status
             node = conversation.nodes[prompt_node_id]
             node.metadata["execution"]["status"] = "running"
+            node.metadata["execution"]["started_monotonic"] = time.monotonic()
             await self._notify_node_updated(conversation.id, prompt_node_id)
 
             # Execute prompt
-            response = await self.agent_pool.execute_prompt(prompt)
+            with use_budget(budget or self.budget):
+                response = await self.agent_pool.execute_prompt(prompt)
 
             # Add response node
             response_node_id = conversation.add_conversation_node(
@@ -225,6 +259,7 @@ class Orchestrator:
             )
 
             # Update prompt node status
+            node.metadata["execution"]["finished_monotonic"] = time.monotonic()
             node.metadata["execution"]["status"] = "completed"
             node.metadata["execution"]["completed_at"] = datetime.now()
             await self._notify_node_updated(conversation.id, prompt_node_id)
@@ -235,6 +270,7 @@ class Orchestrator:
         except Exception as e:
             # Update status on error
             node = conversation.nodes[prompt_node_id]
+            node.metadata["execution"]["finished_monotonic"] = time.monotonic()
             node.metadata["execution"]["status"] = "failed"
             node.metadata["execution"]["error"] = str(e)
             await self._notify_node_updated(conversation.id, prompt_node_id)
@@ -253,39 +289,70 @@ class Orchestrator:
         conversation: Union[str, ConversationGraph, ConversationNode],
         prompts: List[BasePrompt],
         max_parallel: Optional[int] = None,
+        budget: Optional[RunBudget] = None,
     ) -> List[str]:
-        """Execute multiple prompts in parallel."""
+        """Execute multiple prompts in parallel.
+
+        At most ``max_parallel`` prompts run at once. When they cannot all run together,
+        the prompts with the longest estimated latency start first so they do not finish
+        last as stragglers. Response node IDs are returned in the order of ``prompts``.
+        All prompts are charged to ``budget`` (or the orchestrator's budget).
+        """
         conversation = self._get_conversation(conversation)
         group_id = str(uuid4())
 
         # Create semaphore for parallel execution control
-        max_parallel = max_parallel or len(prompts)
-
-        # Execute prompts in parallel with controlled concurrency
-        async with asyncio.Semaphore(max_parallel):
-            tasks = [
-                self.execute_prompt(conversation=conversation, prompt=prompt, parallel_group=group_id)
-                for prompt in prompts
-            ]
-            response_ids = await asyncio.gather(*tasks)
+        semaphore = asyncio.Semaphore(max_parallel or len(prompts) or 1)
+
+        async def run(prompt: BasePrompt) -> str:
+            async with semaphore:
+                return await self.execute_prompt(
+                    conversation=conversation, prompt=prompt, parallel_group=group_id, budget=budget
+                )
+
+        # Waiters acquire the semaphore in creation order, so create the longest tasks first
+        estimates = [self.agent_pool.estimate_latency(prompt) for prompt in prompts]
+        order = sorted(range(len(prompts)), key=lambda index: -estimates[index])
+        tasks = {index: asyncio.create_task(run(prompts[index])) for index in order}
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
 
-        return response_ids
+        return [tasks[index].result() for index in range(len(prompts))]
 
     async def _wait_for_dependencies(self, conversation: ConversationGraph, node_id: str) -> None:
-        """Wait for all dependencies of a node to complete."""
+        """Wait for all dependencies of a node to complete.
+
+        Raises:
+            RuntimeError: If a dependency failed
+        """
         node = conversation.nodes[node_id]
         dependencies = node.metadata["execution"]["dependencies"]
 
-        if not dependencies:
-            return
-
-        # Wait for all dependencies to complete
         for dep_id in dependencies:
-            dep_node = conversation.nodes[dep_id]
-            while dep_node.metadata["execution"]["status"] not in ["completed", "failed"]:
-                if dep_node.metadata["execution"]["status"] == "failed":
-                    raise RuntimeError(f"Dependency {dep_id} failed: {dep_node.metadata['execution']['error']}")
-                await asyncio.sleep(0.1)
+            await self.wait_for_completion(dep_id, conversation)
+            execution = conversation.nodes[dep_id].metadata["execution"]
+            if execution["status"] == "failed":
+                raise RuntimeError(f"Dependency {dep_id} failed: {execution['error']}")
+
+    async def wait_for_completion(
+        self, node_id: str, conversation: Optional[Union[str, ConversationGraph, ConversationNode]] = None
+    ) -> ExecutionMetadata:
+        """Wait until a node has completed or failed.
+
+        Waiting is signalled by the node's status update rather than polled, so waiters
+        resume as soon as the node finishes.
+
+        Returns:
+            The node's final execution metadata
+        """
+        conversation = self._get_conversation(conversation)
+        node = conversation.nodes[node_id]
+        while node.metadata["execution"]["status"] not in ("completed", "failed"):
+            await self._completion_events.setdefault(node_id, asyncio.Event()).wait()
+        return ExecutionMetadata.model_validate(node.metadata["execution"])
 
     def get_execution_status(
         self, node_id: str, conversation: Optional[Union[str, ConversationGraph, ConversationNode]] = None
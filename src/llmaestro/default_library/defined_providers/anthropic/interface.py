@@ -328,7 +328,7 @@ class AnthropicLLM(BaseLLMInterface):
         """Create message parameters for Anthropic."""
         return {
             "model": self.state.profile.name,
-            "max_tokens": self.state.runtime_config.max_tokens,
+            "max_tokens": self.max_output_tokens,
             "temperature": self.state.runtime_config.temperature,
             "stream": self.stream,
         }
@@ -252,5 +252,5 @@ class GeminiLLM(BaseLLMInterface):
     def _create_generation_config(self) -> genai.types.GenerationConfig:
         """Create a generation config for Gemini."""
         return genai.types.GenerationConfig(
-            temperature=self.state.runtime_config.temperature, max_output_tokens=self.state.runtime_config.max_tokens
+            temperature=self.state.runtime_config.temperature, max_output_tokens=self.max_output_tokens
         )
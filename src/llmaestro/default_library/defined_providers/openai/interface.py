@@ -1,13 +1,16 @@
 """OpenAI interface implementation."""
 
 import logging
-from typing import Any, Dict, List, Optional, Union, AsyncIterator, TYPE_CHECKING, cast, overload, BinaryIO, Type
+from typing import Any, Dict, List, Optional, Union, AsyncIterator, TYPE_CHECKING, cast, overload, BinaryIO, Type, Tuple
 import base64
 import json
 import asyncio
+import threading
+import time
+from collections import OrderedDict
 import httpx
 
-from openai import AsyncOpenAI
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
 from openai.types.chat import ChatCompletion, ChatCompletionMessage
 from openai.types.chat.chat_completion_system_message_param import ChatCompletionSystemMessageParam
 from openai.types.chat.chat_completion_user_message_param import ChatCompletionUserMessageParam
@@ -22,13 +25,69 @@ from llmaestro.prompts.base import BasePrompt
 from llmaestro.prompts.memory import MemoryPrompt
 from llmaestro.prompts.types import PromptMetadata
 from llmaestro.llm.responses import ResponseFormatType, ResponseFormat, StructuredOutputConfig
-from llmaestro.prompts.tools import ToolParams
+from llmaestro.llm.schema_utils import schema_registry
+from llmaestro.prompts.tools import get_tool_params
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# Errors that say nothing about whether a schema can be parsed directly
+TRANSIENT_PARSE_ERRORS = (APIConnectionError, RateLimitError, InternalServerError)
+
+
+class ParseFailureCache:
+    """Bounded TTL cache of (model, schema hash) pairs for which direct Pydantic parsing failed.
+
+    Requests for a remembered pair skip the parse endpoint and go straight to the JSON
+    object path until the entry expires, instead of paying for a failed call every time.
+    """
+
+    def __init__(self, ttl: float = 3600.0, max_entries: int = 512):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a failure is remembered
+            max_entries: Maximum number of remembered pairs
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, model: str, schema_hash: str, reason: str) -> None:
+        """Remember that direct parsing failed or is unsupported for a model and schema."""
+        with self._lock:
+            self._entries[(model, schema_hash)] = (time.monotonic() + self.ttl, reason)
+            self._entries.move_to_end((model, schema_hash))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, model: str, schema_hash: str) -> Optional[str]:
+        """Get the remembered failure reason, or None if direct parsing should be attempted."""
+        with self._lock:
+            entry = self._entries.get((model, schema_hash))
+            if entry is None:
+                return None
+            expires_at, reason = entry
+            if expires_at <= time.monotonic():
+                del self._entries[(model, schema_hash)]
+                return None
+            return reason
+
+    def clear(self) -> None:
+        """Forget all remembered failures."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+parse_failure_cache = ParseFailureCache()
+
 
 class OpenAIInterface(BaseLLMInterface):
     """OpenAI-specific implementation of the LLM interface."""
@@ -155,7 +214,7 @@ class OpenAIInterface(BaseLLMInterface):
 
         # Get model configuration
         model_name = self.state.profile.name
-        max_tokens = self.state.runtime_config.max_tokens
+        max_tokens = self.max_output_tokens
         temperature = self.state.runtime_config.temperature
 
         # Process prompt-level tools
@@ -273,22 +332,24 @@ class OpenAIInterface(BaseLLMInterface):
             tools: List of processed ToolParams objects
 
         Returns:
-            List of tool definitions in OpenAI's format
+            List of tool definitions in OpenAI's format, cached on each tool
         """
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": {
-                        **tool.parameters,
-                        "additionalProperties": False,
-                    },
+        return [tool.get_provider_payload("openai", self._format_tool) for tool in tools]
+
+    @staticmethod
+    def _format_tool(tool: ProcessedToolType) -> Dict[str, Any]:
+        """Convert a single processed tool into OpenAI's function calling format."""
+        return {
+            "type": "function",
+            "function": {
+                "name": tool.name,
+                "description": tool.description,
+                "parameters": {
+                    **tool.parameters,
+                    "additionalProperties": False,
                 },
-            }
-            for tool in tools
-        ]
+            },
+        }
 
     def _has_pattern_validators(self, model: Type[BaseModel]) -> bool:
         """Check if a Pydantic model has pattern validators which are not supported by OpenAI.
@@ -300,8 +361,8 @@ class OpenAIInterface(BaseLLMInterface):
             bool: True if the model has pattern validators, False otherwise
         """
         try:
-            # Get the model schema
-            schema = model.model_json_schema()
+            # Get the cached model schema
+            schema = schema_registry.get(model).schema
 
             # Check if any properties have pattern validators
             if "properties" in schema:
@@ -393,14 +454,20 @@ class OpenAIInterface(BaseLLMInterface):
             logger.debug(f"Model supports direct Pydantic parsing: {supports_direct_parsing}")
 
             if pydantic_model is not None and supports_direct_parsing:
+                schema_hash = schema_registry.get(pydantic_model).schema_hash
+                known_failure = parse_failure_cache.get(model, schema_hash)
+                if known_failure is not None:
+                    logger.debug(
+                        f"Skipping direct Pydantic parsing for {pydantic_model.__name__} on {model}: {known_failure}"
+                    )
                 # Check for pattern validators which are not supported by OpenAI
-                has_patterns = self._has_pattern_validators(pydantic_model)
-                if has_patterns:
+                elif self._has_pattern_validators(pydantic_model):
                     logger.warning(
                         "Pydantic model '{}' contains pattern validators "
                         "which are not supported by OpenAI's direct Pydantic integration. "
                         "Falling back to standard JSON object format.".format(pydantic_model.__name__)
                     )
+                    parse_failure_cache.record(model, schema_hash, "pattern validators are not supported")
                 else:
                     try:
                         logger.debug(f"Using direct Pydantic parsing with model: {pydantic_model}")
@@ -430,13 +497,16 @@ class OpenAIInterface(BaseLLMInterface):
                     except Exception as e:
                         logger.error(f"Direct Pydantic parsing failed: {e}")
                         logger.warning("Falling back to standard JSON object format")
+                        if not isinstance(e, TRANSIENT_PARSE_ERRORS):
+                            parse_failure_cache.record(model, schema_hash, f"{type(e).__name__}: {e}")
                         # Fall through to standard format
 
             # Standard JSON object format (stable)
             base_kwargs["response_format"] = {"type": "json_object"}
-            if response_format.effective_schema:
+            schema_entry = response_format.schema_entry
+            if schema_entry is not None:
                 # Add schema validation in the system prompt
-                schema_str = json.dumps(response_format.effective_schema, indent=2)
+                schema_str = schema_entry.pretty_text
                 system_msg = next((m for m in messages if m["role"] == "system"), None)
                 if system_msg:
                     system_msg["content"] = (
@@ -476,8 +546,8 @@ class OpenAIInterface(BaseLLMInterface):
         """Process a list of tools into standardized ToolParams objects for OpenAI.
 
         This method converts various tool input types into ToolParams objects:
-        - Functions are converted using ToolParams.from_function
-        - Pydantic models are passed directly using OpenAI's pydantic_function_tool
+        - Functions and Pydantic models are converted with get_tool_params, which caches
+          the result per function or model for the lifetime of the process
 
         Args:
             tools: List of tools to process, can be functions, Pydantic models, or ToolParams
@@ -493,17 +563,9 @@ class OpenAIInterface(BaseLLMInterface):
             if isinstance(tool, ProcessedToolType):
                 # For existing ToolParams, keep as is
                 processed_tools.append(tool)
-            elif isinstance(tool, type) and issubclass(tool, BaseModel):
-                # For Pydantic models, create a ToolParams with the model as the function
-                # Use from_pydantic method instead of direct constructor to avoid type errors
-                tool_params = ToolParams.from_pydantic(tool)
-                processed_tools.append(tool_params)
-            elif callable(tool):
-                # For callables, create a ToolParams with the function
-                tool_params = ToolParams.from_function(tool)
-                processed_tools.append(tool_params)
             else:
-                raise ValueError(f"Unsupported tool type: {type(tool)}")
+                # Functions and Pydantic models are converted once per process
+                processed_tools.append(get_tool_params(tool))
 
         return processed_tools
 
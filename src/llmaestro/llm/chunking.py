@@ -0,0 +1,254 @@
+"""Token-bounded, boundary-aware splitting of large documents into chunks."""
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from llmaestro.llm.interfaces.tokenizers import BaseTokenizer
+
+try:
+    from pypdf import PdfReader
+except ImportError:
+    PdfReader = None
+
+logger = logging.getLogger(__name__)
+
+# Split points tried in order: paragraphs, lines, sentences, clauses, words
+DEFAULT_SEPARATORS: Tuple[str, ...] = ("\n\n", "\n", ". ", "? ", "! ", "; ", ", ", " ")
+
+# Text held while waiting for a paragraph break before it is split at a weaker boundary
+_MAX_PENDING_CHARS = 1 << 20
+
+
+@dataclass
+class TextChunk:
+    """A token-bounded piece of a document."""
+
+    index: int
+    text: str
+    token_count: int
+    start: int
+    end: int
+
+
+class TextChunker:
+    """Splits text into chunks of at most ``max_tokens`` tokens, preferring natural boundaries.
+
+    Text is cut at the strongest separator that yields pieces within the limit
+    (paragraphs, then lines, sentences and words) and the pieces are packed greedily
+    into chunks. Consecutive chunks share up to ``overlap_tokens`` tokens of whole
+    pieces. Input is consumed as a stream of text blocks and only token counts are
+    kept, so memory stays proportional to the chunk size rather than the document.
+    """
+
+    def __init__(
+        self,
+        tokenizer: BaseTokenizer,
+        max_tokens: int,
+        overlap_tokens: int = 0,
+        separators: Sequence[str] = DEFAULT_SEPARATORS,
+    ):
+        """Initialize the chunker.
+
+        Args:
+            tokenizer: Tokenizer of the model the chunks are sent to
+            max_tokens: Maximum tokens per chunk
+            overlap_tokens: Tokens of trailing context repeated at the start of the next chunk
+            separators: Boundaries to split at, strongest first
+        """
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if not 0 <= overlap_tokens < max_tokens:
+            raise ValueError("overlap_tokens must be non-negative and less than max_tokens")
+        if not separators:
+            raise ValueError("At least one separator is required")
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+        self.overlap_tokens = overlap_tokens
+        self.separators = tuple(separators)
+
+    def split(self, text: str) -> Iterator[TextChunk]:
+        """Split a string into chunks."""
+        return self.split_stream([text])
+
+    def split_file(self, path: Union[str, Path], block_size: int = 1 << 20) -> Iterator[TextChunk]:
+        """Split a text or PDF file into chunks without loading it into memory at once."""
+        path = Path(path)
+        if path.suffix.lower() == ".pdf":
+            return self.split_stream(read_pdf_text(path))
+        return self.split_stream(read_text_blocks(path, block_size))
+
+    def split_stream(self, blocks: Iterable[str]) -> Iterator[TextChunk]:
+        """Split text arriving in blocks of any size into chunks, in document order.
+
+        Args:
+            blocks: Consecutive pieces of the document, e.g. from ``read_text_blocks``
+
+        Yields:
+            Chunks of at most ``max_tokens`` tokens
+        """
+        window: List[Tuple[str, int, int]] = []  # (text, tokens, start offset)
+        window_tokens = 0
+        index = 0
+
+        for unit in self._units(blocks):
+            if window and window_tokens + unit[1] > self.max_tokens:
+                chunk, window = self._emit(index, window)
+                yield chunk
+                index += 1
+                window_tokens = sum(tokens for _, tokens, _ in window)
+                # Overlap is dropped when it would leave no room for the next piece
+                while window and window_tokens + unit[1] > self.max_tokens:
+                    window_tokens -= window.pop(0)[1]
+            window.append(unit)
+            window_tokens += unit[1]
+
+        while window:
+            chunk, window = self._emit(index, window, final=True)
+            yield chunk
+            index += 1
+
+    def _emit(
+        self, index: int, window: List[Tuple[str, int, int]], final: bool = False
+    ) -> Tuple[TextChunk, List[Tuple[str, int, int]]]:
+        """Build a chunk from the window and return it with the units carried into the next chunk.
+
+        Token counts of pieces are not strictly additive, so the joined text is counted
+        again and trailing pieces are deferred until it fits.
+        """
+        taken = list(window)
+        deferred: List[Tuple[str, int, int]] = []
+        text = "".join(piece for piece, _, _ in taken)
+        token_count = self.tokenizer.count_tokens(text)
+        while token_count > self.max_tokens and len(taken) > 1:
+            deferred.insert(0, taken.pop())
+            text = "".join(piece for piece, _, _ in taken)
+            token_count = self.tokenizer.count_tokens(text)
+
+        start = taken[0][2]
+        chunk = TextChunk(index=index, text=text, token_count=token_count, start=start, end=start + len(text))
+        if final and not deferred:
+            return chunk, []
+
+        carried: List[Tuple[str, int, int]] = []
+        if self.overlap_tokens:
+            overlap = 0
+            for unit in reversed(taken):
+                if overlap + unit[1] > self.overlap_tokens:
+                    break
+                carried.insert(0, unit)
+                overlap += unit[1]
+            if len(carried) == len(taken):
+                # Always make progress: never carry the whole chunk over
+                carried = carried[1:]
+        return chunk, carried + deferred
+
+    def _units(self, blocks: Iterable[str]) -> Iterator[Tuple[str, int, int]]:
+        """Cut the stream into pieces of at most ``max_tokens`` tokens at natural boundaries."""
+        offset = 0
+        for segment in _segments(blocks, self.separators[0], self.separators[1:]):
+            for piece, tokens in self._fit(segment, 0):
+                yield piece, tokens, offset
+                offset += len(piece)
+
+    def _fit(self, text: str, level: int) -> Iterator[Tuple[str, int]]:
+        """Split text at successively weaker separators until every piece fits, yielding pieces with their counts."""
+        if not text:
+            return
+        tokens = self.tokenizer.count_tokens(text)
+        if tokens <= self.max_tokens:
+            yield text, tokens
+            return
+        # Skip separators the text does not contain instead of recounting it at each level
+        while level < len(self.separators) and self.separators[level] not in text:
+            level += 1
+        if level >= len(self.separators):
+            yield from self._hard_split(text)
+            return
+        for piece in _split_keeping(text, self.separators[level]):
+            yield from self._fit(piece, level + 1)
+
+    def _hard_split(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Split text without separators into the longest prefixes that fit.
+
+        The search window grows from a guess of a few characters per token, so each
+        piece costs counts proportional to the piece rather than to the whole text.
+        """
+        start = 0
+        while start < len(text):
+            remaining = len(text) - start
+            # Grow the window until it no longer fits, then binary search inside it
+            low, high = 1, min(remaining, 4 * self.max_tokens)
+            while high < remaining and self.tokenizer.count_tokens(text[start : start + high]) <= self.max_tokens:
+                low, high = high, min(remaining, 2 * high)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if self.tokenizer.count_tokens(text[start : start + middle]) <= self.max_tokens:
+                    low = middle
+                else:
+                    high = middle - 1
+            piece = text[start : start + low]
+            yield piece, self.tokenizer.count_tokens(piece)
+            start += low
+
+
+def _split_keeping(text: str, separator: str) -> List[str]:
+    """Split text after each separator, keeping separators so the pieces join back to the text."""
+    parts = text.split(separator)
+    pieces = [part + separator for part in parts[:-1]]
+    if parts[-1]:
+        pieces.append(parts[-1])
+    return [piece for piece in pieces if piece]
+
+
+def _segments(blocks: Iterable[str], separator: str, fallbacks: Sequence[str]) -> Iterator[str]:
+    """Re-cut a stream of text blocks into segments ending at the separator.
+
+    Text without a separator is held until ``_MAX_PENDING_CHARS`` accumulate, then cut
+    at the last fallback boundary so memory stays bounded.
+    """
+    pending = ""
+    for block in blocks:
+        pending += block
+        cut = pending.rfind(separator)
+        if cut >= 0:
+            cut += len(separator)
+            yield from _split_keeping(pending[:cut], separator)
+            pending = pending[cut:]
+        while len(pending) > _MAX_PENDING_CHARS:
+            cuts = []
+            for fallback in fallbacks:
+                position = pending.rfind(fallback, 0, _MAX_PENDING_CHARS)
+                if position >= 0:
+                    cuts.append(position + len(fallback))
+            # Without any boundary (e.g. CJK text, minified JSON, base64), cut at the limit
+            cut = max(cuts, default=_MAX_PENDING_CHARS)
+            yield pending[:cut]
+            pending = pending[cut:]
+    if pending:
+        yield pending
+
+
+def read_text_blocks(path: Union[str, Path], block_size: int = 1 << 20, encoding: str = "utf-8") -> Iterator[str]:
+    """Read a text file lazily in blocks of ``block_size`` characters."""
+    with open(path, encoding=encoding) as file:
+        while True:
+            block = file.read(block_size)
+            if not block:
+                return
+            yield block
+
+
+def read_pdf_text(path: Union[str, Path], page_separator: str = "\n\n") -> Iterator[str]:
+    """Extract the text of a PDF lazily, one page at a time.
+
+    Raises:
+        ImportError: If pypdf is not installed
+    """
+    if PdfReader is None:
+        raise ImportError("pypdf package is required to read PDF text")
+    reader = PdfReader(str(path))
+    for page in reader.pages:
+        text: Optional[str] = page.extract_text()
+        if text:
+            yield text + page_separator
@@ -4,9 +4,11 @@ from __future__ import annotations
 import base64
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union, AsyncIterator, Type, Callable, TypeVar, Awaitable
+from typing import Any, Dict, Iterator, List, Optional, Set, Union, AsyncIterator, Type, Callable, TypeVar, Awaitable
 import asyncio
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -17,9 +19,9 @@ from llmaestro.llm.credentials import APIKey
 from llmaestro.prompts.base import BasePrompt
 from llmaestro.llm.enums import MediaType
 from llmaestro.llm.responses import ResponseFormat
-from .tokenizers import BaseTokenizer
+from .tokenizers import BaseTokenizer, TokenCounter, tokenizer_registry
 from llmaestro.llm.models import LLMState  # Direct import instead of TYPE_CHECKING
-from llmaestro.prompts.tools import ToolParams
+from llmaestro.prompts.tools import ToolParams, get_tool_params
 from llmaestro.core.models import ContextMetrics
 from llmaestro.core.attachments import BaseAttachment
 
@@ -32,6 +34,26 @@ ProcessedToolType = ToolParams
 # Add type variables for better type hinting
 T = TypeVar("T")
 
+# Per-request cap on generated tokens, below the model's configured max_tokens
+_output_token_limit: ContextVar[Optional[int]] = ContextVar("_output_token_limit", default=None)
+
+
+@contextmanager
+def output_token_limit(max_tokens: Optional[int]) -> Iterator[None]:
+    """Cap the tokens generated by requests made in this context, including tasks started in it.
+
+    Interfaces read the cap through ``BaseLLMInterface.max_output_tokens``. Passing
+    None leaves the current cap in place.
+    """
+    if max_tokens is None:
+        yield
+        return
+    token = _output_token_limit.set(max_tokens)
+    try:
+        yield
+    finally:
+        _output_token_limit.reset(token)
+
 
 @dataclass
 class ImageInput:
@@ -224,16 +246,9 @@ class BaseLLMInterface(BaseModel, ABC):
             if isinstance(tool, ProcessedToolType):
                 # For existing ToolParams, keep as is
                 processed_tools.append(tool)
-            elif isinstance(tool, type) and issubclass(tool, BaseModel):
-                # For Pydantic models, use the from_pydantic method
-                tool_params = ToolParams.from_pydantic(tool)
-                processed_tools.append(tool_params)
-            elif callable(tool):
-                # For callables, create a ToolParams with the function
-                tool_params = ToolParams.from_function(tool)
-                processed_tools.append(tool_params)
             else:
-                raise ValueError(f"Unsupported tool type: {type(tool)}")
+                # Functions and Pydantic models are converted once per process
+                processed_tools.append(get_tool_params(tool))
 
         return processed_tools
 
@@ -420,11 +435,30 @@ class BaseLLMInterface(BaseModel, ABC):
 
         return filtered_kwargs
 
+    @property
+    def max_output_tokens(self) -> int:
+        """Maximum tokens to generate for the current request.
+
+        This is the configured ``max_tokens``, lowered by any ``output_token_limit`` in effect.
+        """
+        configured = self.state.runtime_config.max_tokens
+        limit = _output_token_limit.get()
+        return min(configured, limit) if limit is not None else configured
+
+    def get_tokenizer(self) -> BaseTokenizer:
+        """Get the tokenizer of this interface's model, shared process-wide through ``tokenizer_registry``."""
+        if self.tokenizer is None:
+            self.tokenizer = tokenizer_registry.get(str(self.state.profile.name), self.state.model_family)
+        return self.tokenizer
+
+    @property
+    def token_counter(self) -> TokenCounter:
+        """Estimator for request tokens, including images, used before a request is sent."""
+        return TokenCounter(self.get_tokenizer())
+
     def count_tokens(self, messages: List[Dict[str, Any]]) -> int:
         """Basic token counting."""
-        if not self.tokenizer:
-            return 0
-        return self.tokenizer.count_messages(messages)
+        return self.get_tokenizer().count_messages(messages)
 
     def validate_credentials(self) -> None:
         """Validate the credentials for the LLM provider."""
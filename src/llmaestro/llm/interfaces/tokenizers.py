@@ -1,7 +1,15 @@
 """Tokenizer implementations for different LLM providers."""
+import logging
+import math
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 try:
     from transformers import AutoTokenizer
@@ -15,6 +23,39 @@ except ImportError:
     anthropic = None
     AsyncAnthropic = None
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+
+# Encodings of OpenAI model names that tiktoken's own table does not cover, by name prefix
+_ENCODING_PREFIXES: Tuple[Tuple[str, str], ...] = (
+    ("gpt-4o", "o200k_base"),
+    ("chatgpt-4o", "o200k_base"),
+    ("gpt-4.1", "o200k_base"),
+    ("gpt-4.5", "o200k_base"),
+    ("gpt-5", "o200k_base"),
+    ("o1", "o200k_base"),
+    ("o3", "o200k_base"),
+    ("o4", "o200k_base"),
+    ("gpt-4", "cl100k_base"),
+    ("gpt-3.5", "cl100k_base"),
+    ("text-embedding-3", "cl100k_base"),
+    ("text-embedding-ada", "cl100k_base"),
+)
+
+
+def encoding_name_for_model(model_name: str) -> Optional[str]:
+    """Get the tiktoken encoding of an OpenAI model, or None if the model is not recognized."""
+    if tiktoken is not None:
+        try:
+            return tiktoken.encoding_name_for_model(model_name)
+        except KeyError:
+            pass
+    for prefix, encoding_name in _ENCODING_PREFIXES:
+        if model_name.startswith(prefix):
+            return encoding_name
+    return None
+
 
 class BaseTokenizer(ABC):
     """Abstract base class for model-specific tokenizers."""
@@ -48,20 +89,44 @@ class BaseTokenizer(ABC):
         return total_tokens
 
 
+class TiktokenTokenizer(BaseTokenizer):
+    """Tokenizer for OpenAI models using tiktoken."""
+
+    def __init__(self, model_name: str):
+        super().__init__(model_name)
+        self.encoding_name = encoding_name_for_model(model_name) or DEFAULT_ENCODING
+        self.encoding = tokenizer_registry.get_encoding(self.encoding_name)
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.encode(text))
+
+    def encode(self, text: str) -> List[int]:
+        return self.encoding.encode(text, disallowed_special=())
+
+    def count_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """OpenAI-specific message token counting."""
+        total_tokens = super().count_messages(messages)
+        # Add OpenAI's message overhead
+        total_tokens += 4 * len(messages)  # 4 tokens per message for metadata
+        return total_tokens
+
+
 class AnthropicTokenizer(BaseTokenizer):
     """Token counter for Anthropic models."""
 
-    def __init__(self, model_name: str, *, api_key: str):
+    def __init__(self, model_name: str, *, api_key: Optional[str] = None):
         """Initialize the tokenizer.
 
         Args:
             model_name: Name of the model to use
-            api_key: Anthropic API key
+            api_key: Optional Anthropic API key, for a client to the token counting endpoint
         """
         super().__init__(model_name)
-        if AsyncAnthropic is None:
-            raise ImportError("Anthropic package is not installed")
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = None
+        if api_key is not None:
+            if AsyncAnthropic is None:
+                raise ImportError("Anthropic package is not installed")
+            self.client = AsyncAnthropic(api_key=api_key)
 
     def count_tokens(self, text: str) -> int:
         """Estimate token count for text using a simple approximation.
@@ -82,9 +147,7 @@ class HuggingFaceTokenizer(BaseTokenizer):
 
     def __init__(self, model_name: str):
         super().__init__(model_name)
-        if not AutoTokenizer:
-            raise ImportError("transformers package is required for HuggingFace models")
-        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.tokenizer = tokenizer_registry.get_pretrained(model_name)
 
     def count_tokens(self, text: str) -> int:
         return len(self.encode(text))
@@ -110,3 +173,163 @@ class SimpleWordTokenizer(BaseTokenizer):
     def encode(self, text: str) -> List[int]:
         """Encode text into token IDs."""
         raise NotImplementedError("SimpleWordTokenizer does not support encoding")
+
+
+def estimate_image_tokens(width: int, height: int, model_family: str) -> int:
+    """Estimate the input tokens of an image from the provider's published sizing rules."""
+    family = model_family.lower()
+    if family in ("claude", "anthropic"):
+        # Images are scaled to at most 1568px on the long edge, at ~750 pixels per token
+        scale = min(1.0, 1568 / max(width, height, 1))
+        return math.ceil(width * scale * height * scale / 750)
+    if family in ("gemini", "google"):
+        # 258 tokens per image up to 384px, larger images are tiled in 768px squares
+        if max(width, height) <= 384:
+            return 258
+        return 258 * math.ceil(width / 768) * math.ceil(height / 768)
+    # OpenAI: fit in 2048px, shortest side scaled to 768px, 170 tokens per 512px tile plus 85
+    scale = min(1.0, 2048 / max(width, height, 1))
+    width, height = width * scale, height * scale
+    scale = min(1.0, 768 / max(min(width, height), 1))
+    width, height = width * scale, height * scale
+    return 85 + 170 * math.ceil(width / 512) * math.ceil(height / 512)
+
+
+class TokenCounter:
+    """Estimates the prompt tokens of a request, including images, before it is sent."""
+
+    def __init__(self, tokenizer: BaseTokenizer):
+        self.tokenizer = tokenizer
+
+    def estimate_messages_with_images(
+        self,
+        messages: List[Dict[str, Any]],
+        image_data: List[Dict[str, int]],
+        model_family: str,
+        model_name: str,
+    ) -> Dict[str, int]:
+        """Estimate the tokens of messages and attached images.
+
+        Args:
+            messages: Messages of the request
+            image_data: Width and height of each attached image
+            model_family: Provider family, which determines how images are sized
+            model_name: Model the request is sent to
+
+        Returns:
+            Dictionary with text_tokens, image_tokens, prompt_tokens and total_tokens
+        """
+        text_tokens = self.tokenizer.count_messages(messages)
+        image_tokens = sum(
+            estimate_image_tokens(image["width"], image["height"], model_family) for image in image_data
+        )
+        prompt_tokens = text_tokens + image_tokens
+        return {
+            "text_tokens": text_tokens,
+            "image_tokens": image_tokens,
+            "prompt_tokens": prompt_tokens,
+            "total_tokens": prompt_tokens,
+        }
+
+
+class TokenizerRegistry:
+    """Process-wide cache of tokenizers and the encodings behind them.
+
+    Tokenizers are created on first use for a model, by a factory registered for the
+    model's provider family, and shared by every interface and agent pool afterwards.
+    The encodings and pretrained vocabularies they wrap are loaded once per process,
+    so creating agents never pays tokenizer load time. Models whose tokenizer cannot
+    be loaded (missing package, no network for the encoding files) fall back to
+    ``SimpleWordTokenizer``.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[str], BaseTokenizer]] = {
+            "openai": TiktokenTokenizer,
+            "claude": AnthropicTokenizer,
+            "anthropic": AnthropicTokenizer,
+            "huggingface": HuggingFaceTokenizer,
+        }
+        self._tokenizers: Dict[Tuple[str, str], BaseTokenizer] = {}
+        self._resources: Dict[Tuple[str, str], Any] = {}
+        self._load_locks: Dict[Tuple[str, str], Lock] = {}
+        self._lock = Lock()
+
+    def register(self, model_family: str, factory: Callable[[str], BaseTokenizer]) -> None:
+        """Use a factory (called with the model name) to create tokenizers for a provider family."""
+        with self._lock:
+            self._factories[model_family.lower()] = factory
+            for key in [key for key in self._tokenizers if key[0] == model_family.lower()]:
+                del self._tokenizers[key]
+
+    def get(self, model_name: str, model_family: Optional[str] = None) -> BaseTokenizer:
+        """Get the shared tokenizer for a model.
+
+        Args:
+            model_name: Name of the model
+            model_family: Provider family of the model; inferred for known OpenAI models when omitted
+
+        Returns:
+            The model's tokenizer, or a ``SimpleWordTokenizer`` if none can be loaded
+        """
+        family = (model_family or ("openai" if encoding_name_for_model(model_name) else "")).lower()
+        key = (family, model_name)
+        tokenizer = self._tokenizers.get(key)
+        if tokenizer is not None:
+            return tokenizer
+
+        with self._lock:
+            factory = self._factories.get(family)
+        try:
+            created = factory(model_name) if factory is not None else SimpleWordTokenizer(model_name)
+        except Exception as err:
+            logger.warning(f"Could not load tokenizer for {model_name}, estimating tokens by words: {err}")
+            created = SimpleWordTokenizer(model_name)
+
+        with self._lock:
+            return self._tokenizers.setdefault(key, created)
+
+    def get_encoding(self, encoding_name: str) -> Any:
+        """Get a tiktoken encoding, loading it on first use.
+
+        Raises:
+            ImportError: If tiktoken is not installed
+        """
+        if tiktoken is None:
+            raise ImportError("tiktoken package is required for OpenAI tokenizers")
+        return self._load("tiktoken", encoding_name, tiktoken.get_encoding)
+
+    def get_pretrained(self, model_name: str) -> Any:
+        """Get a HuggingFace tokenizer, loading it on first use.
+
+        Raises:
+            ImportError: If transformers is not installed
+        """
+        if not AutoTokenizer:
+            raise ImportError("transformers package is required for HuggingFace models")
+        return self._load("huggingface", model_name, AutoTokenizer.from_pretrained)
+
+    def clear(self) -> None:
+        """Drop all cached tokenizers and encodings."""
+        with self._lock:
+            self._tokenizers.clear()
+            self._resources.clear()
+            self._load_locks.clear()
+
+    def _load(self, kind: str, name: str, loader: Callable[[str], Any]) -> Any:
+        """Load a resource once per process; concurrent callers wait for the first load."""
+        key = (kind, name)
+        resource = self._resources.get(key)
+        if resource is not None:
+            return resource
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, Lock())
+        with load_lock:
+            resource = self._resources.get(key)
+            if resource is None:
+                resource = loader(name)
+                self._resources[key] = resource
+            return resource
+
+
+tokenizer_registry = TokenizerRegistry()
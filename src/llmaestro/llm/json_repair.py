@@ -0,0 +1,130 @@
+"""Tolerant extraction and repair of JSON produced by LLMs.
+
+LLM responses often contain JSON that is almost valid: wrapped in markdown code
+fences or prose, written with single quotes or Python literals, left with trailing
+commas, or cut off before the closing brackets. ``repair_json`` fixes these defects
+locally so callers can avoid a full retry round trip.
+"""
+
+import json
+import re
+from typing import Any, Iterator, List
+
+_FENCE_PATTERN = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def repair_json(text: str) -> Any:
+    """Parse JSON from an LLM response, repairing common defects.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        The parsed JSON value
+
+    Raises:
+        ValueError: If no JSON value can be recovered
+    """
+    for candidate in _candidates(text):
+        for attempt in (candidate, _fix(candidate)):
+            try:
+                return json.loads(attempt)
+            except json.JSONDecodeError:
+                continue
+    raise ValueError("Could not repair JSON response")
+
+
+def _candidates(text: str) -> Iterator[str]:
+    """Yield progressively more aggressive extractions of the JSON part of a response."""
+    stripped = text.strip()
+    yield stripped
+
+    fenced = _FENCE_PATTERN.search(stripped)
+    if fenced:
+        stripped = fenced.group(1).strip()
+        yield stripped
+
+    starts = [index for index in (stripped.find("{"), stripped.find("[")) if index >= 0]
+    if starts and min(starts) > 0:
+        yield stripped[min(starts) :]
+
+
+def _fix(text: str) -> str:
+    """Rewrite near-JSON into JSON.
+
+    Converts single-quoted strings and Python literals, drops trailing commas, ignores
+    text after the top-level value, and closes unterminated strings and containers.
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    quote = ""
+    i = 0
+    started = False
+
+    while i < len(text):
+        char = text[i]
+
+        if quote:
+            if char == "\\" and i + 1 < len(text):
+                escaped = text[i + 1]
+                # \' is not a valid JSON escape
+                out.append("'" if escaped == "'" else char + escaped)
+                i += 2
+                continue
+            if char == quote:
+                out.append('"')
+                quote = ""
+            elif char == '"':
+                out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            else:
+                out.append(char)
+            i += 1
+            continue
+
+        if char in "\"'":
+            quote = char
+            out.append('"')
+        elif char in "{[":
+            stack.append(char)
+            out.append(char)
+            started = True
+        elif char in "}]":
+            _strip_trailing_comma(out)
+            if stack and _CLOSERS[stack[-1]] == char:
+                stack.pop()
+                out.append(char)
+            if started and not stack:
+                break
+        elif char.isalpha():
+            end = i
+            while end < len(text) and (text[end].isalnum() or text[end] == "_"):
+                end += 1
+            word = text[i:end]
+            out.append(_LITERALS.get(word, word))
+            i = end
+            continue
+        else:
+            out.append(char)
+        i += 1
+
+    if quote:
+        out.append('"')
+    _strip_trailing_comma(out)
+    if out and out[-1].rstrip().endswith(":"):
+        out.append(" null")
+    for opener in reversed(stack):
+        out.append(_CLOSERS[opener])
+    return "".join(out)
+
+
+def _strip_trailing_comma(out: List[str]) -> None:
+    """Remove a trailing comma (and whitespace before it) from the output buffer."""
+    index = len(out) - 1
+    while index >= 0 and out[index].isspace():
+        index -= 1
+    if index >= 0 and out[index] == ",":
+        del out[index:]
@@ -9,7 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field
 import json
 
 from llmaestro.llm.models import TokenUsage, ContextMetrics
-from llmaestro.llm.schema_utils import convert_to_schema, schema_to_json, validate_json
+from llmaestro.llm.schema_utils import SchemaEntry, convert_to_schema, schema_registry, schema_to_json, validate_json
 
 
 class ResponseFormatType(str, Enum):
@@ -65,11 +65,24 @@ class StructuredOutputConfig(BaseModel):
 
     @property
     def effective_schema(self) -> Optional[Dict[str, Any]]:
-        """Get the effective schema, whether from direct schema or Pydantic model."""
+        """Get the effective schema, whether from direct schema or Pydantic model.
+
+        Schemas generated from Pydantic models are cached in the schema registry and
+        shared, so the returned dict must not be modified.
+        """
         if self.pydantic_model:
-            return self.pydantic_model.model_json_schema()
+            return schema_registry.get(self.pydantic_model).schema
         return self.schema
 
+    @property
+    def schema_entry(self) -> Optional[SchemaEntry]:
+        """Get the cached schema entry (serialized text and compiled validator), if a schema is set."""
+        if self.pydantic_model:
+            return schema_registry.get(self.pydantic_model)
+        if self.schema:
+            return schema_registry.get(self.schema)
+        return None
+
     class Config:
         arbitrary_types_allowed = True
 
@@ -196,6 +209,15 @@ class ResponseFormat(BaseModel):
 
         return config
 
+    @property
+    def schema_entry(self) -> Optional[SchemaEntry]:
+        """Get the cached schema entry for this format's Pydantic model or JSON schema, if any."""
+        if self.pydantic_model and not self.convert_to_json_schema:
+            return schema_registry.get(self.pydantic_model)
+        if self.response_schema:
+            return schema_registry.get(self.response_schema)
+        return None
+
     def get_required_fields(self) -> List[str]:
         """Get the list of required fields from the response schema."""
         if not self.response_schema:
@@ -245,11 +267,10 @@ class ResponseFormat(BaseModel):
                 except Exception as e:
                     result.errors.append(str(e))
             elif self.requires_schema:
-                # Use get_structured_output_config to leverage effective_schema
-                config = self.get_structured_output_config()
-                if config.effective_schema:
+                entry = self.schema_entry
+                if entry is not None:
                     try:
-                        validate_json(formatted, json.dumps(config.effective_schema))
+                        entry.validate(formatted)
                         result.is_valid = True
                     except ValueError as e:
                         result.errors.append(str(e))
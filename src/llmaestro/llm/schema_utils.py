@@ -1,7 +1,10 @@
 """Utilities for handling JSON schemas and validation."""
 
+import hashlib
 import json
-from typing import Any, Dict, Optional, Type, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Type, Union
 
 from pydantic import BaseModel
 import jsonschema
@@ -108,11 +111,121 @@ def validate_json(
                     return schema.model_validate(parsed_data).model_dump()
                 except Exception as err:
                     raise ValueError(f"Schema validation failed: {err}") from err
-            # Otherwise use jsonschema validation
-            try:
-                validator = jsonschema.Draft7Validator(schema_dict)
-                validator.validate(parsed_data)
-            except jsonschema.ValidationError as err:
-                raise ValueError(f"Schema validation failed: {err}") from err
+            # Otherwise use jsonschema validation with a cached validator
+            schema_registry.get(schema_dict).validate(parsed_data)
 
     return parsed_data
+
+
+class SchemaEntry:
+    """A JSON schema with its serialized forms and compiled validator.
+
+    The serialized text and validator are built on first use and then reused.
+    Entries are shared, so the schema dict must be treated as read-only.
+    """
+
+    def __init__(self, schema: Dict[str, Any], schema_hash: Optional[str] = None):
+        self.schema = schema
+        self._hash = schema_hash
+        self._text: Optional[str] = None
+        self._pretty_text: Optional[str] = None
+        self._validator: Optional[jsonschema.Draft7Validator] = None
+
+    @property
+    def schema_hash(self) -> str:
+        """SHA-256 of the schema's canonical JSON form."""
+        if self._hash is None:
+            self._hash = hash_schema(self.schema)
+        return self._hash
+
+    @property
+    def text(self) -> str:
+        """Compact JSON text of the schema."""
+        if self._text is None:
+            self._text = json.dumps(self.schema)
+        return self._text
+
+    @property
+    def pretty_text(self) -> str:
+        """Indented JSON text of the schema, suitable for prompts."""
+        if self._pretty_text is None:
+            self._pretty_text = json.dumps(self.schema, indent=2)
+        return self._pretty_text
+
+    @property
+    def validator(self) -> jsonschema.Draft7Validator:
+        """Compiled jsonschema validator for the schema."""
+        if self._validator is None:
+            self._validator = jsonschema.Draft7Validator(self.schema)
+        return self._validator
+
+    def validate(self, data: Any) -> None:
+        """Validate parsed data against the schema.
+
+        Raises:
+            ValueError: If the data fails schema validation
+        """
+        try:
+            self.validator.validate(data)
+        except jsonschema.ValidationError as err:
+            raise ValueError(f"Schema validation failed: {err}") from err
+
+
+def hash_schema(schema: Dict[str, Any]) -> str:
+    """Get a stable SHA-256 hash of a schema dict."""
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SchemaRegistry:
+    """Process-wide cache of schema entries.
+
+    Pydantic models are keyed by class and JSON strings by their text, so lookups for
+    them are cheap. Schema dicts are keyed by the hash of their canonical JSON form.
+    The registry is bounded and evicts the least recently used entries.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, SchemaEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, schema_input: Union[Dict[str, Any], Type[BaseModel], str]) -> SchemaEntry:
+        """Get the cached entry for a Pydantic model, schema dict or JSON schema string.
+
+        Raises:
+            ValueError: If the input is invalid or cannot be converted
+        """
+        schema_hash = None
+        if isinstance(schema_input, dict):
+            schema_hash = hash_schema(schema_input)
+            key: Hashable = ("hash", schema_hash)
+        elif isinstance(schema_input, (str, type)):
+            key = schema_input
+        else:
+            raise ValueError(f"Unsupported schema input type: {type(schema_input)}")
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = SchemaEntry(convert_to_schema(schema_input), schema_hash)
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+schema_registry = SchemaRegistry()
@@ -0,0 +1,169 @@
+"""Process-wide result cache for idempotent tools."""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_MISSING = object()
+
+
+class ToolCachePolicy(BaseModel):
+    """Caching settings for a tool whose results depend only on its arguments."""
+
+    ttl: Optional[float] = Field(default=300.0, gt=0, description="Seconds a result stays valid (None never expires)")
+    max_entries: int = Field(default=1024, ge=1, description="Maximum cached results kept for the tool")
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+class ToolCacheStats(BaseModel):
+    """Counters describing cache behaviour for one tool."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    size: int = 0
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def cacheable(ttl: Optional[float] = 300.0, max_entries: int = 1024) -> Callable[[F], F]:
+    """Mark a function as safe to cache when exposed as a tool.
+
+    ``ToolParams.from_function`` picks up the policy, so results are reused for calls
+    with the same arguments until the TTL expires.
+
+    Example:
+        ```python
+        @cacheable(ttl=60)
+        def get_weather(location: str) -> str:
+            ...
+        ```
+    """
+    policy = ToolCachePolicy(ttl=ttl, max_entries=max_entries)
+
+    def decorator(func: F) -> F:
+        func.__tool_cache_policy__ = policy  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def get_cache_policy(func: Any) -> Optional[ToolCachePolicy]:
+    """Get the cache policy attached to a function by ``cacheable``, if any."""
+    return getattr(func, "__tool_cache_policy__", None)
+
+
+class ToolResultCache:
+    """LRU cache of tool results keyed by tool and canonicalized JSON arguments.
+
+    Each tool has its own bounded entry table and statistics. The cache is thread-safe
+    and a single instance, ``tool_result_cache``, is shared by every interface in the process.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, "OrderedDict[str, Tuple[Optional[float], Any]]"] = {}
+        self._stats: Dict[str, ToolCacheStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(arguments: Dict[str, Any]) -> str:
+        """Canonicalize tool arguments so equivalent calls share a cache entry."""
+        return json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+    def get(self, tool_key: str, arguments: Dict[str, Any]) -> Any:
+        """Look up a cached result.
+
+        Returns:
+            The cached result, or the module's missing sentinel (see ``is_miss``)
+        """
+        key = self.make_key(arguments)
+        with self._lock:
+            stats = self._stats.setdefault(tool_key, ToolCacheStats())
+            entries = self._entries.get(tool_key)
+            entry = entries.get(key) if entries is not None else None
+            if entry is None:
+                stats.misses += 1
+                return _MISSING
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del entries[key]
+                stats.expirations += 1
+                stats.misses += 1
+                stats.size = len(entries)
+                return _MISSING
+
+            entries.move_to_end(key)
+            stats.hits += 1
+            return value
+
+    @staticmethod
+    def is_miss(value: Any) -> bool:
+        """Check whether a value returned by ``get`` is a cache miss."""
+        return value is _MISSING
+
+    def set(self, tool_key: str, arguments: Dict[str, Any], value: Any, policy: ToolCachePolicy) -> None:
+        """Store a tool result under the tool's policy."""
+        key = self.make_key(arguments)
+        expires_at = time.monotonic() + policy.ttl if policy.ttl is not None else None
+        with self._lock:
+            stats = self._stats.setdefault(tool_key, ToolCacheStats())
+            entries = self._entries.setdefault(tool_key, OrderedDict())
+            entries[key] = (expires_at, value)
+            entries.move_to_end(key)
+            while len(entries) > policy.max_entries:
+                entries.popitem(last=False)
+                stats.evictions += 1
+            stats.size = len(entries)
+
+    def invalidate(self, tool_key: Optional[str] = None) -> None:
+        """Drop cached results for one tool, or for every tool when no key is given."""
+        with self._lock:
+            if tool_key is None:
+                self._entries.clear()
+                for stats in self._stats.values():
+                    stats.size = 0
+            else:
+                self._entries.pop(tool_key, None)
+                if tool_key in self._stats:
+                    self._stats[tool_key].size = 0
+
+    def forget(self, tool_key: str) -> None:
+        """Drop the cached results and statistics of a tool that no longer exists."""
+        with self._lock:
+            self._entries.pop(tool_key, None)
+            self._stats.pop(tool_key, None)
+
+    def stats(self, tool_key: str) -> ToolCacheStats:
+        """Get a copy of the statistics for one tool."""
+        with self._lock:
+            return self._stats.get(tool_key, ToolCacheStats()).model_copy()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics for every tool, including hit rates."""
+        with self._lock:
+            return {
+                tool_key: {**stats.model_dump(), "hit_rate": stats.hit_rate} for tool_key, stats in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Drop all cached results and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+
+tool_result_cache = ToolResultCache()
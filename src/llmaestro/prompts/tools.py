@@ -1,8 +1,17 @@
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, PrivateAttr
 from typing import Dict, Any, Optional, Callable, Type, Union
+from collections import OrderedDict, deque
+import asyncio
+import atexit
+import functools
 import inspect
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+from enum import Enum
+from weakref import WeakKeyDictionary, finalize
 
+from llmaestro.prompts.tool_cache import ToolCachePolicy, get_cache_policy, tool_result_cache
 
 class FunctionGuard(ABC):
     """Abstract base class for guarding function execution with safety checks.
@@ -108,11 +117,30 @@ class BasicFunctionGuard(FunctionGuard):
 
     def __init__(self, func: Union[Callable, Type[BaseModel]]):
         self._func = func
+        self._is_model = isinstance(func, type) and issubclass(func, BaseModel)
+        self._signature = None if self._is_model else inspect.signature(func)
 
     @property
     def function(self) -> Union[Callable, Type[BaseModel]]:
         return self._func
 
+    def __call__(self, **kwargs: Any) -> Any:
+        """Execute the function if it passes safety checks, validating arguments only once.
+
+        For Pydantic models the instance built during validation is returned directly.
+        Subclasses that override ``is_safe_to_run`` have their checks applied as well.
+        """
+        try:
+            instance = self._validate(**kwargs)
+        except ValueError as err:
+            raise ValueError(f"Function {self._func.__name__} is not safe to run with arguments: {kwargs}") from err
+        if type(self).is_safe_to_run is not BasicFunctionGuard.is_safe_to_run and not self.is_safe_to_run(**kwargs):
+            raise ValueError(f"Function {self._func.__name__} is not safe to run with arguments: {kwargs}")
+
+        if instance is not None:
+            return instance
+        return self._func(**kwargs)
+
     def is_safe_to_run(self, **kwargs: Any) -> bool:
         """Basic safety checks for function execution.
 
@@ -122,21 +150,151 @@ class BasicFunctionGuard(FunctionGuard):
 
         Subclass and override this method to add more specific safety checks.
         """
-        if isinstance(self._func, type) and issubclass(self._func, BaseModel):
-            try:
-                # Validate kwargs against Pydantic model
-                self._func(**kwargs)
-                return True
-            except Exception:
-                return False
-        else:
-            # For regular functions, validate against signature
-            try:
-                sig = inspect.signature(self._func)
-                sig.bind(**kwargs)
-                return True
-            except Exception:
-                return False
+        try:
+            self._validate(**kwargs)
+        except ValueError:
+            return False
+        return True
+
+    def _validate(self, **kwargs: Any) -> Optional[BaseModel]:
+        """Validate arguments against the Pydantic model or the function signature.
+
+        Returns:
+            The model instance built while validating a Pydantic model, None for functions
+
+        Raises:
+            ValueError: If the arguments are invalid
+        """
+        try:
+            if self._is_model:
+                return self._func(**kwargs)
+            self._signature.bind(**kwargs)
+            return None
+        except Exception as err:
+            raise ValueError(str(err)) from err
+
+
+class ExecutionMode(str, Enum):
+    """Where a synchronous tool runs."""
+
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ToolExecutionPolicy(BaseModel):
+    """How a tool is executed.
+
+    ``INLINE`` runs synchronous tools on the event loop thread. ``THREAD`` and ``PROCESS``
+    offload them to a worker pool so CPU-heavy tools do not block other requests; tools
+    run in a process pool must be picklable (module-level functions). Async tools always
+    run on the event loop. Timed-out thread or process work cannot be interrupted and
+    finishes in the background.
+    """
+
+    mode: ExecutionMode = Field(default=ExecutionMode.INLINE, description="Where synchronous tools run")
+    max_concurrency: Optional[int] = Field(
+        default=None, ge=1, description="Maximum concurrent executions of the tool per event loop"
+    )
+    timeout: Optional[float] = Field(default=None, gt=0, description="Seconds before an execution is abandoned")
+
+    model_config = ConfigDict(validate_assignment=True)
+
+
+_executors: Dict[ExecutionMode, Executor] = {}
+_executors_lock = threading.Lock()
+# The process pool get_tool_executor created itself, which shutdown_tool_executors owns
+_default_process_pool: Optional[ProcessPoolExecutor] = None
+
+
+def set_tool_executor(mode: ExecutionMode, executor: Optional[Executor], replace: bool = True) -> None:
+    """Set the process-wide executor used for a tool execution mode.
+
+    Args:
+        mode: ``ExecutionMode.THREAD`` or ``ExecutionMode.PROCESS``
+        executor: Executor to use, or None to restore the default
+        replace: Whether to replace an executor that is already configured
+    """
+    if mode == ExecutionMode.INLINE:
+        raise ValueError("Inline tools do not use an executor")
+    with _executors_lock:
+        if executor is None:
+            _executors.pop(mode, None)
+        elif replace or mode not in _executors:
+            _executors[mode] = executor
+
+
+# Result cache keys of instances and closures, dropped from the cache when their owner dies.
+# Finalizers only queue the key: they can run during garbage collection while a lock is held.
+_cache_owners: Dict[str, finalize] = {}
+_dead_cache_owners: "deque[str]" = deque()
+_cache_owners_lock = threading.Lock()
+
+
+def _cache_owner(function: Any) -> Any:
+    """Get the object whose state a tool's results depend on beyond its arguments, if any."""
+    if inspect.ismethod(function):
+        return function.__self__
+    if inspect.isfunction(function) and function.__closure__ is not None:
+        return function
+    return None
+
+
+def _watch_cache_owner(tool_key: str, owner: Any) -> bool:
+    """Arrange for a tool key's cached results to be dropped when its owner is collected.
+
+    Returns:
+        False if the owner cannot be weakly referenced, so its results must not be cached
+    """
+    while _dead_cache_owners:
+        dead_key = _dead_cache_owners.popleft()
+        with _cache_owners_lock:
+            _cache_owners.pop(dead_key, None)
+        tool_result_cache.forget(dead_key)
+
+    with _cache_owners_lock:
+        if tool_key in _cache_owners:
+            return True
+        try:
+            _cache_owners[tool_key] = finalize(owner, _dead_cache_owners.append, tool_key)
+        except TypeError:
+            return False
+    return True
+
+
+def get_tool_executor(mode: ExecutionMode) -> Optional[Executor]:
+    """Get the executor for a tool execution mode.
+
+    Thread-mode tools fall back to the event loop's default executor (None). A shared
+    process pool is created on first use for process-mode tools.
+    """
+    global _default_process_pool
+    with _executors_lock:
+        executor = _executors.get(mode)
+        if executor is None and mode == ExecutionMode.PROCESS:
+            if _default_process_pool is None:
+                atexit.register(shutdown_tool_executors)
+            executor = _executors[mode] = _default_process_pool = ProcessPoolExecutor()
+        return executor
+
+
+def shutdown_tool_executors(wait: bool = True) -> None:
+    """Shut down the process pool created on first use for process-mode tools.
+
+    Called automatically at interpreter exit. Executors installed with
+    ``set_tool_executor`` belong to the caller and are left running. A later
+    process-mode tool creates a new pool.
+
+    Args:
+        wait: Whether to wait for running tool calls to finish
+    """
+    global _default_process_pool
+    with _executors_lock:
+        executor, _default_process_pool = _default_process_pool, None
+        if executor is not None and _executors.get(ExecutionMode.PROCESS) is executor:
+            del _executors[ExecutionMode.PROCESS]
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
 
 
 class ToolParams(BaseModel):
@@ -148,12 +306,52 @@ class ToolParams(BaseModel):
     return_type: Optional[Any] = Field(default=None, description="The return type of the function if available")
     is_async: bool = Field(default=False, description="Whether the function is async")
     source: BasicFunctionGuard = Field(description="The guarded function or model that this tool executes")
+    execution_policy: ToolExecutionPolicy = Field(
+        default_factory=ToolExecutionPolicy, description="Where and how concurrently the tool runs"
+    )
+    cache_policy: Optional[ToolCachePolicy] = Field(
+        default=None, description="Result caching for idempotent tools; None disables caching"
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
 
+    # ToolParams are shared process-wide (see get_tool_params), so the limiter is kept per event loop
+    _semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = PrivateAttr(
+        default_factory=WeakKeyDictionary
+    )
+    _provider_payloads: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            # Formatted payloads are derived from the public fields
+            self._provider_payloads.clear()
+
+    def get_provider_payload(self, provider: str, build: Callable[["ToolParams"], Any]) -> Any:
+        """Get this tool formatted for a provider, building it on first use.
+
+        The payload is cached on the tool until one of its fields changes. Callers must
+        treat the returned payload as read-only.
+
+        Args:
+            provider: Key identifying the provider format (e.g. "openai")
+            build: Function converting the tool into the provider's format
+
+        Returns:
+            The provider-specific tool payload
+        """
+        payload = self._provider_payloads.get(provider)
+        if payload is None:
+            payload = self._provider_payloads[provider] = build(self)
+        return payload
+
     async def execute(self, **kwargs: Any) -> Any:
         """Execute the tool with the given arguments.
 
+        Synchronous tools run inline, in a thread pool or in a process pool according to
+        ``execution_policy``, which also bounds concurrency and execution time. Tools with a
+        ``cache_policy`` reuse results from the process-wide ``tool_result_cache``.
+
         Args:
             **kwargs: Arguments to pass to the function.
 
@@ -163,17 +361,83 @@ class ToolParams(BaseModel):
         Raises:
             ValueError: If no source function is available.
             TypeError: If arguments don't match the function signature.
+            TimeoutError: If the execution exceeds the policy's timeout.
         """
+        cache_key = self.cache_key if self.cache_policy is not None else None
+        if cache_key is not None:
+            cached = tool_result_cache.get(cache_key, kwargs)
+            if not tool_result_cache.is_miss(cached):
+                return cached
+
+        policy = self.execution_policy
         try:
-            result = self.source(**kwargs)
+            if policy.max_concurrency is None:
+                result = await self._run_with_timeout(kwargs)
+            else:
+                semaphore = self._get_semaphore(policy.max_concurrency)
+                async with semaphore:
+                    result = await self._run_with_timeout(kwargs)
+
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(f"Tool {self.name} timed out after {policy.timeout}s") from e
+        except Exception as e:
+            raise TypeError(f"Failed to execute {self.name}: {str(e)}") from e
+
+        if cache_key is not None and self.cache_policy is not None:
+            tool_result_cache.set(cache_key, kwargs, result, self.cache_policy)
+        return result
 
+    @property
+    def cache_key(self) -> Optional[str]:
+        """Key identifying this tool's entries in the result cache.
+
+        Results of bound methods depend on their instance and results of closures on their
+        captured state, so those keys include the identity of the instance or closure. Their
+        entries are dropped once it is garbage collected, so a reused ``id`` never sees them.
+        None means the results cannot be cached safely.
+        """
+        function = self.source.function
+        key = f"{self.name}:{getattr(function, '__module__', '')}.{getattr(function, '__qualname__', '')}"
+        owner = _cache_owner(function)
+        if owner is None:
+            return key
+        key = f"{key}@{id(owner):x}"
+        return key if _watch_cache_owner(key, owner) else None
+
+    def _get_semaphore(self, max_concurrency: int) -> asyncio.Semaphore:
+        """Get the concurrency limiter of this tool for the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores.setdefault(loop, asyncio.Semaphore(max_concurrency))
+        return semaphore
+
+    async def _run_with_timeout(self, kwargs: Dict[str, Any]) -> Any:
+        """Run the tool, enforcing the policy's timeout."""
+        if self.execution_policy.timeout is None:
+            return await self._run(kwargs)
+        return await asyncio.wait_for(self._run(kwargs), timeout=self.execution_policy.timeout)
+
+    async def _run(self, kwargs: Dict[str, Any]) -> Any:
+        """Run the tool according to its execution mode."""
+        mode = self.execution_policy.mode
+        if self.is_async or mode == ExecutionMode.INLINE:
+            result = self.source(**kwargs)
             if self.is_async:
                 result = await result
-
             return result
 
-        except Exception as e:
-            raise TypeError(f"Failed to execute {self.name}: {str(e)}") from e
+        loop = asyncio.get_running_loop()
+        function = self.source.function
+        if mode == ExecutionMode.PROCESS and not (isinstance(function, type) and issubclass(function, BaseModel)):
+            # Validate in this process; only the plain function crosses the process boundary
+            if not self.source.is_safe_to_run(**kwargs):
+                raise ValueError(f"Function {self.name} is not safe to run with arguments: {kwargs}")
+            call = functools.partial(function, **kwargs)
+            return await loop.run_in_executor(get_tool_executor(ExecutionMode.PROCESS), call)
+
+        call = functools.partial(self.source, **kwargs)
+        return await loop.run_in_executor(get_tool_executor(ExecutionMode.THREAD), call)
 
     @staticmethod
     def _get_parameter_schema(param: inspect.Parameter) -> Dict[str, Any]:
@@ -193,8 +457,19 @@ class ToolParams(BaseModel):
         return schema
 
     @classmethod
-    def from_function(cls, func: Callable) -> "ToolParams":
-        """Generate tool parameters from a function."""
+    def from_function(
+        cls,
+        func: Callable,
+        execution_policy: Optional[ToolExecutionPolicy] = None,
+        cache_policy: Optional[ToolCachePolicy] = None,
+    ) -> "ToolParams":
+        """Generate tool parameters from a function.
+
+        Args:
+            func: The function to expose as a tool
+            execution_policy: Optional policy controlling where and how concurrently the tool runs
+            cache_policy: Optional result caching policy; defaults to the one set by ``@cacheable``
+        """
         sig = inspect.signature(func)
         doc = inspect.getdoc(func) or ""
 
@@ -231,6 +506,8 @@ class ToolParams(BaseModel):
             return_type=return_type,
             is_async=is_async,
             source=BasicFunctionGuard(func),
+            execution_policy=execution_policy or ToolExecutionPolicy(),
+            cache_policy=cache_policy or get_cache_policy(func),
         )
 
     @classmethod
@@ -270,3 +547,90 @@ class ToolParams(BaseModel):
                 "strict": strict,
             },
         }
+
+
+_TOOL_PARAMS_CACHE_SIZE = 1024
+_tool_params_cache: "OrderedDict[Any, ToolParams]" = OrderedDict()
+_tool_params_lock = threading.Lock()
+
+
+def _tool_params_key(tool: Any) -> Any:
+    """Get the cache key for a tool, or None when its ToolParams should not be cached.
+
+    Bound methods are keyed by their underlying function so the cache never holds the
+    instance. Closures and lambdas are typically created per call and would only fill
+    the cache while keeping their captured state alive, so they are not cached.
+    """
+    if inspect.ismethod(tool):
+        return tool.__func__
+    if inspect.isfunction(tool) and (tool.__closure__ is not None or tool.__name__ == "<lambda>"):
+        return None
+    return tool
+
+
+def _build_tool_params(tool: Union[Callable, Type[BaseModel]]) -> ToolParams:
+    if isinstance(tool, type) and issubclass(tool, BaseModel):
+        return ToolParams.from_pydantic(tool)
+    if callable(tool):
+        return ToolParams.from_function(tool)
+    raise ValueError(f"Unsupported tool type: {type(tool)}")
+
+
+def _bind_tool_params(template: ToolParams, method: Callable) -> ToolParams:
+    """Copy ToolParams cached for a method's function onto one bound instance."""
+    tool_params = template.model_copy(update={"source": BasicFunctionGuard(method)})
+    # The shallow copy shares private state with the template, so give it its own
+    tool_params._semaphores = WeakKeyDictionary()
+    tool_params._provider_payloads = {}
+    return tool_params
+
+
+def get_tool_params(tool: Union[Callable, Type[BaseModel]]) -> ToolParams:
+    """Get the ToolParams for a function or Pydantic model, generating them once per process.
+
+    Generating tool parameters runs ``inspect.signature`` and Pydantic schema generation,
+    so results are kept in a bounded LRU cache keyed by the function or model object.
+    Bound methods share the entry of their function and get their own copy bound to the
+    instance; closures, lambdas and unhashable callables are built without caching.
+    Cached ToolParams are shared and should not be modified.
+
+    Args:
+        tool: The function or Pydantic model to expose as a tool
+
+    Returns:
+        The tool's ToolParams
+
+    Raises:
+        ValueError: If the tool is neither a Pydantic model nor callable
+    """
+    key = _tool_params_key(tool)
+    try:
+        with _tool_params_lock:
+            cached = _tool_params_cache.get(key) if key is not None else None
+            if cached is not None:
+                _tool_params_cache.move_to_end(key)
+    except TypeError:
+        # Unhashable callable objects cannot be cache keys
+        key = cached = None
+
+    if cached is None:
+        tool_params = _build_tool_params(tool)
+        if key is None:
+            return tool_params
+        if key is not tool:
+            # Keep the bound instance out of the cache
+            tool_params = _bind_tool_params(tool_params, key)
+        with _tool_params_lock:
+            cached = _tool_params_cache.setdefault(key, tool_params)
+            while len(_tool_params_cache) > _TOOL_PARAMS_CACHE_SIZE:
+                _tool_params_cache.popitem(last=False)
+
+    if key is not tool:
+        return _bind_tool_params(cached, tool)
+    return cached
+
+
+def clear_tool_params_cache() -> None:
+    """Drop all cached ToolParams."""
+    with _tool_params_lock:
+        _tool_params_cache.clear()
@@ -4,11 +4,13 @@ from .live_visualizer import LiveVisualizer
 from .chain_visualizer import ChainVisualizer
 from .conversation_visualizer import ConversationVisualizer
 from .base_visualizer import BaseVisualizer, CytoscapeNode, CytoscapeEdge, CytoscapeGraph
+from .timeline_visualizer import TimelineVisualizer
 
 __all__ = [
     "LiveVisualizer",
     "ChainVisualizer",
     "ConversationVisualizer",
+    "TimelineVisualizer",
     "BaseVisualizer",
     "CytoscapeNode",
     "CytoscapeEdge",
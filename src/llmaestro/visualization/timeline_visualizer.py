@@ -0,0 +1,124 @@
+"""Gantt-style visualization of chain execution timelines."""
+
+from pathlib import Path
+from typing import Any, Dict, List, Union
+
+from llmaestro.chains.timeline import ExecutionTimeline
+from llmaestro.visualization.cytoscape_renderer import CytoscapeRenderer, CytoscapeStyle
+
+
+class TimelineVisualizer:
+    """Renders an execution timeline as a Gantt chart using the Cytoscape.js assets.
+
+    Each executed node is a bar positioned by its start time and sized by its duration,
+    preceded by a faint bar for the time it waited after becoming ready. Critical-path
+    nodes are outlined and dependency edges connect the bars.
+    """
+
+    def __init__(self, pixels_per_second: float = 100.0, row_height: float = 50.0):
+        """Initialize the visualizer.
+
+        Args:
+            pixels_per_second: Horizontal scale of the chart
+            row_height: Vertical distance between node rows
+        """
+        self.pixels_per_second = pixels_per_second
+        self.row_height = row_height
+        self.styles = [
+            CytoscapeStyle(
+                "node[type = 'timeline_bar']",
+                {
+                    "shape": "rectangle",
+                    "width": "data(width)",
+                    "height": "30px",
+                    "background-color": "#90CAF9",
+                    "border-color": "#1E88E5",
+                    "text-halign": "right",
+                    "text-margin-x": "6px",
+                    "text-max-width": "300px",
+                },
+            ),
+            CytoscapeStyle(
+                "node[type = 'timeline_wait']",
+                {
+                    "shape": "rectangle",
+                    "width": "data(width)",
+                    "height": "10px",
+                    "background-color": "#E0E0E0",
+                    "border-width": "0px",
+                    "label": "",
+                },
+            ),
+            CytoscapeStyle("node[?critical]", {"border-color": "#E53935", "border-width": "3px"}),
+            CytoscapeStyle("node[status = 'failed']", {"background-color": "#EF9A9A"}),
+        ]
+
+    def get_elements(self, timeline: ExecutionTimeline) -> Dict[str, List[Dict[str, Any]]]:
+        """Convert a timeline into positioned Cytoscape.js elements."""
+        gantt = timeline.to_gantt()
+        nodes: List[Dict[str, Any]] = []
+        edges: List[Dict[str, Any]] = []
+        drawn = set()
+
+        for row, task in enumerate(task for task in gantt["tasks"] if task["started"] is not None):
+            y = row * self.row_height
+            started = task["started"]
+            finished = task["finished"] if task["finished"] is not None else started
+            width = max((finished - started) * self.pixels_per_second, 2.0)
+            wait = (started - task["queued"]) * self.pixels_per_second
+            if wait > 0:
+                nodes.append(
+                    {
+                        "data": {"id": f"{task['id']}:wait", "label": "", "type": "timeline_wait", "width": wait},
+                        "position": {"x": task["queued"] * self.pixels_per_second + wait / 2, "y": y},
+                    }
+                )
+            nodes.append(
+                {
+                    "data": {
+                        "id": task["id"],
+                        "label": f"{task['label']} ({finished - started:.2f}s)",
+                        "type": "timeline_bar",
+                        "width": width,
+                        "critical": task["critical"],
+                        "status": task["status"],
+                        "retries": task.get("retries", 0),
+                    },
+                    "position": {"x": started * self.pixels_per_second + width / 2, "y": y},
+                }
+            )
+            drawn.add(task["id"])
+
+        for task in gantt["tasks"]:
+            for dependency in task["dependencies"]:
+                if task["id"] in drawn and dependency in drawn:
+                    edges.append(
+                        {
+                            "data": {
+                                "id": f"{dependency}->{task['id']}",
+                                "source": dependency,
+                                "target": task["id"],
+                                "label": "",
+                            }
+                        }
+                    )
+        return {"nodes": nodes, "edges": edges}
+
+    def to_html(self, timeline: ExecutionTimeline) -> str:
+        """Render a timeline as a standalone HTML page."""
+        renderer = CytoscapeRenderer()
+        config = renderer.get_config(
+            self.get_elements(timeline), layout={"name": "preset"}, additional_styles=list(self.styles)
+        )
+        return renderer.get_html_template(config)
+
+    def save(self, timeline: ExecutionTimeline, output_path: Union[str, Path]) -> Path:
+        """Write a timeline's HTML page to a file.
+
+        Returns:
+            The path written
+        """
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.to_html(timeline))
+        return path
@@ -0,0 +1,89 @@
+"""Agent testing configuration and fixtures."""
+import asyncio
+from typing import Callable, Dict, List
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool, RuntimeAgent
+from llmaestro.core.models import LLMResponse, TokenUsage
+from llmaestro.llm.llm_registry import LLMRegistry
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+class FakeProcessing:
+    """Replacement for RuntimeAgent.process_prompt with scripted latencies."""
+
+    def __init__(self):
+        self.delays: List[float] = []
+        self.default_delay = 0.0
+        self.calls: List[str] = []
+
+    async def __call__(self, agent: RuntimeAgent, prompt) -> LLMResponse:
+        self.calls.append(agent.agent.id)
+        delay = self.delays.pop(0) if self.delays else self.default_delay
+        await asyncio.sleep(delay)
+        return LLMResponse(
+            content=f"response from {agent.agent.id}",
+            success=True,
+            token_usage=TokenUsage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+
+
+@pytest.fixture
+def fake_processing(monkeypatch) -> FakeProcessing:
+    """Patch agents so prompts are processed without calling a provider."""
+    fake = FakeProcessing()
+
+    async def process_prompt(self, prompt):
+        return await fake(self, prompt)
+
+    monkeypatch.setattr(RuntimeAgent, "process_prompt", process_prompt)
+    return fake
+
+
+@pytest.fixture
+def make_pool(llm_registry, fake_processing) -> Callable[..., AgentPool]:
+    """Factory for agent pools backed by the test registry."""
+
+    def _make(**kwargs) -> AgentPool:
+        pool = AgentPool(llm_registry=llm_registry, **kwargs)
+        pool.loop = asyncio.get_running_loop()
+        return pool
+
+    return _make
+
+
+@pytest.fixture
+def simple_prompt() -> MemoryPrompt:
+    """Prompt with no variables."""
+    return MemoryPrompt(
+        name="simple_prompt",
+        description="Simple prompt",
+        system_prompt="You are a test assistant.",
+        user_prompt="Say hello.",
+    )
+
+
+@pytest.fixture
+def priced_registry(llm_registry) -> LLMRegistry:
+    """Registry with three models that differ in price, speed and context window."""
+    base_name = "gpt-4o-mini"
+    specs = {
+        "expensive-fast": dict(input_cost=0.01, output_cost=0.03, speed=400.0, context=128000),
+        "cheap-slow": dict(input_cost=0.0005, output_cost=0.0015, speed=50.0, context=128000),
+        "cheap-small": dict(input_cost=0.0001, output_cost=0.0002, speed=300.0, context=2048),
+    }
+    registry = LLMRegistry()
+    for name, spec in specs.items():
+        state = llm_registry.model_states[base_name].model_copy(deep=True)
+        state.profile.name = name
+        caps = state.profile.capabilities
+        caps.input_cost_per_1k_tokens = spec["input_cost"]
+        caps.output_cost_per_1k_tokens = spec["output_cost"]
+        caps.typical_speed = spec["speed"]
+        caps.max_context_window = spec["context"]
+        state.runtime_config.max_tokens = 512
+        registry.model_states[name] = state
+        registry.interface_classes[name] = llm_registry.interface_classes[base_name]
+        registry.credentials[name] = llm_registry.credentials[base_name]
+    return registry
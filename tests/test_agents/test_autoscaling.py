@@ -0,0 +1,110 @@
+"""Tests for queue-based admission and autoscaling in the agent pool."""
+import asyncio
+
+import pytest
+
+from llmaestro.agents.agent_pool import PoolSaturatedError
+from llmaestro.agents.models import ScalingPolicy
+
+
+@pytest.mark.asyncio
+async def test_burst_scales_up_then_queues(make_pool, fake_processing, simple_prompt):
+    """A burst grows the pool to max_agents and queues the overflow instead of overloading agents."""
+    pool = make_pool(max_agents=2, scaling_policy=ScalingPolicy(max_queue_depth=10))
+    fake_processing.default_delay = 0.05
+
+    responses = await asyncio.gather(*(pool.execute_prompt(simple_prompt) for _ in range(6)))
+
+    assert all(response.success for response in responses)
+    assert len(pool._active_agents) == 2
+    stats = pool.get_pool_stats()
+    assert stats["scaling"]["scale_ups"] == 2
+    assert stats["scaling"]["queued_requests"] == 4
+    assert stats["scaling"]["rejections"] == 0
+    assert set(stats["queue_depths"].values()) == {0}
+    # Each agent served exactly its share, one prompt at a time
+    assert sorted(fake_processing.calls.count(agent_id) for agent_id in pool._active_agents) == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects(make_pool, fake_processing, simple_prompt):
+    """Requests beyond the queue depth are rejected with PoolSaturatedError."""
+    pool = make_pool(max_agents=1, scaling_policy=ScalingPolicy(max_queue_depth=1))
+    fake_processing.default_delay = 0.05
+
+    results = await asyncio.gather(
+        *(pool.execute_prompt(simple_prompt) for _ in range(3)), return_exceptions=True
+    )
+
+    rejected = [result for result in results if isinstance(result, PoolSaturatedError)]
+    assert len(rejected) == 1
+    assert pool.scaling_metrics.rejected_queue_full == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_timeout_rejects(make_pool, fake_processing, simple_prompt):
+    """A queued request that waits too long is rejected and leaves the queue."""
+    pool = make_pool(max_agents=1, scaling_policy=ScalingPolicy(queue_timeout=0.02))
+    fake_processing.delays = [0.2]
+
+    results = await asyncio.gather(
+        pool.execute_prompt(simple_prompt), pool.execute_prompt(simple_prompt), return_exceptions=True
+    )
+
+    assert results[0].success
+    assert isinstance(results[1], PoolSaturatedError)
+    assert pool.scaling_metrics.rejected_timeout == 1
+    assert all(len(queue) == 0 for queue in pool._queues.values())
+
+
+@pytest.mark.asyncio
+async def test_autoscale_removes_idle_agents(make_pool, fake_processing, simple_prompt):
+    """Idle agents are removed down to the per-model minimum."""
+    pool = make_pool(max_agents=3, scaling_policy=ScalingPolicy(idle_timeout=0.0, min_agents_per_model=1))
+
+    await asyncio.gather(*(pool.execute_prompt(simple_prompt) for _ in range(3)))
+    assert len(pool._active_agents) == 3
+
+    await pool.autoscale()
+
+    assert len(pool._active_agents) == 1
+    assert pool.scaling_metrics.scale_downs == 2
+
+
+@pytest.mark.asyncio
+async def test_rejected_request_hands_on_its_slot(make_pool, fake_processing, simple_prompt):
+    """A request failing its capability check after acquiring an agent frees the slot for the next one."""
+    pool = make_pool(max_agents=1, scaling_policy=ScalingPolicy(queue_timeout=0.5))
+    fake_processing.default_delay = 0.02
+
+    running = asyncio.create_task(pool.execute_prompt(simple_prompt))
+    await asyncio.sleep(0)
+    agent = next(iter(pool._active_agents.values()))
+    agent.agent.capabilities = agent.agent.capabilities.model_copy(update={"supports_streaming": False})
+    rejected = asyncio.create_task(pool.execute_prompt(simple_prompt, required_capabilities={"supports_streaming"}))
+    queued = asyncio.create_task(pool.execute_prompt(simple_prompt))
+
+    assert (await running).success
+    with pytest.raises(ValueError, match="required capabilities"):
+        await rejected
+    assert (await queued).success
+    assert pool.scaling_metrics.rejected_timeout == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_agent_respects_max_agents(make_pool, fake_processing, simple_prompt):
+    """Agents still being created count against max_agents, and callers beyond it share them."""
+    pool = make_pool(max_agents=2)
+    create_agent = pool._create_agent
+
+    async def slow_create_agent(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await create_agent(*args, **kwargs)
+
+    pool._create_agent = slow_create_agent
+
+    agents = await asyncio.gather(*(pool.get_agent(prompt=simple_prompt) for _ in range(5)))
+
+    assert len(pool._active_agents) == 2
+    assert {agent.agent.id for agent in agents} == set(pool._active_agents)
+    assert pool._pending_creations == 0
@@ -0,0 +1,133 @@
+"""Tests for run budgets enforced by the agent pool."""
+import asyncio
+from typing import Callable, List
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool, RuntimeAgent
+from llmaestro.agents.budget import BudgetExceededError, BudgetMode, RunBudget, use_budget
+from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, ChainStep, NodeType, RetryStrategy
+from llmaestro.core.models import LLMResponse, TokenUsage
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+@pytest.fixture
+def served(monkeypatch) -> List[tuple]:
+    """Patch agents to answer with 100 tokens of usage, recording (model, max_output_tokens) per request."""
+    calls: List[tuple] = []
+
+    async def process_prompt(self: RuntimeAgent, prompt) -> LLMResponse:
+        calls.append((self.model_name, self.llm_instance.interface.max_output_tokens))
+        await asyncio.sleep(0.01)
+        return LLMResponse(
+            content="ok",
+            success=True,
+            token_usage=TokenUsage(prompt_tokens=60, completion_tokens=40, total_tokens=100),
+        )
+
+    monkeypatch.setattr(RuntimeAgent, "process_prompt", process_prompt)
+    return calls
+
+
+@pytest.fixture
+def make_budget_pool(priced_registry, served) -> Callable[[], AgentPool]:
+    """Factory for pools that route to expensive-fast (the first registered model) by default."""
+
+    def _make() -> AgentPool:
+        pool = AgentPool(llm_registry=priced_registry, max_agents=20)
+        pool.loop = asyncio.get_running_loop()
+        return pool
+
+    return _make
+
+
+@pytest.mark.asyncio
+async def test_reserve_and_reconcile(make_budget_pool, simple_prompt, served):
+    pool = make_budget_pool()
+    budget = RunBudget(max_tokens=10_000)
+
+    await pool.execute_prompt(simple_prompt, budget=budget)
+
+    assert served == [("expensive-fast", 512)]
+    assert budget.spent_tokens == 100
+    assert budget.reserved_tokens == 0
+    assert budget.spent_cost == pytest.approx((60 * 0.01 + 40 * 0.03) / 1000)
+
+
+@pytest.mark.asyncio
+async def test_abort_when_exhausted(make_budget_pool, simple_prompt, served):
+    pool = make_budget_pool()
+    budget = RunBudget(max_tokens=300)
+
+    with pytest.raises(BudgetExceededError):
+        await pool.execute_prompt(simple_prompt, budget=budget)
+
+    assert served == []
+    assert budget.rejected_requests == 1
+    assert budget.remaining_tokens == 300
+
+
+@pytest.mark.asyncio
+async def test_degrade_to_cheaper_model(make_budget_pool, simple_prompt, served):
+    """A request the requested model cannot afford moves to the most expensive model that fits."""
+    pool = make_budget_pool()
+    # expensive-fast needs ~0.0155 for 512 output tokens; cheap-slow ~0.0008
+    budget = RunBudget(max_cost=0.005, mode=BudgetMode.DEGRADE)
+
+    await pool.execute_prompt(simple_prompt, budget=budget)
+
+    assert served == [("cheap-slow", 512)]
+    assert budget.degraded_requests == 1
+
+
+@pytest.mark.asyncio
+async def test_degrade_shrinks_max_tokens(make_budget_pool, simple_prompt, served):
+    pool = make_budget_pool()
+    budget = RunBudget(max_tokens=300, mode=BudgetMode.DEGRADE, min_output_tokens=64)
+
+    await pool.execute_prompt(simple_prompt, budget=budget)
+
+    (model, max_output), = served
+    assert model == "expensive-fast"
+    assert 64 <= max_output < 300
+    # The cap only applies to the budgeted request
+    assert pool._active_agents and all(
+        agent.llm_instance.interface.max_output_tokens == 512 for agent in pool._active_agents.values()
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_cannot_overshoot(make_budget_pool, simple_prompt, served):
+    """Reservations are taken before requests start, so concurrent requests stay within the budget."""
+    pool = make_budget_pool()
+    budget = RunBudget(max_tokens=3 * 600)
+
+    with use_budget(budget):
+        results = await asyncio.gather(
+            *(pool.execute_prompt(simple_prompt) for _ in range(10)), return_exceptions=True
+        )
+
+    assert sum(isinstance(result, LLMResponse) for result in results) == 3
+    assert sum(isinstance(result, BudgetExceededError) for result in results) == 7
+    assert budget.spent_tokens == 300
+    assert budget.reserved_tokens == 0
+
+
+@pytest.mark.asyncio
+async def test_chain_run_budget_is_not_retried(make_budget_pool, served):
+    """Every request of a chain run is charged to its budget, and exhausting it fails the run without retries."""
+    pool = make_budget_pool()
+    graph = ChainGraph(agent_pool=pool)
+    for node_id in ("first", "second"):
+        prompt = MemoryPrompt(name=node_id, description=node_id, system_prompt="", user_prompt=node_id)
+        step = ChainStep(prompt=prompt, retry_strategy=RetryStrategy(max_retries=3, delay=0))
+        graph.add_node(ChainNode(id=node_id, step=step, node_type=NodeType.SEQUENTIAL))
+    graph.add_edge(ChainEdge(source_id="first", target_id="second", edge_type="next"))
+    budget = RunBudget(max_tokens=600)
+
+    with pytest.raises(BudgetExceededError):
+        await graph.execute(budget=budget)
+
+    assert len(served) == 1
+    assert budget.spent_tokens == 100
+    assert budget.rejected_requests == 1
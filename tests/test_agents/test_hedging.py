@@ -0,0 +1,117 @@
+"""Tests for hedged request execution in the agent pool."""
+import asyncio
+
+import pytest
+
+from llmaestro.agents.latency import LatencyTracker
+from llmaestro.agents.models import HedgingPolicy, ScalingPolicy
+
+
+def test_latency_tracker_percentile():
+    """Percentiles use nearest rank over the rolling window."""
+    tracker = LatencyTracker(window_size=5)
+    for latency in [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]:
+        tracker.record("model", latency)
+
+    assert tracker.count("model") == 5
+    assert tracker.percentile("model", 50) == pytest.approx(0.4)
+    assert tracker.percentile("model", 95) == pytest.approx(0.6)
+    assert tracker.percentile("missing", 95) is None
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_does_not_hedge(make_pool, fake_processing, simple_prompt):
+    """A primary response inside the threshold never fires a hedge."""
+    pool = make_pool(max_agents=4, hedging_policy=HedgingPolicy(threshold=0.5, max_hedge_ratio=1.0))
+    fake_processing.delays = [0.0]
+
+    response = await pool.execute_prompt(simple_prompt)
+
+    assert response.success
+    assert pool.hedging_metrics.hedges_fired == 0
+    assert len(fake_processing.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_loser_cancelled(make_pool, fake_processing, simple_prompt):
+    """A slow primary triggers a hedge whose response wins."""
+    pool = make_pool(max_agents=4, hedging_policy=HedgingPolicy(threshold=0.05, max_hedge_ratio=1.0))
+    fake_processing.delays = [5.0, 0.0]
+
+    response = await pool.execute_prompt(simple_prompt)
+
+    primary_id, hedge_id = fake_processing.calls
+    assert response.content == f"response from {hedge_id}"
+    assert pool.hedging_metrics.hedges_fired == 1
+    assert pool.hedging_metrics.hedges_won == 1
+    assert pool.prompts == {}
+    assert all(not agent.active_prompts for agent in pool._active_agents.values())
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_limits_extra_requests(make_pool, fake_processing, simple_prompt):
+    """Hedges beyond the budget ratio are skipped."""
+    pool = make_pool(max_agents=4, hedging_policy=HedgingPolicy(threshold=0.01, max_hedge_ratio=0.5))
+    fake_processing.default_delay = 0.05
+
+    for _ in range(4):
+        await pool.execute_prompt(simple_prompt)
+
+    metrics = pool.hedging_metrics
+    assert metrics.total_requests == 4
+    assert metrics.hedges_fired == 2
+    assert metrics.hedges_skipped_budget == 2
+    assert pool.get_pool_stats()["hedging"]["hedges_fired"] == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_hedges_respect_max_agents(make_pool, fake_processing, simple_prompt):
+    """Hedge agents still being created count against max_agents."""
+    pool = make_pool(max_agents=2)
+    primary = await pool.get_agent(prompt=simple_prompt)
+    create_agent = pool._create_agent
+
+    async def slow_create_agent(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await create_agent(*args, **kwargs)
+
+    pool._create_agent = slow_create_agent
+    policy = HedgingPolicy(threshold=0.01)
+
+    hedges = await asyncio.gather(*(pool._select_hedge_agent(primary, policy) for _ in range(3)))
+
+    assert len(pool._active_agents) == 2
+    assert sum(hedge is not None for hedge in hedges) == 1
+    assert pool._pending_creations == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_primary_records_latency_lower_bound(make_pool, fake_processing, simple_prompt):
+    """The slow primary a hedge beats still contributes a latency sample."""
+    pool = make_pool(max_agents=4, hedging_policy=HedgingPolicy(threshold=0.05, max_hedge_ratio=1.0))
+    fake_processing.delays = [5.0, 0.0]
+
+    await pool.execute_prompt(simple_prompt)
+    await asyncio.sleep(0)
+
+    model_name = next(iter(pool._active_agents.values())).model_name
+    assert pool.latency_tracker.count(model_name) == 2
+    assert pool.latency_tracker.percentile(model_name, 100) >= 0.05
+
+
+@pytest.mark.asyncio
+async def test_hedges_respect_scaling_capacity(make_pool, fake_processing, simple_prompt):
+    """With a scaling policy, hedges only use free slots and never overload busy agents."""
+    pool = make_pool(
+        max_agents=2,
+        scaling_policy=ScalingPolicy(),
+        hedging_policy=HedgingPolicy(threshold=0.01, max_hedge_ratio=1.0),
+    )
+    fake_processing.default_delay = 0.1
+
+    responses = await asyncio.gather(pool.execute_prompt(simple_prompt), pool.execute_prompt(simple_prompt))
+
+    assert all(response.success for response in responses)
+    assert pool.hedging_metrics.hedges_fired == 0
+    assert pool.hedging_metrics.hedges_skipped_no_agent == 2
+    assert len(fake_processing.calls) == 2
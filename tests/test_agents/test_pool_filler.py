@@ -0,0 +1,83 @@
+"""Tests for concurrent pool filling and warmup."""
+import asyncio
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.agents.pool_filler import PoolFiller
+
+
+@pytest.fixture
+def creation_tracker(monkeypatch):
+    """Slow down agent creation and record peak concurrency."""
+    state = {"active": 0, "peak": 0}
+    original = AgentPool._create_agent
+
+    async def slow_create(self, model_name, description=None):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        try:
+            await asyncio.sleep(0.02)
+            return await original(self, model_name, description)
+        finally:
+            state["active"] -= 1
+
+    monkeypatch.setattr(AgentPool, "_create_agent", slow_create)
+    return state
+
+
+@pytest.fixture
+def agent_type(llm_registry) -> str:
+    """An agent type supported by at least one model in the test registry."""
+    filler = PoolFiller(llm_registry)
+    for name, caps in filler.AGENT_CAPABILITY_SETS.items():
+        if filler.get_models_by_capabilities(caps):
+            return name
+    pytest.skip("No agent type is supported by the test registry")
+
+
+@pytest.mark.asyncio
+async def test_fill_pool_is_concurrent_and_bounded(make_pool, llm_registry, creation_tracker, agent_type):
+    """Agents are created in parallel without exceeding max_concurrency."""
+    pool = make_pool(max_agents=10)
+
+    reports = await PoolFiller(llm_registry).fill_pool(pool, {agent_type: 6}, max_concurrency=3)
+
+    assert len(reports) == 6
+    assert all(report.success and report.creation_time > 0 for report in reports)
+    assert creation_tracker["peak"] == 3
+    assert len(pool._active_agents) == 6
+
+
+@pytest.mark.asyncio
+async def test_fill_pool_reports_full_pool(make_pool, llm_registry, agent_type):
+    """Agents beyond the pool size are reported as failures."""
+    pool = make_pool(max_agents=2)
+
+    reports = await PoolFiller(llm_registry).fill_pool(pool, {agent_type: 3})
+
+    assert sum(report.success for report in reports) == 2
+    assert [report.error for report in reports if not report.success][0].startswith("Agent pool is full")
+    assert len(pool._active_agents) == 2
+
+
+@pytest.mark.asyncio
+async def test_warmup_and_health_check(make_pool, llm_registry, agent_type):
+    """Warmup latency is reported and agents failing the health check are removed."""
+    pool = make_pool(max_agents=10)
+    checked = []
+
+    async def health_check(agent):
+        checked.append(agent.agent.id)
+        if len(checked) == 2:
+            raise RuntimeError("unreachable")
+
+    reports = await PoolFiller(llm_registry).fill_pool(
+        pool, {agent_type: 3}, max_concurrency=1, warmup=True, health_check=health_check
+    )
+
+    assert all(report.warmup_time is not None for report in reports)
+    assert [report.success for report in reports] == [True, False, True]
+    assert reports[1].error == "unreachable"
+    assert set(pool._active_agents) == {reports[0].agent_id, reports[2].agent_id}
+    assert all(agent.llm_instance.is_initialized for agent in pool._active_agents.values())
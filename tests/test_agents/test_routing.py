@@ -0,0 +1,55 @@
+"""Tests for cost-aware model routing in the agent pool."""
+import asyncio
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.agents.models import RoutingPolicy
+
+
+def test_cheapest_fitting_model_wins(priced_registry):
+    """Pure cost routing picks the cheapest model whose context window fits the request."""
+    pool = AgentPool(llm_registry=priced_registry, routing_policy=RoutingPolicy(cost_weight=1.0))
+
+    assert pool.rank_models(input_tokens=100)[0][0] == "cheap-small"
+    # 4000 input tokens no longer fit in the small model's 2048-token window
+    ranked = pool.rank_models(input_tokens=4000)
+    assert [name for name, _ in ranked][0] == "cheap-slow"
+    assert "cheap-small" not in dict(ranked)
+
+
+def test_latency_weight_prefers_faster_model(priced_registry):
+    """Pure latency routing picks the fastest model."""
+    pool = AgentPool(llm_registry=priced_registry, routing_policy=RoutingPolicy(cost_weight=0.0))
+
+    assert pool.rank_models(input_tokens=4000)[0][0] == "expensive-fast"
+
+
+def test_capability_filter_and_no_fit(priced_registry):
+    """Unsupported capabilities and oversized requests yield no candidates."""
+    pool = AgentPool(llm_registry=priced_registry, routing_policy=RoutingPolicy())
+
+    assert pool.rank_models(required_capabilities={"supports_embeddings"}, input_tokens=10) == []
+    assert pool.rank_models(input_tokens=10_000_000) == []
+
+
+@pytest.mark.asyncio
+async def test_get_agent_routes_by_prompt_size(priced_registry, simple_prompt):
+    """get_agent uses the prompt's estimated size to route."""
+    pool = AgentPool(llm_registry=priced_registry, routing_policy=RoutingPolicy(cost_weight=1.0))
+    pool.loop = asyncio.get_running_loop()
+
+    assert pool.estimate_input_tokens(simple_prompt) > 0
+    agent = await pool.get_agent(prompt=simple_prompt)
+    assert agent.model_name == "cheap-small"
+
+
+@pytest.mark.asyncio
+async def test_estimate_latency_prefers_observed_samples(priced_registry, simple_prompt):
+    """Latency estimates use observed samples of the routed model, then its typical speed."""
+    pool = AgentPool(llm_registry=priced_registry, routing_policy=RoutingPolicy(cost_weight=1.0))
+
+    # cheap-small: 512 max output tokens at 300 tokens/s
+    assert pool.estimate_latency(simple_prompt) == pytest.approx(512 / 300)
+    pool.latency_tracker.record("cheap-small", 2.0)
+    assert pool.estimate_latency(simple_prompt) == 2.0
@@ -0,0 +1,42 @@
+"""Tests for streaming prompts through the agent pool."""
+import pytest
+
+from llmaestro.agents.agent_pool import RuntimeAgent
+from llmaestro.core.models import LLMResponse, TokenUsage
+
+
+@pytest.fixture
+def fake_stream(monkeypatch) -> None:
+    """Patch agents so streamed prompts yield three chunks without calling a provider."""
+
+    async def stream_prompt(self, prompt):
+        for word in ("a", "b", "c"):
+            yield LLMResponse(
+                content=word, success=True, token_usage=TokenUsage(prompt_tokens=0, completion_tokens=1, total_tokens=1)
+            )
+
+    monkeypatch.setattr(RuntimeAgent, "stream_prompt", stream_prompt)
+
+
+@pytest.mark.asyncio
+async def test_stream_holds_agent_slot_until_closed(make_pool, fake_stream, simple_prompt):
+    pool = make_pool(max_agents=1)
+    chunks = []
+
+    async for chunk in pool.stream_prompt(simple_prompt):
+        chunks.append(chunk.content)
+        assert pool.get_pool_stats()["active_prompts"] == 1
+
+    assert chunks == ["a", "b", "c"]
+    assert pool.get_pool_stats()["active_prompts"] == 0
+
+
+@pytest.mark.asyncio
+async def test_non_streaming_model_yields_whole_response(make_pool, fake_stream, fake_processing, simple_prompt):
+    pool = make_pool(max_agents=1)
+    agent = await pool.get_agent()
+    agent.agent.capabilities = agent.agent.capabilities.model_copy(update={"supports_streaming": False})
+
+    chunks = [chunk async for chunk in pool.stream_prompt(simple_prompt)]
+
+    assert [chunk.content for chunk in chunks] == [f"response from {agent.agent.id}"]
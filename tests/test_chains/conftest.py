@@ -3,9 +3,11 @@
 import pytest
 from datetime import datetime
 from typing import Dict, Any, Callable, List, Optional, Union
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 from enum import Enum
 
+from llmaestro.agents.agent_pool import AgentPool
 from llmaestro.chains.chains import (
     NodeType,
     AgentType,
@@ -18,7 +20,7 @@ from llmaestro.chains.chains import (
     ChainEdge,
     ChainGraph,
 )
-from llmaestro.core.models import TokenUsage
+from llmaestro.core.models import LLMResponse as CoreLLMResponse, TokenUsage
 from llmaestro.prompts.base import BasePrompt
 from llmaestro.prompts.loader import PromptLoader
 from llmaestro.prompts.types import (
@@ -207,3 +209,27 @@ def output_transform() -> Callable[[LLMResponse], Dict[str, Any]]:
     def transform(response: LLMResponse) -> Dict[str, Any]:
         return {"processed": response.content}
     return transform
+
+
+def _llm_response(content: str) -> CoreLLMResponse:
+    return CoreLLMResponse(
+        content=content,
+        success=True,
+        token_usage=TokenUsage(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+    )
+
+
+@pytest.fixture
+def make_response() -> Callable[[str], CoreLLMResponse]:
+    """Factory for successful LLM responses with the given content."""
+    return _llm_response
+
+
+@pytest.fixture
+def scripted_pool() -> Callable[..., AgentPool]:
+    """Factory for agent pool mocks that answer prompts with scripted response contents."""
+    def factory(*contents: str) -> AgentPool:
+        pool = MagicMock(spec=AgentPool)
+        pool.execute_prompt = AsyncMock(side_effect=[_llm_response(content) for content in contents])
+        return pool
+    return factory
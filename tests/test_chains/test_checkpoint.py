@@ -0,0 +1,175 @@
+"""Tests for checkpointing and resuming chain runs."""
+import shutil
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import (
+    ChainEdge,
+    ChainGraph,
+    ChainNode,
+    ChainStep,
+    MapElementResult,
+    MapResult,
+    NodeType,
+    RetryStrategy,
+)
+from llmaestro.chains.checkpoint import ChainCheckpointer, decode_result, encode_result, register_result_model
+from llmaestro.core.storage import FileSystemArtifactStorage
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+@pytest.fixture
+def checkpointer(tmp_path) -> ChainCheckpointer:
+    return ChainCheckpointer(FileSystemArtifactStorage.create(tmp_path / "checkpoints"))
+
+
+@pytest.fixture
+def flaky_pool(make_response) -> AgentPool:
+    """Agent pool mock that fails prompts named in ``pool.failing``."""
+    pool = MagicMock(spec=AgentPool)
+    pool.failing = set()
+
+    async def execute_prompt(prompt, *args, **kwargs):
+        if prompt.name in pool.failing:
+            raise RuntimeError(f"{prompt.name} failed")
+        return make_response(f"{prompt.name} done")
+
+    pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    return pool
+
+
+def build_chain(pool, checkpointer) -> ChainGraph:
+    """Linear chain a -> b -> c with a stable ID."""
+    graph = ChainGraph(id="nightly-report", agent_pool=pool, checkpointer=checkpointer)
+    for node_id in ("a", "b", "c"):
+        prompt = MemoryPrompt(name=node_id, description=node_id, system_prompt="", user_prompt=node_id)
+        step = ChainStep(prompt=prompt, retry_strategy=RetryStrategy(max_retries=0))
+        graph.add_node(ChainNode(id=node_id, step=step, node_type=NodeType.SEQUENTIAL))
+    graph.add_edge(ChainEdge(source_id="a", target_id="b", edge_type="next"))
+    graph.add_edge(ChainEdge(source_id="b", target_id="c", edge_type="next"))
+    return graph
+
+
+def prompts_sent(pool) -> list:
+    return [call.args[0].name for call in pool.execute_prompt.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_completed_nodes(flaky_pool, checkpointer):
+    """A failed run resumes at the failed node, reusing checkpointed results."""
+    graph = build_chain(flaky_pool, checkpointer)
+    flaky_pool.failing = {"c"}
+
+    with pytest.raises(RuntimeError, match="c failed"):
+        await graph.execute(run_id="run-1")
+    assert prompts_sent(flaky_pool) == ["a", "b", "c"]
+
+    # A fresh graph and checkpointer stand in for a restarted process
+    flaky_pool.failing = set()
+    flaky_pool.execute_prompt.reset_mock()
+    restarted = build_chain(flaky_pool, ChainCheckpointer(checkpointer.storage))
+
+    results = await restarted.resume("run-1")
+
+    assert prompts_sent(flaky_pool) == ["c"]
+    assert [results[node_id].content for node_id in ("a", "b", "c")] == ["a done", "b done", "c done"]
+
+    flaky_pool.execute_prompt.reset_mock()
+    assert (await restarted.resume("run-1"))["c"].content == "c done"
+    assert prompts_sent(flaky_pool) == []
+
+
+@pytest.mark.asyncio
+async def test_checkpoints_are_written_behind(flaky_pool, checkpointer):
+    """Snapshots recorded during a run are coalesced into background writes."""
+    graph = build_chain(flaky_pool, checkpointer)
+
+    await graph.execute(run_id="run-2")
+
+    snapshot = await checkpointer.load("run-2")
+    assert snapshot["status"] == "completed"
+    assert snapshot["executed"] == ["a", "b", "c"]
+    assert checkpointer.metrics.recorded == 4
+    assert 1 <= checkpointer.metrics.written <= checkpointer.metrics.recorded
+    assert checkpointer.metrics.written + checkpointer.metrics.coalesced == checkpointer.metrics.recorded
+
+
+@pytest.mark.asyncio
+async def test_resume_errors(flaky_pool, checkpointer):
+    """Resuming needs a checkpointer and a checkpoint of the same graph."""
+    with pytest.raises(ValueError, match="checkpointer"):
+        await build_chain(flaky_pool, None).resume("run-1")
+    with pytest.raises(ValueError, match="No checkpoint"):
+        await build_chain(flaky_pool, checkpointer).resume("missing")
+
+    await build_chain(flaky_pool, checkpointer).execute(run_id="run-3")
+    other = ChainGraph(id="other", agent_pool=flaky_pool, checkpointer=checkpointer)
+    with pytest.raises(ValueError, match="belongs to chain"):
+        await other.resume("run-3")
+
+
+def test_result_encoding_round_trip(make_response):
+    """Models, map results and plain data survive encoding."""
+    value = {
+        "response": make_response("hi"),
+        "map": MapResult(
+            elements=[
+                MapElementResult(index=0, item="x", output="X"),
+                MapElementResult(index=1, item="y", error=ValueError("bad")),
+            ]
+        ),
+        "plain": [1, "two", None],
+    }
+
+    decoded = decode_result(encode_result(value))
+
+    assert decoded["response"] == value["response"]
+    assert decoded["map"].outputs == ["X"]
+    assert str(decoded["map"].failures[0].error) == "bad"
+    assert decoded["plain"] == [1, "two", None]
+    with pytest.raises(TypeError):
+        encode_result(object())
+
+
+@pytest.mark.asyncio
+async def test_write_through_survives_crash_before_flush(flaky_pool, tmp_path):
+    """With write_through, a completed node is on disk before the next node starts."""
+    storage = FileSystemArtifactStorage.create(tmp_path / "checkpoints")
+    graph = build_chain(flaky_pool, ChainCheckpointer(storage, write_through=True))
+    crashed = tmp_path / "crashed"
+    execute_prompt = flaky_pool.execute_prompt.side_effect
+
+    async def crash_during_b(prompt, *args, **kwargs):
+        if prompt.name == "b":
+            # Storage as a process killed at this point would have left it
+            shutil.copytree(tmp_path / "checkpoints", crashed)
+        return await execute_prompt(prompt, *args, **kwargs)
+
+    flaky_pool.execute_prompt.side_effect = crash_during_b
+    await graph.execute(run_id="run-4")
+
+    flaky_pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    restarted = build_chain(flaky_pool, ChainCheckpointer(FileSystemArtifactStorage.create(crashed)))
+    results = await restarted.resume("run-4")
+
+    assert prompts_sent(flaky_pool) == ["b", "c"]
+    assert results["a"].content == "a done"
+
+
+class Report(BaseModel):
+    title: str
+
+
+def test_only_registered_models_are_rebuilt():
+    """Stored data cannot make decoding import or build arbitrary types."""
+    with pytest.raises(TypeError, match="not registered"):
+        decode_result({"__model__": "os:system", "data": {}})
+    with pytest.raises(TypeError, match="not registered"):
+        encode_result(Report(title="q3"))
+
+    register_result_model(Report)
+
+    assert decode_result(encode_result(Report(title="q3"))) == Report(title="q3")
@@ -0,0 +1,92 @@
+"""Tests for compiled chain plans and incremental cycle detection."""
+import pytest
+
+from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, ChainStep, NodeType
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+@pytest.fixture
+def step() -> ChainStep:
+    prompt = MemoryPrompt(name="noop", description="noop", system_prompt="", user_prompt="noop")
+    return ChainStep(prompt=prompt)
+
+
+def build(step: ChainStep, edges, verify_acyclic: bool = True) -> ChainGraph:
+    graph = ChainGraph(verify_acyclic=verify_acyclic)
+    for node_id in sorted({node_id for edge in edges for node_id in edge}):
+        graph.add_node(ChainNode(id=node_id, step=step, node_type=NodeType.SEQUENTIAL))
+    for source, target in edges:
+        graph.add_edge(ChainEdge(source_id=source, target_id=target, edge_type="next"))
+    return graph
+
+
+def test_plan_has_levels_and_dependencies(step):
+    """A diamond compiles into three levels with per-node dependency lists."""
+    graph = build(step, [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")])
+
+    plan = graph.compile()
+
+    assert plan.roots == ("a",)
+    assert plan.levels == (("a",), ("b", "c"), ("d",))
+    assert plan.order[0] == "a" and plan.order[-1] == "d"
+    assert sorted(plan.dependencies["d"]) == ["b", "c"]
+    assert graph.get_execution_order() == [["a"], ["b", "c"], ["d"]]
+    assert graph.compile() is plan
+
+
+def test_add_edge_rejects_cycles(step):
+    """An edge whose target already reaches its source is rejected."""
+    graph = build(step, [("a", "b"), ("b", "c")])
+
+    with pytest.raises(ValueError, match="would create a cycle"):
+        graph.add_edge(ChainEdge(source_id="c", target_id="a", edge_type="next"))
+    with pytest.raises(ValueError, match="would create a cycle"):
+        graph.add_edge(ChainEdge(source_id="b", target_id="b", edge_type="next"))
+    assert len(graph.edges) == 2
+
+
+def test_unverified_cycles_fail_at_compile(step):
+    """Graphs built without verification report the cycle when compiled."""
+    graph = build(step, [("a", "b"), ("b", "c"), ("c", "a")], verify_acyclic=False)
+
+    assert graph.find_cycle() == ["a", "b", "c", "a"]
+    with pytest.raises(ValueError, match="Cycle detected in graph: a -> b -> c -> a"):
+        graph.compile()
+
+
+def test_direct_edge_list_changes_are_seen(step):
+    """Edges appended to the list directly still take part in cycle checks."""
+    graph = build(step, [("a", "b")])
+    graph.edges.append(ChainEdge(source_id="b", target_id="a", edge_type="next"))
+
+    assert not graph.is_acyclic()
+
+
+def test_in_place_edits_recompile(step):
+    """Replacing a node or an edge directly, with the counts unchanged, rebuilds the plan."""
+    graph = build(step, [("a", "b"), ("b", "c")])
+    plan = graph.compile()
+
+    replacement = ChainNode(id="b", step=step, node_type=NodeType.PARALLEL)
+    graph.nodes["b"] = replacement
+    assert graph.compile().nodes["b"] is replacement
+
+    graph.edges[1] = ChainEdge(source_id="a", target_id="c", edge_type="next")
+    rebuilt = graph.compile()
+    assert rebuilt is not plan
+    assert rebuilt.levels == (("a",), ("b", "c"))
+    assert graph.compile() is rebuilt
+
+
+def test_long_chains_build_and_compile(step):
+    """Building and checking a 10k-node chain is linear and not recursion-bound."""
+    graph = ChainGraph()
+    previous = None
+    for index in range(10_000):
+        node_id = graph.add_node(ChainNode(id=f"n{index}", step=step, node_type=NodeType.SEQUENTIAL))
+        if previous:
+            graph.add_edge(ChainEdge(source_id=previous, target_id=node_id, edge_type="next"))
+        previous = node_id
+
+    assert graph.find_cycle() is None
+    assert len(graph.compile().levels) == 10_000
@@ -0,0 +1,87 @@
+"""Tests for conditional branch semantics in chain execution."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, ChainStep, ConditionalNode, NodeType
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+@pytest.fixture
+def recording_pool(make_response) -> AgentPool:
+    """Agent pool mock that answers with the prompt name."""
+    pool = MagicMock(spec=AgentPool)
+    pool.execute_prompt = AsyncMock(side_effect=lambda prompt, *args, **kwargs: make_response(prompt.name))
+    return pool
+
+
+def node(node_id: str, inputs_seen: dict) -> ChainNode:
+    """Regular node that records which dependency results it received."""
+
+    def input_transform(context, data):
+        inputs_seen[node_id] = sorted(data["dependency_results"])
+        return {}
+
+    prompt = MemoryPrompt(name=node_id, description=node_id, system_prompt="", user_prompt=node_id)
+    step = ChainStep(prompt=prompt, input_transform=input_transform)
+    return ChainNode(id=node_id, step=step, node_type=NodeType.AGENT)
+
+
+def build_graph(pool, inputs_seen, take_yes: bool) -> ChainGraph:
+    """start -> cond -(yes)-> a -> join
+                    -(no)--> b -> c -> join
+       start -> d, b -> d
+    """
+    graph = ChainGraph(agent_pool=pool)
+    for node_id in ("start", "a", "b", "c", "d", "join"):
+        graph.add_node(node(node_id, inputs_seen))
+    graph.add_node(ConditionalNode(id="cond", conditions={"yes": lambda _: take_yes, "no": lambda _: True}))
+
+    for edge_id, source, target in [
+        (None, "start", "cond"),
+        ("yes", "cond", "a"),
+        ("no", "cond", "b"),
+        (None, "b", "c"),
+        (None, "a", "join"),
+        (None, "c", "join"),
+        (None, "start", "d"),
+        (None, "b", "d"),
+    ]:
+        edge = ChainEdge(source_id=source, target_id=target, edge_type="next")
+        if edge_id:
+            edge.id = edge_id
+        graph.add_edge(edge)
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_untaken_branch_is_skipped_transitively(recording_pool):
+    """No node on the rejected branch runs, and joins wait only on live inputs."""
+    inputs_seen: dict = {}
+    graph = build_graph(recording_pool, inputs_seen, take_yes=True)
+    run = graph.create_run()
+
+    await graph._execute_run(graph.compile(), run, recording_pool)
+
+    called = [call.args[0].name for call in recording_pool.execute_prompt.await_args_list]
+    assert sorted(called) == ["a", "d", "join", "start"]
+    assert sorted(run.skipped) == ["b", "c"]
+    assert run.results["cond"] == "yes"
+    assert inputs_seen["d"] == ["start"]
+    assert inputs_seen["join"] == ["a"]
+    assert run.executed.index("start") < run.executed.index("cond") < run.executed.index("a")
+
+
+@pytest.mark.asyncio
+async def test_other_branch_runs_when_chosen(recording_pool):
+    """Choosing the other edge skips the first branch instead."""
+    inputs_seen: dict = {}
+    graph = build_graph(recording_pool, inputs_seen, take_yes=False)
+
+    results = await graph.execute()
+
+    assert "a" not in results
+    assert inputs_seen["d"] == ["b", "start"]
+    assert inputs_seen["join"] == ["c"]
+    assert results["join"].content == "join"
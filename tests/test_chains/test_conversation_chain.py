@@ -0,0 +1,91 @@
+"""Tests for dataflow scheduling of conversation chains."""
+import asyncio
+from typing import Tuple
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.conversation_chain import ConversationChain
+from llmaestro.core.orchestrator import Orchestrator
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+def make_prompt(name: str) -> MemoryPrompt:
+    return MemoryPrompt(name=name, description=name, system_prompt="", user_prompt=name)
+
+
+@pytest.fixture
+def timed_pool(make_response) -> AgentPool:
+    """Agent pool mock whose prompts take ``pool.delays[name]`` seconds and track concurrency."""
+    pool = MagicMock(spec=AgentPool)
+    pool.max_concurrency = 8
+    pool.delays = {}
+    pool.in_flight = 0
+    pool.peak = 0
+
+    async def execute_prompt(prompt, *args, **kwargs):
+        pool.in_flight += 1
+        pool.peak = max(pool.peak, pool.in_flight)
+        try:
+            await asyncio.sleep(pool.delays.get(prompt.name, 0))
+        finally:
+            pool.in_flight -= 1
+        return make_response(f"{prompt.name} done")
+
+    pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    return pool
+
+
+async def build_chain(pool, **kwargs) -> Tuple[ConversationChain, str]:
+    """Chain with roots slow and fast, where after depends only on fast; returns the chain and slow's ID."""
+    chain = ConversationChain(Orchestrator(pool), **kwargs)
+    await chain.initialize("test", make_prompt("start"))
+    slow = await chain.add_prompt_node(make_prompt("slow"))
+    fast = await chain.add_prompt_node(make_prompt("fast"))
+    await chain.add_prompt_node(make_prompt("after"), dependencies=[fast])
+    return chain, slow
+
+
+@pytest.mark.asyncio
+async def test_node_starts_when_its_own_dependencies_finish(timed_pool):
+    """A dependent of a fast node does not wait for an unrelated slow node."""
+    timed_pool.delays = {"slow": 0.1}
+    chain, slow_id = await build_chain(timed_pool)
+
+    order = [event.node_id async for event in chain.execute_stream()]
+
+    assert order[-1] == slow_id
+    assert len(order) == 3
+    assert all(chain.get_node_status(node_id).status == "completed" for node_id in order)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap(timed_pool):
+    timed_pool.delays = {"slow": 0.02, "fast": 0.02}
+    chain, _ = await build_chain(timed_pool, max_concurrency=1)
+
+    results = await chain.execute()
+
+    assert len(results) == 3
+    assert timed_pool.peak == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_completion_is_signalled(timed_pool):
+    """Waiters on a prompt node wake when its status update is published."""
+    timed_pool.delays = {"slow": 0.05}
+    orchestrator = Orchestrator(timed_pool)
+    conversation = await orchestrator.create_conversation(name="test", initial_prompt=make_prompt("start"))
+    task = asyncio.create_task(orchestrator.execute_prompt(conversation, make_prompt("slow")))
+    await asyncio.sleep(0)
+
+    prompt_id = next(
+        node_id
+        for node_id, node in conversation.nodes.items()
+        if node.metadata.get("execution", {}).get("status") == "running"
+    )
+    status = await asyncio.wait_for(orchestrator.wait_for_completion(prompt_id, conversation), timeout=1)
+
+    assert status.status == "completed"
+    await task
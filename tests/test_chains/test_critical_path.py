@@ -0,0 +1,95 @@
+"""Tests for critical-path-first scheduling of chain nodes."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, ChainStep, NodeType, RetryStrategy
+from llmaestro.chains.scheduling import critical_path_lengths
+from llmaestro.core.orchestrator import Orchestrator
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+def make_prompt(name: str) -> MemoryPrompt:
+    return MemoryPrompt(name=name, description=name, system_prompt="", user_prompt=name)
+
+
+@pytest.fixture
+def recording_pool(make_response) -> AgentPool:
+    """Agent pool mock that records the order prompts start and takes 10ms per prompt."""
+    pool = MagicMock(spec=AgentPool)
+    pool.started = []
+    pool.estimate_latency = MagicMock(return_value=1.0)
+
+    async def execute_prompt(prompt, *args, **kwargs):
+        pool.started.append(prompt.name)
+        await asyncio.sleep(0.01)
+        return make_response(f"{prompt.name} done")
+
+    pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    return pool
+
+
+def build_chain(pool, **kwargs) -> ChainGraph:
+    """Independent short nodes b1..b3 added before a deep chain a1 -> a2 -> a3."""
+    graph = ChainGraph(agent_pool=pool, **kwargs)
+    for node_id in ("b1", "b2", "b3", "a1", "a2", "a3"):
+        step = ChainStep(prompt=make_prompt(node_id), retry_strategy=RetryStrategy(max_retries=0))
+        graph.add_node(ChainNode(id=node_id, step=step, node_type=NodeType.SEQUENTIAL))
+    graph.add_edge(ChainEdge(source_id="a1", target_id="a2", edge_type="next"))
+    graph.add_edge(ChainEdge(source_id="a2", target_id="a3", edge_type="next"))
+    return graph
+
+
+def test_critical_path_lengths():
+    order = ["a", "b", "c", "d"]
+    dependents = {"a": ["b", "c"], "b": ["d"], "c": [], "d": []}
+    costs = {"a": 1.0, "b": 2.0, "c": 5.0, "d": 1.0}
+
+    assert critical_path_lengths(order, dependents, costs) == {"a": 6.0, "b": 3.0, "c": 5.0, "d": 1.0}
+
+
+@pytest.mark.asyncio
+async def test_longest_downstream_path_starts_first(recording_pool):
+    """Under a concurrency limit the deep chain starts before independent nodes added earlier."""
+    run = await build_chain(recording_pool, max_concurrency=2).execute_run()
+
+    assert recording_pool.started[:2] == ["a1", "b1"]
+    assert set(run.results) == {"b1", "b2", "b3", "a1", "a2", "a3"}
+    assert run.critical_path.nodes == ["a1", "a2", "a3"]
+    assert run.critical_path.duration >= sum(run.critical_path.node_durations.values()) > 0
+
+
+@pytest.mark.asyncio
+async def test_latency_estimates_break_ties(recording_pool):
+    """Among equally deep nodes, the one estimated to be slowest starts first."""
+    recording_pool.estimate_latency.side_effect = lambda prompt: 5.0 if prompt.name == "b3" else 1.0
+
+    await build_chain(recording_pool, max_concurrency=2).execute()
+
+    assert recording_pool.started[0] == "b3"
+
+
+@pytest.mark.asyncio
+async def test_sequential_runs_keep_insertion_order(recording_pool):
+    await build_chain(recording_pool).execute()
+
+    assert recording_pool.started == ["b1", "b2", "b3", "a1", "a2", "a3"]
+    recording_pool.estimate_latency.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_parallel_starts_longest_first(recording_pool):
+    """Orchestrator batches honour max_parallel, start the slowest prompts first and keep input order."""
+    recording_pool.estimate_latency.side_effect = lambda prompt: float(prompt.name[-1])
+    orchestrator = Orchestrator(recording_pool)
+    conversation = await orchestrator.create_conversation(name="test", initial_prompt=make_prompt("start"))
+
+    response_ids = await orchestrator.execute_parallel(
+        conversation, [make_prompt("p1"), make_prompt("p3"), make_prompt("p2")], max_parallel=1
+    )
+
+    assert recording_pool.started == ["p3", "p2", "p1"]
+    contents = [conversation.nodes[response_id].content.content for response_id in response_ids]
+    assert contents == ["p1 done", "p3 done", "p2 done"]
@@ -0,0 +1,148 @@
+"""Tests for pipelined batch execution of a chain graph."""
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, ChainStep, NodeType
+from llmaestro.prompts.base import PromptVariable
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+class TrackingPool:
+    """Agent pool stand-in that records how many prompts of each stage run at once."""
+
+    def __init__(self, make_response, delay: float = 0.01):
+        self.make_response = make_response
+        self.delay = delay
+        self.running: Counter = Counter()
+        self.peak: Counter = Counter()
+        self.mock = MagicMock(spec=AgentPool)
+        self.mock.execute_prompt = AsyncMock(side_effect=self.execute_prompt)
+        self.mock.max_concurrency = 4
+
+    async def execute_prompt(self, prompt, *args, **kwargs):
+        stage = prompt.name
+        self.running[stage] += 1
+        self.peak[stage] = max(self.peak[stage], self.running[stage])
+        try:
+            await asyncio.sleep(self.delay * 10 if "slow" in prompt.user_prompt else self.delay)
+            if "fail" in prompt.user_prompt:
+                raise RuntimeError("provider error")
+            return self.make_response(prompt.user_prompt)
+        finally:
+            self.running[stage] -= 1
+
+
+def stage(name: str) -> ChainNode:
+    """Node whose prompt echoes the record's topic."""
+    prompt = MemoryPrompt(
+        name=name,
+        description=f"{name} stage",
+        system_prompt="",
+        user_prompt=name + " {topic}",
+        variables=[PromptVariable(name="topic")],
+    )
+    step = ChainStep(
+        prompt=prompt,
+        input_transform=lambda context, data: {"topic": context.variables["topic"]},
+        retry_strategy={"max_retries": 0},
+    )
+    return ChainNode(id=name, step=step, node_type=NodeType.SEQUENTIAL)
+
+
+@pytest.fixture
+def tracking_pool(make_response) -> TrackingPool:
+    return TrackingPool(make_response)
+
+
+@pytest.fixture
+def pipeline(tracking_pool) -> ChainGraph:
+    """Two-stage chain: extract, then summarize."""
+    graph = ChainGraph(agent_pool=tracking_pool.mock)
+    graph.add_node(stage("extract"))
+    graph.add_node(stage("summarize"))
+    graph.add_edge(ChainEdge(source_id="extract", target_id="summarize", edge_type="next"))
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_records_are_pipelined_through_stages(pipeline, tracking_pool):
+    """Every record completes and several records are in flight at once."""
+    inputs = [{"topic": f"record-{i}"} for i in range(10)]
+
+    records = [record async for record in pipeline.execute_many(inputs, concurrency=4)]
+
+    assert sorted(record.index for record in records) == list(range(10))
+    for record in records:
+        assert record.success
+        assert record.results["summarize"].content == f"summarize record-{record.index}"
+    assert tracking_pool.peak["extract"] > 1
+
+
+@pytest.mark.asyncio
+async def test_stage_concurrency_limits_one_node(pipeline, tracking_pool):
+    """Per-stage limits cap simultaneous executions of that node only."""
+    inputs = [{"topic": f"record-{i}"} for i in range(8)]
+
+    batch = pipeline.execute_many(inputs, concurrency=8, stage_concurrency={"summarize": 1})
+    records = [record async for record in batch]
+
+    assert len(records) == 8
+    assert tracking_pool.peak["summarize"] == 1
+    assert tracking_pool.peak["extract"] > 1
+
+    with pytest.raises(ValueError, match="Unknown nodes"):
+        async for _ in pipeline.execute_many(inputs, stage_concurrency={"missing": 1}):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_failures_are_reported_per_record(pipeline):
+    """A failing record does not stop the batch."""
+    inputs = [{"topic": "ok-1"}, {"topic": "fail"}, {"topic": "ok-2"}]
+
+    records = {record.index: record async for record in pipeline.execute_many(inputs, concurrency=2)}
+
+    assert [records[i].success for i in range(3)] == [True, False, True]
+    assert isinstance(records[1].error, RuntimeError)
+    assert records[1].run.context.state.status == "failed"
+
+
+@pytest.mark.asyncio
+async def test_inputs_are_pulled_with_backpressure(pipeline):
+    """Inputs are only pulled when a slot is free."""
+    pulled = []
+
+    async def source():
+        for i in range(100):
+            pulled.append(i)
+            yield {"topic": f"record-{i}"}
+
+    results = pipeline.execute_many(source(), concurrency=3)
+    first = await results.__anext__()
+    await results.aclose()
+
+    assert first.success
+    assert len(pulled) <= 4
+
+
+@pytest.mark.asyncio
+async def test_closing_early_leaves_no_running_records(pipeline, tracking_pool):
+    """Records still in flight are cancelled and awaited when the consumer stops early."""
+    inputs = [{"topic": "fast"}] + [{"topic": f"slow-{i}"} for i in range(5)]
+
+    results = pipeline.execute_many(inputs, concurrency=3)
+    await results.__anext__()
+    await results.aclose()
+
+    assert sum(tracking_pool.running.values()) == 0
+
+
+@pytest.mark.asyncio
+async def test_zero_concurrency_is_rejected(pipeline):
+    with pytest.raises(ValueError, match="at least 1"):
+        async for _ in pipeline.execute_many([{"topic": "x"}], concurrency=0):
+            pass
@@ -0,0 +1,105 @@
+"""Tests for streaming node results out of a chain run."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, ChainStep, NodeType, RetryStrategy
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+@pytest.fixture
+def streaming_pool(make_response) -> AgentPool:
+    """Agent pool mock that answers prompts whole, or word by word when streamed."""
+    pool = MagicMock(spec=AgentPool)
+    pool.blocked = asyncio.Event()
+    pool.blocked.set()
+
+    async def execute_prompt(prompt, *args, **kwargs):
+        if prompt.name == "slow":
+            await pool.blocked.wait()
+        if prompt.name == "broken":
+            raise RuntimeError("broken failed")
+        return make_response(f"{prompt.name} done")
+
+    async def stream_prompt(prompt, *args, **kwargs):
+        for word in ("one ", "two ", "three"):
+            yield make_response(word)
+
+    pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    pool.stream_prompt = MagicMock(side_effect=stream_prompt)
+    return pool
+
+
+def build_chain(pool, *node_ids: str, **streamed: bool) -> ChainGraph:
+    """Linear chain through the given nodes."""
+    graph = ChainGraph(agent_pool=pool)
+    for node_id in node_ids:
+        prompt = MemoryPrompt(name=node_id, description=node_id, system_prompt="", user_prompt=node_id)
+        step = ChainStep(prompt=prompt, retry_strategy=RetryStrategy(max_retries=0))
+        node = ChainNode(
+            id=node_id, step=step, node_type=NodeType.SEQUENTIAL, stream_tokens=streamed.get(node_id, False)
+        )
+        graph.add_node(node)
+    for source, target in zip(node_ids, node_ids[1:]):
+        graph.add_edge(ChainEdge(source_id=source, target_id=target, edge_type="next"))
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_events_follow_completion_with_partials(streaming_pool):
+    """Each node yields its result when it completes; streaming nodes yield chunks first."""
+    graph = build_chain(streaming_pool, "plan", "write", write=True)
+
+    events = [event async for event in graph.execute_stream()]
+
+    assert [(event.node_id, event.partial) for event in events] == [
+        ("plan", False),
+        ("write", True),
+        ("write", True),
+        ("write", True),
+        ("write", False),
+    ]
+    assert events[0].result.content == "plan done"
+    assert [event.result.content for event in events[1:4]] == ["one ", "two ", "three"]
+    assert events[-1].result.content == "one two three"
+    assert events[-1].result.token_usage.total_tokens == 6
+
+    timings = events[-1].timings
+    assert timings.queued <= timings.started <= timings.first_token <= timings.finished
+    assert events[0].timings.first_token is None
+    assert events[0].timings.finished <= timings.started
+
+
+@pytest.mark.asyncio
+async def test_early_results_arrive_before_run_finishes(streaming_pool):
+    """A consumer sees a finished node while downstream nodes are still running."""
+    streaming_pool.blocked.clear()
+    stream = build_chain(streaming_pool, "plan", "slow").execute_stream()
+
+    first = await asyncio.wait_for(stream.__anext__(), timeout=1)
+    assert first.node_id == "plan"
+
+    streaming_pool.blocked.set()
+    assert [event.node_id async for event in stream] == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_failure_raised_after_earlier_events(streaming_pool):
+    seen = []
+    with pytest.raises(RuntimeError, match="broken failed"):
+        async for event in build_chain(streaming_pool, "plan", "broken").execute_stream():
+            seen.append(event.node_id)
+    assert seen == ["plan"]
+
+
+@pytest.mark.asyncio
+async def test_closing_stream_cancels_run(streaming_pool):
+    streaming_pool.blocked.clear()
+    stream = build_chain(streaming_pool, "plan", "slow", "after").execute_stream()
+    assert (await stream.__anext__()).node_id == "plan"
+
+    await stream.aclose()
+
+    assert [call.args[0].name for call in streaming_pool.execute_prompt.await_args_list] == ["plan", "slow"]
@@ -0,0 +1,154 @@
+"""Tests for fan-out/fan-in map nodes."""
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import (
+    ChainContext,
+    ChainEdge,
+    ChainGraph,
+    ChainNode,
+    ChainStep,
+    MapFailurePolicy,
+    MapNode,
+    NodeType,
+    RetryStrategy,
+)
+from llmaestro.prompts.base import PromptVariable
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+class ElementPool:
+    """Agent pool stand-in that answers each prompt after a per-element delay."""
+
+    def __init__(self, make_response, delays=None, failures=None):
+        self.make_response = make_response
+        self.delays = delays or {}
+        self.failures = Counter(failures or {})
+        self.running = 0
+        self.peak = 0
+        self.mock = MagicMock(spec=AgentPool)
+        self.mock.execute_prompt = AsyncMock(side_effect=self.execute_prompt)
+
+    async def execute_prompt(self, prompt, *args, **kwargs):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(prompt.user_prompt, 0.005))
+            if self.failures[prompt.user_prompt] > 0:
+                self.failures[prompt.user_prompt] -= 1
+                raise RuntimeError(f"failed {prompt.user_prompt}")
+            return self.make_response(prompt.user_prompt.upper())
+        finally:
+            self.running -= 1
+
+
+def template_prompt(name: str, template: str, *variables: str) -> MemoryPrompt:
+    return MemoryPrompt(
+        name=name,
+        description=name,
+        system_prompt="",
+        user_prompt=template,
+        variables=[PromptVariable(name=variable) for variable in variables],
+    )
+
+
+def map_node(**kwargs) -> MapNode:
+    """Map node that summarizes one chunk per element."""
+    step = ChainStep(
+        prompt=template_prompt("summarize", "{item}", "item"),
+        output_transform=lambda response: response.content,
+        retry_strategy=RetryStrategy(max_retries=1, delay=0.0, jitter=0.0),
+    )
+    return MapNode(id="map", step=step, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_chain(make_response):
+    """A split node feeds a map node whose gathered outputs feed a reduce node."""
+    pool = ElementPool(make_response)
+    split = ChainNode(
+        id="split",
+        step=ChainStep(
+            prompt=template_prompt("split", "split"),
+            output_transform=lambda response: ["a", "b", "c", "d", "e"],
+        ),
+        node_type=NodeType.SEQUENTIAL,
+    )
+    reduce = ChainNode(
+        id="reduce",
+        step=ChainStep(
+            prompt=template_prompt("reduce", "combine {parts}", "parts"),
+            input_transform=lambda context, data: {"parts": ",".join(data["dependency_results"]["map"].outputs)},
+        ),
+        node_type=NodeType.SEQUENTIAL,
+    )
+    graph = ChainGraph(agent_pool=pool.mock)
+    for node in (split, map_node(max_concurrency=2), reduce):
+        graph.add_node(node)
+    graph.add_edge(ChainEdge(source_id="split", target_id="map", edge_type="next"))
+    graph.add_edge(ChainEdge(source_id="map", target_id="reduce", edge_type="next"))
+
+    results = await graph.execute()
+
+    assert results["map"].outputs == ["A", "B", "C", "D", "E"]
+    assert results["reduce"].content == "COMBINE A,B,C,D,E"
+    assert pool.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_elements_are_retried_individually(make_response):
+    """A transient element failure is retried without rerunning the others."""
+    pool = ElementPool(make_response, failures={"b": 1})
+    node = map_node()
+
+    result = await node.execute(pool.mock, ChainContext(), {"split": ["a", "b", "c"]})
+
+    assert result.outputs == ["A", "B", "C"]
+    assert pool.mock.execute_prompt.await_count == 4
+    assert node.retry_metrics.retries == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_policies(make_response):
+    """FAIL_FAST raises on the first failed element; CONTINUE reports failures."""
+    items = {"split": ["a", "b", "c"]}
+
+    with pytest.raises(RuntimeError, match="element 1"):
+        await map_node().execute(ElementPool(make_response, failures={"b": 2}).mock, ChainContext(), items)
+
+    node = map_node(failure_policy=MapFailurePolicy.CONTINUE)
+    result = await node.execute(ElementPool(make_response, failures={"b": 2}).mock, ChainContext(), items)
+    assert result.outputs == ["A", "C"]
+    assert [failure.item for failure in result.failures] == ["b"]
+
+    node = map_node(failure_policy=MapFailurePolicy.CONTINUE, max_failures=0)
+    with pytest.raises(RuntimeError):
+        await node.execute(ElementPool(make_response, failures={"b": 2}).mock, ChainContext(), items)
+
+
+@pytest.mark.asyncio
+async def test_streaming_yields_in_completion_order(make_response):
+    """Streaming and unordered gathering follow completion order."""
+    pool = ElementPool(make_response, delays={"slow": 0.05, "fast": 0.0})
+    node = map_node(ordered=False)
+
+    streamed = [element.item async for element in node.stream(pool.mock, ChainContext(), ["slow", "fast"])]
+    gathered = await node.execute(pool.mock, ChainContext(), {"split": ["slow", "fast"]})
+
+    assert streamed == ["fast", "slow"]
+    assert gathered.outputs == ["FAST", "SLOW"]
+
+
+def test_items_must_be_a_list():
+    """The selected upstream result must be a list."""
+    node = map_node(items_from="split", select_items=lambda result: result["chunks"])
+
+    assert node.get_items({"split": {"chunks": ["x"]}, "other": 1}) == ["x"]
+    with pytest.raises(ValueError, match="expected a list"):
+        map_node().get_items({"split": "not a list"})
+    with pytest.raises(ValueError, match="needs items_from"):
+        map_node().get_items({"a": [], "b": []})
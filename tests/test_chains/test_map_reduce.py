@@ -0,0 +1,146 @@
+"""Tests for map-reduce over chunked documents."""
+import asyncio
+import random
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import MapFailurePolicy, RetryStrategy
+from llmaestro.chains.map_reduce import MapReduce
+from llmaestro.core.models import LLMResponse, TokenUsage
+from llmaestro.llm.interfaces.tokenizers import BaseTokenizer
+from llmaestro.prompts.base import PromptVariable
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+class WordTokenizer(BaseTokenizer):
+    """One token per whitespace-separated word."""
+
+    def __init__(self):
+        super().__init__("words")
+
+    def count_tokens(self, text: str) -> int:
+        return len(text.split())
+
+    def encode(self, text: str) -> List[int]:
+        return list(range(self.count_tokens(text)))
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+
+def document(paragraphs: int, words: int = 4) -> str:
+    return "\n\n".join(" ".join(f"p{p}w{w}" for w in range(words)) for p in range(paragraphs))
+
+
+@pytest.fixture
+def sent() -> List[str]:
+    """User prompts sent to the pool, in the order requests started."""
+    return []
+
+
+@pytest.fixture
+def pool(sent) -> AgentPool:
+    """Pool mock whose map responses are a chunk's first word and reduce responses span their group.
+
+    Responses arrive in random order, so results only come out in document order if the
+    engine restores it.
+    """
+
+    async def execute_prompt(prompt) -> LLMResponse:
+        sent.append(prompt.user_prompt)
+        await asyncio.sleep(random.random() / 100)
+        phase, content = prompt.user_prompt.split(" ", 1)
+        words = content.split()
+        if "fail" in words:
+            raise RuntimeError("provider error")
+        output = words[0] if phase == "MAP:" else f"[{words[0]}..{words[-1]}]"
+        return LLMResponse(
+            content=output, success=True, token_usage=TokenUsage(prompt_tokens=1, completion_tokens=1, total_tokens=2)
+        )
+
+    state = SimpleNamespace(
+        profile=SimpleNamespace(name="words", capabilities=SimpleNamespace(max_context_window=1000)),
+        runtime_config=SimpleNamespace(max_tokens=100),
+    )
+    pool = MagicMock(spec=AgentPool)
+    pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    pool.get_model_state.return_value = state
+    pool.get_tokenizer.return_value = WordTokenizer()
+    return pool
+
+
+def make_engine(pool: AgentPool, **kwargs) -> MapReduce:
+    item = [PromptVariable(name="item")]
+    map_prompt = MemoryPrompt(
+        name="map", description="map", system_prompt="", user_prompt="MAP: {item}", variables=item
+    )
+    reduce_prompt = MemoryPrompt(
+        name="reduce", description="reduce", system_prompt="", user_prompt="REDUCE: {item}", variables=item
+    )
+    return MapReduce(pool, map_prompt, reduce_prompt, retry_strategy=RetryStrategy(max_retries=0, delay=0), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_single_level_keeps_document_order(pool, sent):
+    engine = make_engine(pool, chunk_tokens=4, max_concurrency=3)
+
+    result = await engine.run(document(6))
+
+    assert result.chunk_count == 6
+    assert result.levels == 1
+    assert result.output == "[p0w0..p5w0]"
+    reduce_prompts = [prompt for prompt in sent if prompt.startswith("REDUCE:")]
+    assert reduce_prompts == ["REDUCE: " + "\n\n".join(f"p{p}w0" for p in range(6))]
+
+
+@pytest.mark.asyncio
+async def test_hierarchical_reduce_fits_context(pool, sent):
+    # 15 context tokens - 10 output tokens - 1 template token leaves 4 per chunk and per reduce group
+    engine = make_engine(pool, max_context_tokens=15, output_tokens=10)
+
+    result = await engine.run(document(20))
+
+    assert result.chunk_count == 20
+    assert result.levels == 3  # 20 outputs -> 5 groups -> 2 groups -> 1
+    assert result.output == "[[[p0w0..p3w0]..[p12w0..p15w0]]..[[p16w0..p19w0]..[p16w0..p19w0]]]"
+    assert all(len(prompt.split()) <= 5 for prompt in sent)
+
+
+@pytest.mark.asyncio
+async def test_streams_blocks_and_files(pool, tmp_path):
+    text = document(12)
+    path = tmp_path / "doc.txt"
+    path.write_text(text)
+    engine = make_engine(pool, chunk_tokens=8)
+
+    from_text = await engine.run(text)
+    from_blocks = await engine.run(iter(text[i : i + 5] for i in range(0, len(text), 5)))
+    from_file = await engine.run(path)
+
+    assert from_text.output == from_blocks.output == from_file.output == "[p0w0..p10w0]"
+    assert from_text.chunk_count == 6
+
+
+@pytest.mark.asyncio
+async def test_failed_chunks(pool):
+    text = document(3) + "\n\nfail here"
+
+    with pytest.raises(RuntimeError, match="Chunk 3 failed"):
+        await make_engine(pool, chunk_tokens=4).run(text)
+
+    result = await make_engine(pool, chunk_tokens=4, failure_policy=MapFailurePolicy.CONTINUE).run(text)
+    assert result.output == "[p0w0..p2w0]"
+    assert [failure.index for failure in result.failures] == [3]
+
+
+@pytest.mark.asyncio
+async def test_rejects_empty_document_and_oversized_template(pool):
+    with pytest.raises(ValueError, match="empty"):
+        await make_engine(pool).run("")
+    with pytest.raises(ValueError, match="no room"):
+        await make_engine(pool, max_context_tokens=10, output_tokens=9).run("text")
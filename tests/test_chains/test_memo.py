@@ -0,0 +1,176 @@
+"""Tests for memoizing chain node results across runs."""
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, ChainStep, NodeType, RetryStrategy
+from llmaestro.chains.memo import MemoryNodeCache, NodeResultCache, SQLiteNodeCache, node_cache_key
+from llmaestro.core.models import LLMResponse
+from llmaestro.llm.models import LLMProfile, LLMRuntimeConfig, LLMState
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+def routed_state(model_name: str, temperature: float = 0.7) -> LLMState:
+    """Minimal model state for a pool mock to route every prompt to."""
+    return LLMState.model_construct(
+        profile=LLMProfile.model_construct(name=model_name),
+        runtime_config=LLMRuntimeConfig(temperature=temperature),
+    )
+
+
+def make_echo_pool(make_response, state: LLMState) -> AgentPool:
+    """Agent pool mock routing to the given model and answering each prompt with its user prompt."""
+    pool = MagicMock(spec=AgentPool)
+    pool.get_model_state.return_value = state
+
+    async def execute_prompt(prompt, *args, **kwargs):
+        return make_response(f"answer to {prompt.user_prompt}")
+
+    pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    return pool
+
+
+@pytest.fixture
+def echo_pool(make_response) -> AgentPool:
+    """Agent pool mock answering each prompt with its user prompt."""
+    return make_echo_pool(make_response, routed_state("gpt-4o-mini"))
+
+
+def make_node(node_id: str, user_prompt: str, **kwargs) -> ChainNode:
+    prompt = MemoryPrompt(name=node_id, description=node_id, system_prompt="", user_prompt=user_prompt)
+    step = ChainStep(prompt=prompt, retry_strategy=RetryStrategy(max_retries=0))
+    return ChainNode(id=node_id, step=step, node_type=NodeType.SEQUENTIAL, **kwargs)
+
+
+def build_chain(pool, cache, first_prompt: str = "summarize", **second_kwargs) -> ChainGraph:
+    """Chain first -> second sharing the given result cache."""
+    graph = ChainGraph(agent_pool=pool, result_cache=cache)
+    graph.add_node(make_node("first", first_prompt))
+    graph.add_node(make_node("second", "critique", **second_kwargs))
+    graph.add_edge(ChainEdge(source_id="first", target_id="second", edge_type="next"))
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_repeated_runs_hit_cache(echo_pool):
+    """Identical work in a later run, or another chain sharing the cache, is not re-executed."""
+    cache = MemoryNodeCache()
+    first = await build_chain(echo_pool, cache).execute()
+    second = await build_chain(echo_pool, cache).execute()
+
+    assert echo_pool.execute_prompt.await_count == 2
+    assert second == first
+    assert cache.stats.hits == 2
+    assert cache.stats.hit_rate == 0.5
+
+
+@pytest.mark.asyncio
+async def test_changed_dependency_misses_downstream(echo_pool):
+    """A different upstream result changes the key of every node depending on it."""
+    cache = MemoryNodeCache()
+    await build_chain(echo_pool, cache).execute()
+    echo_pool.execute_prompt.reset_mock()
+
+    results = await build_chain(echo_pool, cache, first_prompt="translate").execute()
+
+    assert [call.args[0].user_prompt for call in echo_pool.execute_prompt.await_args_list] == ["translate", "critique"]
+    assert results["first"].content == "answer to translate"
+
+
+@pytest.mark.asyncio
+async def test_opt_out_and_invalidation(echo_pool):
+    """Nodes with memoize=False always run, and invalidated entries are recomputed."""
+    cache = MemoryNodeCache()
+    await build_chain(echo_pool, cache, memoize=False).execute()
+    await build_chain(echo_pool, cache, memoize=False).execute()
+    assert [call.args[0].name for call in echo_pool.execute_prompt.await_args_list] == ["first", "second", "second"]
+
+    echo_pool.execute_prompt.reset_mock()
+    assert cache.invalidate(node_id="first") == 1
+    await build_chain(echo_pool, cache).execute()
+    assert [call.args[0].name for call in echo_pool.execute_prompt.await_args_list] == ["first", "second"]
+
+    assert cache.invalidate() == 2
+    assert len(cache) == 0
+
+
+def test_key_covers_model_and_parameters(make_response):
+    """The key depends on the model, parameters and dependency results."""
+    prompt = MemoryPrompt(name="p", description="p", system_prompt="", user_prompt="hello")
+    deps = {"up": make_response("x")}
+    key = node_cache_key(prompt, deps, model="a")
+
+    assert key == node_cache_key(prompt.model_copy(), dict(deps), model="a")
+    assert key != node_cache_key(prompt, deps, model="b")
+    assert key != node_cache_key(prompt, deps, model="a", parameters={"temperature": 0.2})
+    assert key != node_cache_key(prompt, {"up": make_response("y")}, model="a")
+    assert node_cache_key(prompt, {"up": object()}) is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryNodeCache(max_entries=2)
+    cache.set("a", "n1", 1)
+    cache.set("b", "n2", 2)
+    assert cache.get("a") == 1
+    cache.set("c", "n3", 3)
+
+    assert NodeResultCache.is_miss(cache.get("b"))
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_persists_across_instances(echo_pool, tmp_path):
+    """Results stored in SQLite are served to a new cache instance, rebuilt as models."""
+    path = tmp_path / "nodes.db"
+    cache = SQLiteNodeCache(path)
+    first = await build_chain(echo_pool, cache).execute()
+    cache.close()
+
+    reopened = SQLiteNodeCache(path)
+    second = await build_chain(echo_pool, reopened).execute()
+
+    assert echo_pool.execute_prompt.await_count == 2
+    assert isinstance(second["second"], LLMResponse)
+    assert second["second"].content == first["second"].content
+    assert reopened.invalidate(node_id="second") == 1
+    assert len(reopened) == 1
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_pools_on_different_models_do_not_share_entries(make_response, tmp_path):
+    """A shared cache never serves one model's (or one configuration's) results to another."""
+    cache = SQLiteNodeCache(tmp_path / "nodes.db")
+    pools = [
+        make_echo_pool(make_response, routed_state("gpt-4o-mini")),
+        make_echo_pool(make_response, routed_state("claude-3-haiku")),
+        make_echo_pool(make_response, routed_state("gpt-4o-mini", temperature=0.0)),
+    ]
+
+    for pool in pools:
+        await build_chain(pool, cache).execute()
+
+    assert [pool.execute_prompt.await_count for pool in pools] == [2, 2, 2]
+    assert cache.stats.hits == 0
+    await build_chain(pools[1], cache).execute()
+    assert pools[1].execute_prompt.await_count == 2
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_io_runs_off_the_event_loop(echo_pool, tmp_path):
+    """Graphs reach SQLite from worker threads, so disk I/O never blocks other runs."""
+    cache = SQLiteNodeCache(tmp_path / "nodes.db")
+    threads = set()
+    get, set_ = cache.get, cache.set
+    cache.get = lambda *args: threads.add(threading.get_ident()) or get(*args)
+    cache.set = lambda *args: threads.add(threading.get_ident()) or set_(*args)
+
+    await build_chain(echo_pool, cache).execute()
+    await build_chain(echo_pool, cache).execute()
+
+    assert threads and threading.get_ident() not in threads
+    assert cache.stats.hits == 2
+    cache.close()
@@ -0,0 +1,99 @@
+"""Tests for re-entrant execution of one chain graph by concurrent runs."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import ChainContext, ChainEdge, ChainGraph, ChainNode, ChainStep, NodeType
+from llmaestro.prompts.base import PromptVariable
+from llmaestro.prompts.memory import MemoryPrompt
+
+
+@pytest.fixture
+def echo_pool(make_response) -> AgentPool:
+    """Agent pool mock that answers with the rendered user prompt after yielding to the loop."""
+
+    async def execute_prompt(prompt, *args, **kwargs):
+        await asyncio.sleep(0)
+        return make_response(prompt.user_prompt)
+
+    pool = MagicMock(spec=AgentPool)
+    pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    return pool
+
+
+def templated_step(template: str) -> ChainStep:
+    """Step whose prompt is filled from the run's context variables and upstream results."""
+    prompt = MemoryPrompt(
+        name="templated",
+        description="Templated prompt",
+        system_prompt="",
+        user_prompt=template,
+        variables=[PromptVariable(name="topic"), PromptVariable(name="previous")],
+    )
+
+    def input_transform(context, data):
+        previous = [response.content for response in data.get("dependency_results", {}).values()]
+        return {"topic": context.variables["topic"], "previous": " / ".join(previous)}
+
+    return ChainStep(prompt=prompt, input_transform=input_transform)
+
+
+@pytest.fixture
+def graph(echo_pool) -> ChainGraph:
+    """Two-step chain: outline a topic, then expand the outline."""
+    outline = ChainNode(id="outline", step=templated_step("Outline {topic}{previous}"), node_type=NodeType.SEQUENTIAL)
+    expand = ChainNode(id="expand", step=templated_step("Expand {topic}: {previous}"), node_type=NodeType.SEQUENTIAL)
+    graph = ChainGraph(agent_pool=echo_pool)
+    graph.add_node(outline)
+    graph.add_node(expand)
+    graph.add_edge(ChainEdge(source_id="outline", target_id="expand", edge_type="next"))
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_do_not_share_state(graph):
+    """Concurrent runs each see their own inputs and leave the graph untouched."""
+    topics = [f"topic-{i}" for i in range(20)]
+
+    runs = await asyncio.gather(
+        *(graph.execute(context=ChainContext(variables={"topic": topic})) for topic in topics)
+    )
+
+    for topic, results in zip(topics, runs):
+        assert results["outline"].content == f"Outline {topic}"
+        assert results["expand"].content == f"Expand {topic}: Outline {topic}"
+    assert graph.nodes["outline"].step.prompt.user_prompt == "Outline {topic}{previous}"
+    assert graph.context.state.completed_steps == set()
+
+
+@pytest.mark.asyncio
+async def test_run_context_is_copied_from_template(graph):
+    """Runs without an explicit context start from a copy of the graph's context."""
+    graph.context.variables["topic"] = "tides"
+
+    run = graph.create_run()
+    run.context.variables["topic"] = "changed"
+    run.context.metadata.tags.add("run-only")
+    await graph._execute_run(graph.compile(), run, graph.agent_pool)
+
+    assert graph.context.variables["topic"] == "tides"
+    assert graph.context.metadata.tags == set()
+    assert graph.create_run().context.metadata is not run.context.metadata
+    assert run.executed == ["outline", "expand"]
+    assert run.context.state.status == "completed"
+    assert run.context.state.completed_steps == {"outline", "expand"}
+
+
+def test_definition_is_cached_until_structure_changes(graph):
+    """The compiled definition is reused until nodes or edges are added."""
+    definition = graph.compile()
+    assert graph.compile() is definition
+    assert definition.roots == ("outline",)
+    assert definition.dependents["outline"] == ("expand",)
+
+    graph.add_node(ChainNode(id="extra", step=templated_step("{topic}{previous}"), node_type=NodeType.SEQUENTIAL))
+    assert graph.compile() is not definition
+    with pytest.raises(TypeError):
+        graph.compile().nodes["other"] = graph.nodes["extra"]  # type: ignore[index]
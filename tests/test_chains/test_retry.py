@@ -0,0 +1,157 @@
+"""Tests for the shared chain retry engine."""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from llmaestro.chains.chains import (
+    ChainContext,
+    ChainExecutor,
+    RetryMetrics,
+    RetryStrategy,
+    ValidationNode,
+    get_retry_after,
+    retry_with_backoff,
+)
+from llmaestro.llm.responses import ResponseFormat, ResponseFormatType
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record requested sleeps instead of waiting."""
+    recorded = []
+
+    async def fake_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr("llmaestro.chains.chains.asyncio.sleep", fake_sleep)
+    return recorded
+
+
+def flaky(failures: int, error: Exception):
+    """Operation that fails a number of times before succeeding."""
+
+    async def operation(attempt):
+        if attempt < failures:
+            raise error
+        return attempt
+
+    return operation
+
+
+def test_delay_uses_exponential_backoff_and_cap():
+    """Backoff doubles per retry and is capped by max_delay."""
+    strategy = RetryStrategy(delay=1.0, exponential_backoff=True, max_delay=3.0, jitter=0.0)
+
+    assert [strategy.get_delay(n) for n in (1, 2, 3)] == [1.0, 2.0, 3.0]
+    assert strategy.get_delay(1, retry_after=10.0) == 10.0
+    assert 0.5 <= RetryStrategy(delay=1.0, jitter=0.5).get_delay(1) <= 1.5
+
+
+def test_retry_after_is_read_from_errors():
+    """Retry-After hints come from attributes or response headers."""
+    assert get_retry_after(SimpleNamespace(retry_after=2)) == 2.0
+    assert get_retry_after(SimpleNamespace(response=SimpleNamespace(headers={"retry-after": "4"}))) == 4.0
+    assert get_retry_after(SimpleNamespace(response=SimpleNamespace(headers={"retry-after-ms": "500"}))) == 0.5
+    assert get_retry_after(ValueError("no hint")) is None
+
+
+@pytest.mark.asyncio
+async def test_retries_until_success(sleeps):
+    """Failed attempts are retried with backoff and counted."""
+    metrics = RetryMetrics()
+    strategy = RetryStrategy(max_retries=3, delay=0.5, exponential_backoff=True, jitter=0.0)
+
+    assert await retry_with_backoff(flaky(2, RuntimeError("boom")), strategy, metrics) == 2
+    assert sleeps == [0.5, 1.0]
+    assert metrics.model_dump() == {
+        "attempts": 3,
+        "retries": 2,
+        "successes": 1,
+        "failures": 0,
+        "budget_exhausted": 0,
+        "total_delay": 1.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_retry_after_and_exhaustion(sleeps):
+    """Retry-After overrides shorter backoff and the last error propagates."""
+    error = RuntimeError("rate limited")
+    error.retry_after = 2.0
+    metrics = RetryMetrics()
+
+    with pytest.raises(RuntimeError, match="rate limited"):
+        await retry_with_backoff(flaky(5, error), RetryStrategy(max_retries=1, delay=0.1, jitter=0.0), metrics)
+
+    assert sleeps == [2.0]
+    assert metrics.failures == 1
+
+
+@pytest.mark.asyncio
+async def test_time_budget_stops_retries(sleeps):
+    """No retry is scheduled when its wait would exceed the time budget."""
+    metrics = RetryMetrics()
+    strategy = RetryStrategy(max_retries=5, delay=10.0, jitter=0.0, time_budget=1.0)
+
+    with pytest.raises(RuntimeError):
+        await retry_with_backoff(flaky(5, RuntimeError("boom")), strategy, metrics)
+
+    assert sleeps == []
+    assert metrics.budget_exhausted == 1
+
+
+@pytest.mark.asyncio
+async def test_time_budget_bounds_attempt_latency():
+    """A slow attempt is cancelled once the time budget is spent."""
+
+    async def slow(attempt):
+        await asyncio.sleep(5)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await retry_with_backoff(slow, RetryStrategy(max_retries=0, time_budget=0.05))
+
+
+@pytest.mark.asyncio
+async def test_executor_honours_backoff(sleeps, chain_node, chain_context):
+    """ChainExecutor retries node execution through the shared engine."""
+    calls = []
+
+    async def execute(agent_pool, context, **kwargs):
+        calls.append(kwargs)
+        if len(calls) < 3:
+            raise RuntimeError("boom")
+        return "done"
+
+    object.__setattr__(chain_node.step, "execute", execute)
+    strategy = RetryStrategy(max_retries=2, delay=1.0, exponential_backoff=True, jitter=0.0)
+
+    result = await ChainExecutor.execute_with_retry(chain_node, None, chain_context, strategy, dependency_results={})
+
+    assert result == "done"
+    assert sleeps == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_validation_retries_are_bounded_and_reentrant(sleeps, scripted_pool, make_response):
+    """Concurrent validations share one node without touching its prompt template."""
+    handled = []
+    node = ValidationNode(
+        ResponseFormat(format=ResponseFormatType.JSON),
+        retry_strategy=RetryStrategy(max_retries=2, delay=0.0, jitter=0.0),
+        error_handler=lambda result: handled.append(result) or {"error": result.errors},
+    )
+    pool = scripted_pool("not json", "still not json", '{"ok": true}')
+    template = node.step.prompt.user_prompt
+
+    results = await asyncio.gather(
+        node.validate_and_retry(make_response("nope"), pool, ChainContext()),
+        node.validate_and_retry(make_response("{nope}"), pool, ChainContext()),
+    )
+
+    assert sorted(valid for valid, _ in results) == [False, True]
+    assert len(handled) == 1 and handled[0].retry_count == 2
+    assert node.step.prompt.user_prompt == template
+    assert pool.execute_prompt.await_count == 3
+    assert node.metrics.failed == 1
+    assert node.retry_metrics.successes == 1
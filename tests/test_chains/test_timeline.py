@@ -0,0 +1,124 @@
+"""Tests for execution timelines of chain and conversation runs."""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llmaestro.agents.agent_pool import AgentPool
+from llmaestro.chains.chains import ChainEdge, ChainGraph, ChainNode, ChainStep, NodeType, RetryStrategy
+from llmaestro.chains.timeline import ExecutionTimeline
+from llmaestro.core.orchestrator import Orchestrator
+from llmaestro.prompts.memory import MemoryPrompt
+from llmaestro.visualization import TimelineVisualizer
+
+
+def make_prompt(name: str) -> MemoryPrompt:
+    return MemoryPrompt(name=name, description=name, system_prompt="", user_prompt=name)
+
+
+@pytest.fixture
+def timed_pool(make_response) -> AgentPool:
+    """Agent pool mock whose prompts take ``pool.delays[name]`` seconds and fail ``pool.failures[name]`` times."""
+    pool = MagicMock(spec=AgentPool)
+    pool.delays = {}
+    pool.failures = {}
+    pool.estimate_latency = MagicMock(return_value=1.0)
+
+    async def execute_prompt(prompt, *args, **kwargs):
+        await asyncio.sleep(pool.delays.get(prompt.name, 0))
+        if pool.failures.get(prompt.name):
+            pool.failures[prompt.name] -= 1
+            raise RuntimeError(f"{prompt.name} failed")
+        return make_response(f"{prompt.name} done")
+
+    pool.execute_prompt = AsyncMock(side_effect=execute_prompt)
+    return pool
+
+
+def build_chain(pool, retries: int = 0, **kwargs) -> ChainGraph:
+    """Roots a (slow) and b (fast), both feeding c."""
+    graph = ChainGraph(agent_pool=pool, **kwargs)
+    for node_id in ("a", "b", "c"):
+        step = ChainStep(prompt=make_prompt(node_id), retry_strategy=RetryStrategy(max_retries=retries, delay=0))
+        graph.add_node(ChainNode(id=node_id, step=step, node_type=NodeType.SEQUENTIAL))
+    graph.add_edge(ChainEdge(source_id="a", target_id="c", edge_type="next"))
+    graph.add_edge(ChainEdge(source_id="b", target_id="c", edge_type="next"))
+    return graph
+
+
+@pytest.mark.asyncio
+async def test_timeline_from_run(timed_pool):
+    timed_pool.delays = {"a": 0.05, "b": 0.01, "c": 0.01}
+    graph = build_chain(timed_pool, max_concurrency=2)
+    run = await graph.execute_run()
+
+    timeline = ExecutionTimeline.from_run(graph, run)
+
+    assert timeline.critical_path().nodes == ["a", "c"]
+    assert timeline.peak_concurrency == 2
+    assert 1.0 < timeline.average_concurrency < 2.0
+    assert timeline.makespan >= 0.06
+    assert timeline.idle_gaps(min_duration=0.01) == []
+
+    gantt = json.loads(timeline.to_json())
+    tasks = {task["id"]: task for task in gantt["tasks"]}
+    assert gantt["critical_path"] == ["a", "c"]
+    assert tasks["c"]["dependencies"] == ["a", "b"]
+    assert tasks["a"]["critical"] and not tasks["b"]["critical"]
+    assert tasks["c"]["started"] >= tasks["a"]["finished"]
+
+
+@pytest.mark.asyncio
+async def test_idle_gaps_and_retries(timed_pool):
+    """Sequential runs show no overlap, and retried attempts are counted on the node."""
+    timed_pool.failures = {"b": 2}
+    graph = build_chain(timed_pool, retries=2)
+    run = await graph.execute_run()
+
+    timeline = ExecutionTimeline.from_run(graph, run)
+
+    assert run.timings["b"].retries == 2
+    assert run.timings["a"].retries == 0
+    assert timeline.peak_concurrency == 1
+    assert all(end >= start for start, end in timeline.idle_gaps())
+
+
+@pytest.mark.asyncio
+async def test_timeline_from_conversation(timed_pool):
+    timed_pool.delays = {"first": 0.02}
+    orchestrator = Orchestrator(timed_pool)
+    conversation = await orchestrator.create_conversation(name="test", initial_prompt=make_prompt("start"))
+    first = await orchestrator.execute_prompt(conversation, make_prompt("first"))
+    await orchestrator.execute_prompt(conversation, make_prompt("second"), dependencies=[first])
+
+    timeline = ExecutionTimeline.from_conversation(conversation)
+
+    labels = {entry.node_id: entry.label for entry in timeline.entries}
+    assert sorted(labels.values()) == ["first", "second"]
+    path = timeline.critical_path()
+    assert [labels[node_id] for node_id in path.nodes] == ["first", "second"]
+    assert path.duration >= 0.02
+    # Conversation runs do not track first tokens or retries, so the export leaves them out
+    assert all("retries" not in task and "first_token" not in task for task in timeline.to_gantt()["tasks"])
+
+
+@pytest.mark.asyncio
+async def test_timeline_html(timed_pool, tmp_path):
+    graph = build_chain(timed_pool)
+    run = await graph.execute_run()
+    timeline = ExecutionTimeline.from_run(graph, run)
+    visualizer = TimelineVisualizer()
+
+    elements = visualizer.get_elements(timeline)
+    path = visualizer.save(timeline, tmp_path / "timeline.html")
+
+    assert {node["data"]["id"] for node in elements["nodes"] if node["data"]["type"] == "timeline_bar"} == {
+        "a",
+        "b",
+        "c",
+    }
+    assert len(elements["edges"]) == 2
+    html = path.read_text()
+    assert "cytoscape" in html
+    assert '"preset"' in html
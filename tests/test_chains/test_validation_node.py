@@ -0,0 +1,69 @@
+"""Tests for local JSON repair in validation nodes."""
+import pytest
+
+from llmaestro.chains.chains import ChainContext, ValidationNode
+from llmaestro.llm.responses import ResponseFormat, ResponseFormatType
+
+SCHEMA = (
+    '{"type": "object", "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},'
+    ' "required": ["name", "age"]}'
+)
+
+
+@pytest.fixture
+def validation_node() -> ValidationNode:
+    """Validation node expecting a JSON object with a name and an age."""
+    return ValidationNode(ResponseFormat(format=ResponseFormatType.JSON_SCHEMA, response_schema=SCHEMA))
+
+
+@pytest.mark.asyncio
+async def test_malformed_json_is_repaired_without_retry(validation_node, scripted_pool, make_response):
+    """Fenced, single-quoted, truncated JSON is fixed locally and never re-prompted."""
+    pool = scripted_pool()
+    response = make_response("Sure!\n```json\n{'name': 'Ada', 'age': 36,")
+
+    is_valid, result = await validation_node.validate_and_retry(response, pool, ChainContext())
+
+    assert is_valid
+    assert result == {"name": "Ada", "age": 36}
+    assert validation_node.metrics.repaired == 1
+    assert validation_node.metrics.retried == 0
+    pool.execute_prompt.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_schema_violation_falls_back_to_retry(validation_node, scripted_pool, make_response):
+    """Repaired JSON that still violates the schema triggers a retry prompt."""
+    pool = scripted_pool('{"name": "Ada", "age": 36}')
+    response = make_response('{"name": "Ada",}')
+
+    is_valid, result = await validation_node.validate_and_retry(response, pool, ChainContext())
+
+    assert is_valid
+    assert result == {"name": "Ada", "age": 36}
+    assert validation_node.metrics.model_dump() == {"valid": 1, "repaired": 0, "retried": 1, "failed": 0}
+    pool.execute_prompt.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_repair_can_be_disabled(scripted_pool, make_response):
+    """With repair disabled, malformed JSON goes straight to the retry prompt."""
+    node = ValidationNode(ResponseFormat(format=ResponseFormatType.JSON), repair_json=False)
+    pool = scripted_pool('{"ok": true}')
+
+    is_valid, result = await node.validate_and_retry(make_response("{'ok': True}"), pool, ChainContext())
+
+    assert is_valid
+    assert result == {"ok": True}
+    assert node.metrics.retried == 1
+
+
+
+def test_retry_prompt_keeps_braces(validation_node):
+    """Validation errors and JSON quoted in the retry prompt reach the model unchanged."""
+    message = 'Invalid response {"name": "Ada"}: \'age\' is a required property in {age}'
+
+    system_prompt, user_prompt, _, _ = validation_node._build_retry_prompt(message).render()
+
+    assert user_prompt == message
+    assert "json_schema format" in system_prompt
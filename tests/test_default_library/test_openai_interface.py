@@ -24,7 +24,11 @@ from llmaestro.llm.models import (
 from llmaestro.llm.capabilities import ProviderCapabilities
 from llmaestro.llm.rate_limiter import RateLimitConfig
 from llmaestro.llm.credentials import APIKey
-from llmaestro.default_library.defined_providers.openai.interface import OpenAIInterface
+from llmaestro.default_library.defined_providers.openai.interface import (
+    OpenAIInterface,
+    ParseFailureCache,
+    parse_failure_cache,
+)
 from llmaestro.prompts.base import BasePrompt, PromptVariable, SerializableType
 from llmaestro.prompts.types import (
     PromptMetadata,
@@ -33,7 +37,9 @@ from llmaestro.llm.enums import MediaType
 from llmaestro.prompts.memory import MemoryPrompt
 from llmaestro.core.attachments import FileAttachment
 from llmaestro.llm.responses import ResponseFormatType
-from llmaestro.llm.responses import ResponseFormat
+from llmaestro.llm.responses import ResponseFormat, StructuredOutputConfig
+from llmaestro.llm.schema_utils import schema_registry
+from pydantic import BaseModel
 # Create a concrete test prompt class
 @pytest.fixture
 def test_prompt() -> BasePrompt:
@@ -439,3 +445,76 @@ async def test_file_handling(openai_interface: OpenAIInterface, mock_openai_resp
     assert file_message is not None
     assert file_message["file_ids"] == ["file-123"]
     assert file_message["content"] is None
+
+
+class ParsedPerson(BaseModel):
+    """Model used for direct parse tests."""
+    name: str
+
+
+@pytest.fixture
+def direct_parse_interface(openai_interface: OpenAIInterface, mock_openai_response: ChatCompletion) -> OpenAIInterface:
+    """Interface whose model supports direct parsing but whose parse endpoint rejects the schema."""
+    parse_failure_cache.clear()
+    openai_interface.state.profile.capabilities.supports_direct_pydantic_parse = True
+    openai_interface.client.beta.chat.completions.parse = AsyncMock(side_effect=ValueError("unsupported schema"))
+    openai_interface.client.chat.completions.create.return_value = mock_openai_response
+    yield openai_interface
+    parse_failure_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_failed_direct_parse_is_remembered(direct_parse_interface: OpenAIInterface):
+    """After a failed parse attempt, later requests go straight to the JSON object path."""
+    config = StructuredOutputConfig(format=ResponseFormatType.JSON_SCHEMA, pydantic_model=ParsedPerson)
+
+    for _ in range(3):
+        await direct_parse_interface._create_chat_completion(
+            messages=[{"role": "user", "content": "hi"}],
+            model="gpt-4",
+            temperature=0.0,
+            max_tokens=10,
+            response_format=config,
+        )
+
+    assert direct_parse_interface.client.beta.chat.completions.parse.await_count == 1
+    assert direct_parse_interface.client.chat.completions.create.await_count == 3
+    assert parse_failure_cache.get("gpt-4", schema_registry.get(ParsedPerson).schema_hash) is not None
+
+
+@pytest.mark.asyncio
+async def test_transient_parse_errors_are_not_remembered(direct_parse_interface: OpenAIInterface):
+    """Connection problems do not mark a schema as unparseable."""
+    import httpx
+    from openai import APIConnectionError
+
+    direct_parse_interface.client.beta.chat.completions.parse.side_effect = APIConnectionError(
+        request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    )
+    config = StructuredOutputConfig(format=ResponseFormatType.JSON_SCHEMA, pydantic_model=ParsedPerson)
+
+    for _ in range(2):
+        await direct_parse_interface._create_chat_completion(
+            messages=[{"role": "user", "content": "hi"}],
+            model="gpt-4",
+            temperature=0.0,
+            max_tokens=10,
+            response_format=config,
+        )
+
+    assert direct_parse_interface.client.beta.chat.completions.parse.await_count == 2
+    assert len(parse_failure_cache) == 0
+
+
+def test_parse_failure_cache_expires_and_is_bounded():
+    """Entries expire after the TTL and the oldest are evicted past the size bound."""
+    cache = ParseFailureCache(ttl=0.0, max_entries=2)
+    cache.record("gpt-4", "hash", "failed")
+    assert cache.get("gpt-4", "hash") is None
+
+    cache = ParseFailureCache(ttl=60.0, max_entries=2)
+    for schema_hash in ("a", "b", "c"):
+        cache.record("gpt-4", schema_hash, "failed")
+    assert len(cache) == 2
+    assert cache.get("gpt-4", "a") is None
+    assert cache.get("gpt-4", "c") == "failed"
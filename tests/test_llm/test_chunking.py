@@ -0,0 +1,113 @@
+"""Tests for token-bounded document chunking."""
+from typing import List
+
+import pytest
+
+from llmaestro.llm import chunking
+from llmaestro.llm.chunking import DEFAULT_SEPARATORS, TextChunker, read_text_blocks
+from llmaestro.llm.interfaces.tokenizers import BaseTokenizer
+
+
+class WordTokenizer(BaseTokenizer):
+    """One token per whitespace-separated word, counting calls to spot accidental re-tokenization."""
+
+    def __init__(self):
+        super().__init__("words")
+        self.calls = 0
+
+    def count_tokens(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+    def encode(self, text: str) -> List[int]:
+        return list(range(self.count_tokens(text)))
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+
+def paragraphs(count: int, words: int = 8) -> str:
+    return "\n\n".join(" ".join(f"p{p}w{w}" for w in range(words)) for p in range(count))
+
+
+def test_chunks_respect_limit_and_paragraphs():
+    text = paragraphs(10)
+    chunker = TextChunker(WordTokenizer(), max_tokens=20)
+
+    chunks = list(chunker.split(text))
+
+    assert len(chunks) == 5
+    assert all(chunk.token_count <= 20 for chunk in chunks)
+    # Paragraphs of 8 words are never cut, and the chunks rebuild the text exactly
+    assert all(chunk.text.rstrip().endswith("w7") for chunk in chunks)
+    assert "".join(chunk.text for chunk in chunks) == text
+    assert [chunk.start for chunk in chunks] == [text.index(chunk.text) for chunk in chunks]
+
+
+def test_oversized_paragraph_falls_back_to_sentences_then_words():
+    sentence = "one two three four five six."
+    text = " ".join([sentence] * 4) + "\n\n" + "x " * 25
+    chunker = TextChunker(WordTokenizer(), max_tokens=12)
+
+    chunks = list(chunker.split(text))
+
+    assert all(chunk.token_count <= 12 for chunk in chunks)
+    assert chunks[0].text == f"{sentence} {sentence} "
+    assert "".join(chunk.text for chunk in chunks) == text
+
+
+def test_overlap_repeats_trailing_pieces():
+    chunker = TextChunker(WordTokenizer(), max_tokens=16, overlap_tokens=8)
+
+    chunks = list(chunker.split(paragraphs(4)))
+
+    assert [chunk.token_count for chunk in chunks] == [16, 16, 16]
+    for previous, chunk in zip(chunks, chunks[1:]):
+        shared = previous.text.split("\n\n")[-1]
+        assert chunk.text.startswith(shared)
+        assert chunk.start < previous.end
+
+
+def test_stream_matches_whole_text_for_any_block_size(tmp_path):
+    text = paragraphs(30, words=5)
+    expected = [chunk.text for chunk in TextChunker(WordTokenizer(), max_tokens=12).split(text)]
+    path = tmp_path / "doc.txt"
+    path.write_text(text)
+
+    for block_size in (1, 7, 64, 10_000):
+        chunker = TextChunker(WordTokenizer(), max_tokens=12)
+        assert [chunk.text for chunk in chunker.split_stream(read_text_blocks(path, block_size))] == expected
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        TextChunker(WordTokenizer(), max_tokens=0)
+    with pytest.raises(ValueError):
+        TextChunker(WordTokenizer(), max_tokens=10, overlap_tokens=10)
+
+
+def test_separator_free_text_is_cut_at_the_pending_limit(monkeypatch):
+    """Runs without any boundary (CJK, minified JSON, base64) are cut in limit-sized segments, not per character."""
+    monkeypatch.setattr(chunking, "_MAX_PENDING_CHARS", 1000)
+    blocks = ["x" * 1500] * 3
+
+    segments = list(chunking._segments(blocks, "\n\n", DEFAULT_SEPARATORS[1:]))
+
+    assert [len(segment) for segment in segments] == [1000] * 4 + [500]
+
+
+def test_separator_free_megabytes_are_hard_split_quickly():
+    class CharTokenizer(WordTokenizer):
+        def count_tokens(self, text: str) -> int:
+            self.calls += 1
+            return -(-len(text) // 3)
+
+    tokenizer = CharTokenizer()
+    blocks = ["x" * (1 << 20)] * 3
+
+    chunks = list(TextChunker(tokenizer, max_tokens=2000).split_stream(blocks))
+
+    assert all(chunk.token_count <= 2000 for chunk in chunks)
+    assert sum(len(chunk.text) for chunk in chunks) == 3 << 20
+    assert tokenizer.calls < 100 * len(chunks)
@@ -0,0 +1,28 @@
+"""Tests for tolerant JSON repair."""
+import pytest
+
+from llmaestro.llm.json_repair import repair_json
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('{"a": 1}', {"a": 1}),
+        ('```json\n{"a": 1}\n```', {"a": 1}),
+        ('Here is the result: {"a": [1, 2,],}', {"a": [1, 2]}),
+        ("{'a': 'it\\'s', 'b': True, 'c': None}", {"a": "it's", "b": True, "c": None}),
+        ('{"a": {"b": [1, 2', {"a": {"b": [1, 2]}}),
+        ('{"a": "unterminated', {"a": "unterminated"}),
+        ('{"a": ', {"a": None}),
+        ('{"a": 1} and some closing remarks {}', {"a": 1}),
+    ],
+)
+def test_repair_json(text, expected):
+    """Common LLM formatting defects are repaired."""
+    assert repair_json(text) == expected
+
+
+def test_unrecoverable_text_raises():
+    """Text without any JSON value cannot be repaired."""
+    with pytest.raises(ValueError):
+        repair_json("I could not produce an answer.")
@@ -0,0 +1,71 @@
+"""Tests for the cached schema registry used by structured output."""
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from llmaestro.llm.responses import ResponseFormat, ResponseFormatType, StructuredOutputConfig
+from llmaestro.llm.schema_utils import SchemaRegistry, hash_schema, schema_registry
+
+
+class Person(BaseModel):
+    """Person model for schema tests."""
+
+    name: str
+    age: int
+    hobbies: List[str] = []
+
+
+def test_model_entries_are_cached():
+    """Schema, text and validator are built once per model."""
+    registry = SchemaRegistry()
+
+    entry = registry.get(Person)
+
+    assert registry.get(Person) is entry
+    assert entry.schema == Person.model_json_schema()
+    assert entry.text is entry.text
+    assert entry.validator is entry.validator
+    assert len(registry) == 1
+
+
+def test_dict_schemas_are_keyed_by_hash():
+    """Equal schema dicts share an entry regardless of key order."""
+    registry = SchemaRegistry()
+    schema = {"type": "object", "properties": {"a": {"type": "integer"}}, "required": ["a"]}
+    reordered = {"required": ["a"], "properties": {"a": {"type": "integer"}}, "type": "object"}
+
+    assert registry.get(schema) is registry.get(reordered)
+    assert registry.get(schema).schema_hash == hash_schema(reordered)
+
+
+def test_registry_evicts_least_recently_used():
+    """The registry stays within its size bound."""
+    registry = SchemaRegistry(max_entries=2)
+    for i in range(3):
+        registry.get({"type": "object", "title": f"schema-{i}"})
+
+    assert len(registry) == 2
+
+
+def test_entry_validate_raises_value_error():
+    """Validation failures surface as ValueError."""
+    entry = schema_registry.get(Person)
+
+    entry.validate({"name": "Ada", "age": 36})
+    with pytest.raises(ValueError, match="Schema validation failed"):
+        entry.validate({"name": "Ada"})
+
+
+def test_structured_output_uses_registry():
+    """StructuredOutputConfig and ResponseFormat share cached schemas."""
+    config = StructuredOutputConfig(format=ResponseFormatType.JSON_SCHEMA, pydantic_model=Person)
+    response_format = ResponseFormat.from_pydantic_model(Person)
+
+    assert config.effective_schema is config.effective_schema
+    assert config.schema_entry is response_format.schema_entry
+
+    assert response_format.validate_response('{"name": "Ada", "age": 36}').is_valid
+    invalid = response_format.validate_response('{"name": "Ada"}')
+    assert not invalid.is_valid
+    assert invalid.errors
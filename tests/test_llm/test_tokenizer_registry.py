@@ -0,0 +1,120 @@
+"""Tests for the process-wide tokenizer registry."""
+import threading
+import time
+from typing import List
+
+import pytest
+
+from llmaestro.llm.interfaces import tokenizers
+from llmaestro.llm.interfaces.tokenizers import (
+    AnthropicTokenizer,
+    SimpleWordTokenizer,
+    TiktokenTokenizer,
+    TokenCounter,
+    TokenizerRegistry,
+    encoding_name_for_model,
+)
+
+
+class FakeEncoding:
+    """Stand-in for a tiktoken encoding: one token per word."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def encode(self, text: str, disallowed_special=()) -> List[int]:
+        return list(range(len(text.split())))
+
+
+@pytest.fixture
+def loads(monkeypatch) -> List[str]:
+    """Replace tiktoken's (network-backed) encoding loader, recording each load."""
+    loaded: List[str] = []
+
+    def get_encoding(name: str) -> FakeEncoding:
+        loaded.append(name)
+        time.sleep(0.01)
+        return FakeEncoding(name)
+
+    monkeypatch.setattr(tokenizers.tiktoken, "get_encoding", get_encoding)
+    return loaded
+
+
+@pytest.mark.parametrize(
+    "model_name,encoding",
+    [
+        ("gpt-4o-mini-2024-07-18", "o200k_base"),
+        ("chatgpt-4o-latest", "o200k_base"),
+        ("o1-mini", "o200k_base"),
+        ("o3-mini-2025-01-31", "o200k_base"),
+        ("gpt-4-turbo", "cl100k_base"),
+        ("gpt-3.5-turbo-0125", "cl100k_base"),
+        ("claude-3-opus", None),
+    ],
+)
+def test_encoding_for_model(model_name, encoding):
+    assert encoding_name_for_model(model_name) == encoding
+
+
+def test_encoding_loaded_once_across_threads(loads):
+    registry = TokenizerRegistry()
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(registry.get_encoding("o200k_base"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loads == ["o200k_base"]
+    assert len({id(result) for result in results}) == 1
+
+
+def test_tokenizers_are_shared_per_model(loads, monkeypatch):
+    registry = TokenizerRegistry()
+    monkeypatch.setattr(tokenizers, "tokenizer_registry", registry)
+
+    gpt4o = registry.get("gpt-4o", "openai")
+    mini = registry.get("gpt-4o-mini")  # family inferred from the model name
+
+    assert isinstance(gpt4o, TiktokenTokenizer) and gpt4o.encoding_name == "o200k_base"
+    assert registry.get("gpt-4o", "openai") is gpt4o
+    assert mini.encoding is gpt4o.encoding
+    assert loads == ["o200k_base"]
+    assert gpt4o.count_messages([{"role": "user", "content": "three word message"}]) == 3 + 4
+    assert isinstance(registry.get("claude-3-5-sonnet", "claude"), AnthropicTokenizer)
+    assert isinstance(registry.get("gemini-1.5-pro", "gemini"), SimpleWordTokenizer)
+
+
+def test_falls_back_when_encoding_cannot_load(monkeypatch):
+    registry = TokenizerRegistry()
+    monkeypatch.setattr(tokenizers, "tokenizer_registry", registry)
+
+    def offline(name: str):
+        raise ConnectionError("no network")
+
+    monkeypatch.setattr(tokenizers.tiktoken, "get_encoding", offline)
+
+    tokenizer = registry.get("gpt-4", "openai")
+    assert isinstance(tokenizer, SimpleWordTokenizer)
+    assert registry.get("gpt-4", "openai") is tokenizer
+
+
+def test_token_counter_includes_images():
+    counter = TokenCounter(SimpleWordTokenizer("test"))
+    messages = [{"role": "user", "content": "Describe this image please"}]
+
+    estimate = counter.estimate_messages_with_images(
+        messages, [{"width": 1000, "height": 1000}], model_family="claude", model_name="claude-3-opus"
+    )
+
+    assert estimate["image_tokens"] == 1334  # 1000 * 1000 / 750 pixels per token
+    assert estimate["total_tokens"] == estimate["prompt_tokens"] == estimate["text_tokens"] + 1334
+    gemini = counter.estimate_messages_with_images(
+        messages, [{"width": 300, "height": 200}], model_family="gemini", model_name="gemini-1.5-pro"
+    )
+    assert gemini["image_tokens"] == 258
+    openai = counter.estimate_messages_with_images(
+        messages, [{"width": 1024, "height": 1024}], model_family="openai", model_name="gpt-4o"
+    )
+    assert openai["image_tokens"] == 85 + 170 * 4
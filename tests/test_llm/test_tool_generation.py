@@ -1,5 +1,7 @@
 """Tests for tool parameter generation functionality."""
+import gc
 import inspect
+import weakref
 from typing import List, Optional, Callable, Any
 from pydantic import BaseModel, Field
 import os
@@ -8,7 +10,19 @@ import json
 
 from llmaestro.llm.interfaces.base import ToolParams
 from llmaestro.prompts.base import BasePrompt, PromptVariable, SerializableType
-from llmaestro.prompts.tools import ToolParams, FunctionGuard, BasicFunctionGuard
+from llmaestro.prompts import tools as tools_module
+from llmaestro.prompts.tools import (
+    ToolParams,
+    FunctionGuard,
+    BasicFunctionGuard,
+    ExecutionMode,
+    ToolExecutionPolicy,
+    clear_tool_params_cache,
+    get_tool_executor,
+    get_tool_params,
+    shutdown_tool_executors,
+)
+from llmaestro.prompts.tool_cache import ToolCachePolicy, cacheable, tool_result_cache
 from llmaestro.llm.llm_registry import LLMRegistry
 from llmaestro.core.models import LLMResponse
 from llmaestro.prompts.memory import MemoryPrompt
@@ -92,6 +106,22 @@ def test_basic_function_guard(sample_sync_function):
         guard(invalid_arg="test")
 
 
+def test_guard_builds_model_once_per_call():
+    """The instance built while validating a model's arguments is the one returned."""
+    built = []
+
+    class Counted(BaseModel):
+        name: str
+
+        def __init__(self, **data: Any):
+            super().__init__(**data)
+            built.append(self)
+
+    result = BasicFunctionGuard(Counted)(name="x")
+
+    assert built == [result]
+
+
 def test_custom_function_guard(risky_file_function, tmp_path):
     """Test custom FunctionGuard implementation with file system safety checks."""
     # Create a test file
@@ -417,3 +447,290 @@ async def test_tool_call_response_handling(test_settings, llm_registry: LLMRegis
     # Execute tool
     result = await tool.execute(**tool_args)
     assert result == 24
+
+
+# Test Cases for tool execution policies
+def test_pydantic_guard_constructs_model_once(sample_pydantic_model):
+    """Calling a guarded Pydantic model validates and constructs it only once."""
+    constructed = []
+
+    class CountingModel(sample_pydantic_model):
+        def __init__(self, **data):
+            constructed.append(data)
+            super().__init__(**data)
+
+    result = BasicFunctionGuard(CountingModel)(name="test")
+
+    assert isinstance(result, CountingModel)
+    assert len(constructed) == 1
+
+
+@pytest.mark.asyncio
+async def test_thread_mode_keeps_event_loop_responsive():
+    """Blocking tools in thread mode do not stall other coroutines."""
+    import asyncio
+    import time
+
+    def blocking_tool(seconds: float) -> str:
+        time.sleep(seconds)
+        return "done"
+
+    tool = ToolParams.from_function(blocking_tool, ToolExecutionPolicy(mode=ExecutionMode.THREAD))
+    ticks = []
+
+    async def ticker():
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    result, _ = await asyncio.gather(tool.execute(seconds=0.2), ticker())
+
+    assert result == "done"
+    assert ticks[-1] - ticks[0] < 0.15
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_and_timeout():
+    """Per-tool concurrency limits serialize executions and timeouts raise TimeoutError."""
+    import asyncio
+
+    running = {"now": 0, "peak": 0}
+
+    async def slow_tool(seconds: float) -> float:
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        try:
+            await asyncio.sleep(seconds)
+            return seconds
+        finally:
+            running["now"] -= 1
+
+    tool = ToolParams.from_function(slow_tool, ToolExecutionPolicy(max_concurrency=2, timeout=0.1))
+
+    await asyncio.gather(*(tool.execute(seconds=0.01) for _ in range(5)))
+    assert running["peak"] == 2
+
+    with pytest.raises(TimeoutError):
+        await tool.execute(seconds=1.0)
+
+
+def test_concurrency_limit_is_per_event_loop():
+    """A shared tool keeps working when used from a second event loop."""
+    import asyncio
+
+    async def slow_tool(seconds: float) -> float:
+        await asyncio.sleep(seconds)
+        return seconds
+
+    tool = ToolParams.from_function(slow_tool, ToolExecutionPolicy(max_concurrency=1))
+
+    async def burst():
+        return await asyncio.gather(*(tool.execute(seconds=0.001) for _ in range(3)))
+
+    # Contended waits bind a semaphore to its loop; each asyncio.run gets its own
+    assert asyncio.run(burst()) == [0.001] * 3
+    assert asyncio.run(burst()) == [0.001] * 3
+
+
+def test_default_process_pool_shutdown():
+    """The process pool created for process-mode tools can be shut down and is recreated on demand."""
+    first = get_tool_executor(ExecutionMode.PROCESS)
+    shutdown_tool_executors()
+
+    second = get_tool_executor(ExecutionMode.PROCESS)
+    assert second is not first
+    assert second.submit(abs, -3).result() == 3
+    shutdown_tool_executors()
+
+
+@pytest.mark.asyncio
+async def test_process_mode_runs_picklable_function():
+    """Process mode validates locally and runs module-level functions in a worker process."""
+    tool = ToolParams.from_function(json.dumps, ToolExecutionPolicy(mode=ExecutionMode.PROCESS))
+
+    assert await tool.execute(obj=[1, 2]) == "[1, 2]"
+    with pytest.raises(TypeError):
+        await tool.execute(not_a_param=1)
+
+
+# Test Cases for tool result caching
+@pytest.fixture
+def clean_tool_cache():
+    """Reset the process-wide tool result cache around a test."""
+    tool_result_cache.reset()
+    yield tool_result_cache
+    tool_result_cache.reset()
+
+
+@pytest.mark.asyncio
+async def test_cacheable_tool_reuses_results(clean_tool_cache):
+    """Equivalent calls to a cacheable tool execute it once and record hits."""
+    calls = []
+
+    @cacheable(ttl=60)
+    def lookup(city: str, units: str = "metric") -> str:
+        calls.append(city)
+        return f"{city}:{units}"
+
+    tool = ToolParams.from_function(lookup)
+    other_interface_tool = ToolParams.from_function(lookup)
+
+    assert await tool.execute(city="Paris", units="metric") == "Paris:metric"
+    assert await other_interface_tool.execute(units="metric", city="Paris") == "Paris:metric"
+    await tool.execute(city="Rome")
+
+    assert calls == ["Paris", "Rome"]
+    stats = clean_tool_cache.stats(tool.cache_key)
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+@pytest.mark.asyncio
+async def test_tool_cache_ttl_and_max_entries(clean_tool_cache):
+    """Entries expire after their TTL and the oldest entries are evicted past max_entries."""
+    import asyncio
+
+    calls = []
+
+    def echo(value: int) -> int:
+        calls.append(value)
+        return value
+
+    tool = ToolParams.from_function(echo, cache_policy=ToolCachePolicy(ttl=0.05, max_entries=2))
+
+    for value in (1, 2, 3, 1):
+        await tool.execute(value=value)
+    assert calls == [1, 2, 3, 1]
+    assert clean_tool_cache.stats(tool.cache_key).evictions == 2
+
+    await asyncio.sleep(0.06)
+    await tool.execute(value=3)
+    assert calls[-1] == 3
+    assert clean_tool_cache.stats(tool.cache_key).expirations == 1
+
+
+@pytest.mark.asyncio
+async def test_bound_method_results_are_cached_per_instance(clean_tool_cache):
+    """Instances never see each other's cached results, and a collected instance's entries are dropped."""
+
+    class Store:
+        def __init__(self, prefix: str):
+            self.prefix = prefix
+
+        @cacheable(ttl=60)
+        def read(self, key: str) -> str:
+            return f"{self.prefix}:{key}"
+
+    a, b = Store("A"), Store("B")
+    tool_a, tool_b = get_tool_params(a.read), get_tool_params(b.read)
+
+    assert await tool_a.execute(key="x") == "A:x"
+    assert await tool_b.execute(key="x") == "B:x"
+    assert await tool_b.execute(key="x") == "B:x"
+    assert tool_a.cache_key != tool_b.cache_key
+    assert clean_tool_cache.stats(tool_b.cache_key).hits == 1
+
+    key_a = tool_a.cache_key
+    del a, tool_a
+    gc.collect()
+    get_tool_params(b.read).cache_key  # pending removals are applied on the next key lookup
+    assert key_a not in clean_tool_cache.snapshot()
+
+
+@pytest.mark.asyncio
+async def test_failed_tool_results_are_not_cached(clean_tool_cache):
+    """Exceptions are never cached."""
+    calls = []
+
+    @cacheable()
+    def flaky(value: int) -> int:
+        calls.append(value)
+        raise RuntimeError("boom")
+
+    tool = ToolParams.from_function(flaky)
+    for _ in range(2):
+        with pytest.raises(TypeError):
+            await tool.execute(value=1)
+    assert len(calls) == 2
+
+
+# Test Cases for ToolParams and provider payload caching
+def test_get_tool_params_is_cached(sample_sync_function, sample_pydantic_model):
+    """Functions and models are converted once and the same ToolParams is reused."""
+    clear_tool_params_cache()
+
+    assert get_tool_params(sample_sync_function) is get_tool_params(sample_sync_function)
+    assert get_tool_params(sample_pydantic_model) is get_tool_params(sample_pydantic_model)
+    assert get_tool_params(sample_sync_function).name == "test_function"
+
+    with pytest.raises(ValueError):
+        get_tool_params("not a tool")
+
+
+def test_get_tool_params_does_not_retain_instances_or_closures():
+    """Bound methods share their function's entry without keeping the instance alive."""
+    clear_tool_params_cache()
+
+    class Calculator:
+        def __init__(self, offset: int):
+            self.offset = offset
+
+        def add(self, value: int) -> int:
+            """Add the offset to a value."""
+            return value + self.offset
+
+    first, second = Calculator(1), Calculator(2)
+    first_params = get_tool_params(first.add)
+    second_params = get_tool_params(second.add)
+    assert first_params.parameters == second_params.parameters
+    assert list(first_params.parameters["properties"]) == ["value"]
+    assert first_params.source(value=1) == 2
+    assert second_params.source(value=1) == 3
+
+    instance = weakref.ref(first)
+    del first, first_params
+    gc.collect()
+    assert instance() is None
+
+    def make_tool(offset: int):
+        def shifted(value: int) -> int:
+            return value + offset
+
+        return shifted
+
+    assert get_tool_params(make_tool(1)).name == "shifted"
+    assert get_tool_params(lambda value: value).name == "<lambda>"
+    with tools_module._tool_params_lock:
+        assert len(tools_module._tool_params_cache) == 1
+
+
+def test_get_tool_params_builds_unhashable_callables_uncached():
+    class Unhashable:
+        __hash__ = None
+
+        def __init__(self):
+            self.__name__ = "identity"
+
+        def __call__(self, value: int) -> int:
+            return value
+
+    tool = Unhashable()
+    assert get_tool_params(tool).source(value=4) == 4
+
+
+def test_provider_payload_cached_until_tool_changes(sample_sync_function):
+    """Formatted payloads are built once per provider and rebuilt after a field changes."""
+    tool = ToolParams.from_function(sample_sync_function)
+    builds = []
+
+    def build(t):
+        builds.append(t.name)
+        return {"name": t.name}
+
+    first = tool.get_provider_payload("test", build)
+    assert tool.get_provider_payload("test", build) is first
+    assert builds == ["test_function"]
+
+    tool.name = "renamed"
+    assert tool.get_provider_payload("test", build) == {"name": "renamed"}
+    assert len(builds) == 2